@@ -0,0 +1,27 @@
+"""
+Memoized date normalization shared by the crawler scripts.
+
+Publication timestamps repeat heavily within a crawl (the same meta formats,
+often the same minute), so parsing goes through an LRU cache. ISO-8601 values
+such as article:published_time take the C-level datetime.fromisoformat path
+and only other formats fall through to dateutil.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from dateutil import parser as dateparser
+
+
+@lru_cache(maxsize=8192)
+def iso_date(s: str) -> Optional[str]:
+    """Return `s` as a YYYY-MM-DD string, or None if it cannot be parsed."""
+    try:
+        return datetime.fromisoformat(s).date().isoformat()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return dateparser.parse(s).date().isoformat()
+    except Exception:
+        return None
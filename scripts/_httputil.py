@@ -0,0 +1,26 @@
+"""
+HTTP session helper shared by the crawler scripts.
+"""
+
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(headers: Dict[str, str]) -> requests.Session:
+    """
+    Build a requests.Session that sends `headers` on every request.
+
+    The session keeps a keep-alive connection pool (32 connections per host)
+    and retries failed requests up to 3 times with backoff, so a module-level
+    session lets fetch() reuse connections across calls.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
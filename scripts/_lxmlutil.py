@@ -0,0 +1,92 @@
+"""
+lxml helpers for the crawler scripts' primary selector path.
+
+Metadata and body selectors run as XPath expressions compiled at import time
+on a plain lxml.html tree, which skips BeautifulSoup's per-node Python
+wrapping. Most _clean_html fallbacks still use BeautifulSoup.
+"""
+
+from typing import Collection, Iterator, List, Optional, Pattern, Union
+
+import lxml.html
+from bs4 import UnicodeDammit
+from bs4.dammit import EncodingDetector
+from lxml.html import HtmlElement
+
+# Text inside these elements is skipped, as in bs4's get_text()
+_NON_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+
+def has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return "contains(concat(' ', normalize-space(@class), ' '), ' %s ')" % name
+
+
+def decode_html(html: Union[str, bytes]) -> str:
+    """
+    Decode a response body: declared charset, then UTF-8, then bs4's sniffing.
+
+    UnicodeDammit's charset sniffing costs more than the whole lxml parse, so
+    it only runs for bodies that are neither declared nor valid UTF-8.
+    """
+    if isinstance(html, str):
+        return html
+    declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+    for encoding in (declared, "utf-8"):
+        if encoding:
+            try:
+                return html.decode(encoding)
+            except (LookupError, UnicodeDecodeError):
+                pass
+    return UnicodeDammit(html, is_html=True).unicode_markup
+
+
+def parse_html(html: Union[str, bytes]) -> HtmlElement:
+    return lxml.html.document_fromstring(decode_html(html))
+
+
+def first(result: List) -> Optional[HtmlElement]:
+    """First node of an XPath result, or None."""
+    return result[0] if result else None
+
+
+def _strings(el: HtmlElement) -> Iterator[str]:
+    if isinstance(el.tag, str) and el.tag not in _NON_TEXT_TAGS and el.text:
+        yield el.text
+    for child in el:
+        yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def text_of(el: HtmlElement, sep: str = "", strip: bool = True) -> str:
+    """Equivalent of bs4's Tag.get_text(sep, strip=strip)."""
+    if not strip:
+        return sep.join(_strings(el))
+    return sep.join(s for s in (t.strip() for t in _strings(el)) if s)
+
+
+def _class_matches(pattern: Optional[Pattern], cls: Optional[str]) -> bool:
+    return bool(pattern and cls and any(pattern.search(c) for c in cls.split()))
+
+
+def drop_junk(el: HtmlElement, tag_names: Collection[str] = (),
+              cls_re: Optional[Pattern] = None, id_re: Optional[Pattern] = None,
+              div_cls_re: Optional[Pattern] = None) -> None:
+    """
+    lxml counterpart of _souputil.strip_junk: drop every junk descendant of
+    `el` in one walk. Tail text of dropped elements is kept, as with
+    bs4's decompose().
+    """
+    stack = [c for c in el if isinstance(c.tag, str)]
+    while stack:
+        node = stack.pop()
+        cls = node.get("class")
+        node_id = node.get("id")
+        if (node.tag in tag_names
+                or _class_matches(cls_re, cls)
+                or (id_re is not None and node_id and id_re.search(node_id))
+                or (node.tag == "div" and _class_matches(div_cls_re, cls))):
+            node.drop_tree()
+            continue
+        stack.extend(c for c in node if isinstance(c.tag, str))
@@ -0,0 +1,43 @@
+"""
+Shared BeautifulSoup cleanup used by the per-site crawler scripts.
+"""
+
+from typing import Collection, Optional, Pattern
+
+from bs4 import Tag
+
+JUNK_TAGS = frozenset(
+    ["script", "style", "noscript", "iframe", "aside", "footer", "header"])
+
+
+def _matches(pattern: Optional[Pattern], value) -> bool:
+    if pattern is None or not value:
+        return False
+    if isinstance(value, str):
+        return pattern.search(value) is not None
+    # multi-valued attribute (class): any single value may match
+    return any(pattern.search(v) for v in value)
+
+
+def strip_junk(node: Tag, tag_names: Collection[str] = (),
+               cls_re: Optional[Pattern] = None, id_re: Optional[Pattern] = None,
+               div_cls_re: Optional[Pattern] = None) -> None:
+    """
+    Decompose every descendant of `node` that is junk, in a single tree walk.
+
+    A descendant is junk if its tag name is in `tag_names`, its class matches
+    `cls_re`, its id matches `id_re`, or it is a <div> whose class matches
+    `div_cls_re`. Removed subtrees are not descended into. The result is the
+    same as running one find_all()/decompose() pass per rule.
+    """
+    stack = [c for c in node.contents if isinstance(c, Tag)]
+    while stack:
+        tag = stack.pop()
+        cls = tag.get("class")
+        if (tag.name in tag_names
+                or _matches(cls_re, cls)
+                or _matches(id_re, tag.get("id"))
+                or (tag.name == "div" and _matches(div_cls_re, cls))):
+            tag.decompose()
+            continue
+        stack.extend(c for c in tag.contents if isinstance(c, Tag))
@@ -0,0 +1,41 @@
+"""
+URL helpers shared by the crawler scripts.
+"""
+
+import mmap
+import os
+from functools import lru_cache
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+
+@lru_cache(maxsize=1024)
+def netloc(url: str) -> str:
+    """Memoized urlparse(url).netloc."""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=1024)
+def hostname(url: str) -> Optional[str]:
+    """Memoized urlparse(url).hostname (lowercased, without port)."""
+    return urlparse(url).hostname
+
+
+def iter_urls(path: str) -> Iterator[str]:
+    """
+    Yield the URLs listed in `path`, one per line.
+
+    Blank lines and lines starting with '#' are skipped. The file is read
+    through mmap and split as bytes, so large URL lists skip the text-mode
+    per-line decoding. Only the URLs that are kept get decoded.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[:]
+    for raw in data.splitlines():
+        raw = raw.strip()
+        if not raw or raw.startswith(b"#"):
+            continue
+        yield raw.decode("utf-8")
@@ -2,9 +2,9 @@ import argparse, json
 import pandas as pd
 import orjson
 from jsonschema import validate, ValidationError
-from urllib.parse import urlparse
 
 from config import ensure_dir
+from _urlutil import netloc
 
 from pathlib import Path
 
@@ -39,7 +39,7 @@ def main(inp: str, out: str):
                 if "error" in rec:
                     continue
                 # 기본 정리
-                rec["domain"] = urlparse(rec.get("url", "")).netloc
+                rec["domain"] = netloc(rec.get("url", ""))
                 # 신뢰도 점수 매핑
                 rec["credibility_score"] = credibility_for(rec["domain"], cred_df)
                 # 언어 간단 감지(ko/other)
@@ -51,7 +51,7 @@ def main(inp: str, out: str):
                 rec["lang"] = lang
                 # 스키마 검증
                 validate(instance=rec, schema=schema)
-                out_f.write(orjson.dumps(rec) + b"\n")
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
             except ValidationError as ve:
                 continue
             except Exception as e:
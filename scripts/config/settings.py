@@ -92,6 +92,11 @@ class DatabaseSettings(BaseSettings):
     path: str = Field('data/analytics.db', validation_alias='DATABASE_PATH', description='SQLite database path')
     echo: bool = Field(False, validation_alias='DATABASE_ECHO', description='Echo SQL queries')
     pool_size: int = Field(5, validation_alias='DATABASE_POOL_SIZE')
+    analysis_memo_ttl: int = Field(
+        7 * 24 * 3600,
+        validation_alias='ANALYSIS_MEMO_TTL',
+        description='Max age in seconds of a stored analysis reused for the same article text'
+    )
 
     model_config = SettingsConfigDict(env_prefix='database_', case_sensitive=False)
 
@@ -122,12 +122,18 @@ class ConsensusAnalyzer:
                 'error': str(e)
             }
 
-    def analyze_article(self, article_text: str) -> Dict[str, Any]:
+    def analyze_article(self, article_text: str, early_exit: bool = False) -> Dict[str, Any]:
         """
         Analyze article with all providers in parallel and calculate consensus
 
+        Results are tallied as each provider returns. With ``early_exit``
+        enabled, the analysis stops once two providers have succeeded and the
+        remaining in-flight providers are reported in ``cancelled_providers``
+        (not ``failed_providers``).
+
         Args:
             article_text: Article body text to analyze
+            early_exit: Return as soon as two providers have succeeded
 
         Returns:
             Dict containing consensus results with structure:
@@ -135,6 +141,8 @@ class ConsensusAnalyzer:
                 'success': True,
                 'total_providers': 2,
                 'successful_providers': ['gemini', 'openai'],
+                'failed_providers': [],
+                'cancelled_providers': [],
                 'sentences': [
                     {
                         'text': 'sentence text',
@@ -149,7 +157,7 @@ class ConsensusAnalyzer:
                 ]
             }
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             logger.warning("Empty article text provided")
             return {
                 'success': False,
@@ -161,31 +169,79 @@ class ConsensusAnalyzer:
         logger.info(f"Starting parallel analysis with {len(self.llm_instances)} providers")
 
         results = []
-        with ThreadPoolExecutor(max_workers=len(self.llm_instances)) as executor:
+        running_map = self._new_sentence_map()
+        successful_count = 0
+
+        executor = ThreadPoolExecutor(max_workers=len(self.llm_instances))
+        try:
             futures = {
                 executor.submit(self._analyze_with_provider, name, article_text): name
                 for name in self.llm_instances.keys()
             }
+            pending = set(futures)
 
             for future in as_completed(futures):
+                pending.discard(future)
                 provider_name = futures[future]
                 try:
                     result = future.result()
-                    results.append(result)
                 except Exception as e:
                     logger.error(f"[{provider_name}] Thread execution error: {e}")
-                    results.append({
+                    result = {
                         'provider': provider_name,
                         'success': False,
                         'sentences': {},
                         'error': str(e)
-                    })
+                    }
+
+                results.append(result)
+                if result['success']:
+                    self._tally_result(running_map, result)
+                    successful_count += 1
+
+                if early_exit and successful_count == 2 and pending:
+                    for pending_future in pending:
+                        pending_future.cancel()
+                        cancelled_name = futures[pending_future]
+                        logger.info(f"[{cancelled_name}] Cancelled after early consensus")
+                        results.append({
+                            'provider': cancelled_name,
+                            'success': False,
+                            'sentences': {},
+                            'error': 'cancelled_early'
+                        })
+                    break
+        finally:
+            # Don't block on providers that are still running after an early exit
+            executor.shutdown(wait=not early_exit, cancel_futures=True)
 
         # Calculate consensus
-        consensus_data = self._calculate_consensus(results)
+        consensus_data = self._calculate_consensus(results, sentence_map=running_map)
 
         return consensus_data
 
+    def _new_sentence_map(self) -> Dict[str, Dict[str, Any]]:
+        """Create an empty sentence consensus map"""
+        return defaultdict(lambda: {
+            'selected_by': [],
+            'reasons': {}
+        })
+
+    def _tally_result(self, sentence_map: Dict[str, Dict[str, Any]], result: Dict[str, Any]):
+        """
+        Add a successful provider result to a sentence consensus map
+
+        Args:
+            sentence_map: Map of normalized sentence to selection data
+            result: Successful provider analysis result
+        """
+        provider = result['provider']
+
+        for sentence, reason in result['sentences'].items():
+            normalized = self._normalize_sentence(sentence)
+            sentence_map[normalized]['selected_by'].append(provider)
+            sentence_map[normalized]['reasons'][provider] = reason
+
     def _normalize_sentence(self, sentence: str) -> str:
         """
         Normalize sentence for exact matching
@@ -198,12 +254,18 @@ class ConsensusAnalyzer:
         """
         return sentence.strip()
 
-    def _calculate_consensus(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_consensus(
+        self,
+        results: List[Dict[str, Any]],
+        sentence_map: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Calculate consensus from multiple provider results
 
         Args:
             results: List of provider analysis results
+            sentence_map: Pre-tallied sentence map for the successful results
+                (built from ``results`` when omitted)
 
         Returns:
             Consensus data structure
@@ -219,19 +281,10 @@ class ConsensusAnalyzer:
             }
 
         # Build sentence consensus map
-        sentence_map = defaultdict(lambda: {
-            'selected_by': [],
-            'reasons': {}
-        })
-
-        for result in successful_results:
-            provider = result['provider']
-            sentences = result['sentences']
-
-            for sentence, reason in sentences.items():
-                normalized = self._normalize_sentence(sentence)
-                sentence_map[normalized]['selected_by'].append(provider)
-                sentence_map[normalized]['reasons'][provider] = reason
+        if sentence_map is None:
+            sentence_map = self._new_sentence_map()
+            for result in successful_results:
+                self._tally_result(sentence_map, result)
 
         # Convert to list with consensus scores
         consensus_sentences = []
@@ -273,7 +326,13 @@ class ConsensusAnalyzer:
             'success': True,
             'total_providers': len(self.llm_instances),
             'successful_providers': [r['provider'] for r in successful_results],
-            'failed_providers': [r['provider'] for r in results if not r['success']],
+            'failed_providers': [
+                r['provider'] for r in results
+                if not r['success'] and r.get('error') != 'cancelled_early'
+            ],
+            'cancelled_providers': [
+                r['provider'] for r in results if r.get('error') == 'cancelled_early'
+            ],
             'sentences': consensus_sentences,
             'count': len(consensus_sentences)
         }
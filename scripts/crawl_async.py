@@ -0,0 +1,98 @@
+"""
+Asynchronous fetch loop shared by the crawler scripts.
+
+URLs are fetched concurrently over a single aiohttp session. A semaphore caps
+the number of requests in flight and a per-host rate limiter keeps the same
+politeness delay the serial crawlers used between requests to one site.
+Parsing is CPU-bound, so it runs in a process pool and does not hold up the
+event loop that drives the fetches.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+import aiohttp
+
+from _urlutil import netloc
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DELAY = 0.5
+REQUEST_TIMEOUT = 30
+
+
+class DomainRateLimiter:
+    """Spaces requests to the same host at least `delay` seconds apart."""
+
+    def __init__(self, delay: float = DEFAULT_DELAY):
+        self.delay = delay
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, url: str):
+        host = netloc(url)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot.get(host, now) - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot[host] = max(now, self._next_slot.get(host, now)) + self.delay
+
+
+async def fetch_and_parse(session: aiohttp.ClientSession, url: str,
+                          sem: asyncio.Semaphore, parse_fn: Callable[[str, Any], dict],
+                          limiter: DomainRateLimiter, raw: bool = False,
+                          pool: Optional[Executor] = None) -> dict:
+    """
+    Fetch one URL and parse it; failures become {"url", "error"} records.
+
+    With `pool`, parse_fn runs in that executor (it must be picklable, i.e. a
+    module-level function); otherwise it runs inline on the event loop.
+    """
+    try:
+        async with sem:
+            await limiter.wait(url)
+            async with session.get(url) as r:
+                r.raise_for_status()
+                html = await (r.read() if raw else r.text())
+        if pool is None:
+            return parse_fn(url, html)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, parse_fn, url, html)
+    except Exception as e:
+        return {"url": url, "error": str(e)}
+
+
+async def crawl(urls: Iterable[str], parse_fn: Callable[[str, Any], dict],
+                headers: Dict[str, str], concurrency: int = DEFAULT_CONCURRENCY,
+                delay: float = DEFAULT_DELAY, raw: bool = False,
+                parse_workers: Optional[int] = None) -> AsyncIterator[dict]:
+    """
+    Fetch and parse `urls` concurrently, yielding one record per URL.
+
+    Records are yielded in input order, so the caller writes them from one
+    loop in the same order the serial crawlers did; a slow URL holds back the
+    records after it, not their fetches. With `raw`, parse_fn receives the
+    undecoded response bytes instead of text.
+    Parsing uses a pool of `parse_workers` processes (default: one per CPU);
+    pass 0 to parse on the event loop thread instead.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    limiter = DomainRateLimiter(delay)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    workers = os.cpu_count() if parse_workers is None else parse_workers
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            tasks = [
+                asyncio.create_task(
+                    fetch_and_parse(session, url, sem, parse_fn, limiter, raw, pool))
+                for url in urls
+            ]
+            for task in tasks:
+                yield await task
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
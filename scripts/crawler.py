@@ -2,18 +2,27 @@ import argparse
 import json
 import time
 import re
-from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 from readability import Document
-from dateutil import parser as dateparser
+from _dateutil_cache import iso_date
 from pathlib import Path
 import orjson
 
 from config import ensure_dir
+from _urlutil import iter_urls, netloc
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; W1-Starter/1.0)"}
 
+# 정규식은 모듈 로드 시 한 번만 컴파일
+_BODY_CANDIDATES = [
+    ("div", re.compile("article-body", re.I)),
+    ("article", re.compile("article", re.I)),
+    ("div", re.compile("content", re.I)),
+]
+_JUNK_RE = re.compile(r"ad|banner|recommend|related", re.I)
+_DATE_RE = re.compile(r"(20\d{2}[./-]\d{1,2}[./-]\d{1,2})")
+
 
 def extract_main_html(url: str):
     r = requests.get(url, headers=HEADERS, timeout=30)
@@ -28,14 +37,9 @@ def extract_main_html(url: str):
         soup = BeautifulSoup(html, "lxml")
         title = (soup.title.string or "").strip() if soup.title else ""
         # 신문사별 관용 클래스를 몇 개 커버
-        candidates = [
-            {"name": "article-body", "tag": "div"},
-            {"name": "article", "tag": "article"},
-            {"name": "content", "tag": "div"}
-        ]
         node = None
-        for c in candidates:
-            node = soup.find(c["tag"], class_=re.compile(c["name"], re.I))
+        for tag, cls_re in _BODY_CANDIDATES:
+            node = soup.find(tag, class_=cls_re)
             if node:
                 break
         content_html = str(node or soup.body or soup)
@@ -48,9 +52,8 @@ def html_to_text(content_html: str):
     for bad in soup(["script", "style", "noscript", "iframe", "header", "footer", "aside"]):
         bad.decompose()
     # 흔한 광고/추천 박스 클래스 제거
-    for cls in ["ad", "banner", "recommend", "related"]:
-        for d in soup.find_all(class_=re.compile(cls, re.I)):
-            d.decompose()
+    for d in soup.find_all(class_=_JUNK_RE):
+        d.decompose()
     text = "\n".join(t.strip()
                      for t in soup.get_text("\n").splitlines() if t.strip())
     return text
@@ -58,45 +61,39 @@ def html_to_text(content_html: str):
 
 def detect_date(html_text: str):
     # 단순 휴리스틱: ISO/국문 날짜 패턴 찾아 파싱
-    m = re.search(r"(20\d{2}[./-]\d{1,2}[./-]\d{1,2})", html_text)
+    m = _DATE_RE.search(html_text)
     if m:
-        try:
-            return dateparser.parse(m.group(1)).date().isoformat()
-        except Exception:
-            pass
+        return iso_date(m.group(1))
     return None
 
 
 def main(inp: str, out: str):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as f:
-        for line in f:
-            url = line.strip()
-            if not url or url.startswith("#"):
-                continue
-            try:
-                title, content_html = extract_main_html(url)
-                body_text = html_to_text(content_html)
-                domain = urlparse(url).netloc
-                date_guess = detect_date(
-                    content_html) or detect_date(body_text)
-                rec = {
-                    "source": domain,
-                    "url": url,
-                    "headline": title,
-                    "date": date_guess,
-                    "author": None,
-                    "section": None,
-                    "body_text": body_text,
-                    "domain": domain
-                }
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.8)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
+    # 1MB 버퍼: 레코드마다 write 시스템 콜이 나가지 않도록
+    out_f = open(out, "ab", buffering=1 << 20)
+    for url in iter_urls(inp):
+        try:
+            title, content_html = extract_main_html(url)
+            body_text = html_to_text(content_html)
+            domain = netloc(url)
+            date_guess = detect_date(
+                content_html) or detect_date(body_text)
+            rec = {
+                "source": domain,
+                "url": url,
+                "headline": title,
+                "date": date_guess,
+                "author": None,
+                "section": None,
+                "body_text": body_text,
+                "domain": domain
+            }
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            time.sleep(0.8)
+        except Exception as e:
+            rec = {"url": url, "error": str(e)}
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            time.sleep(0.2)
     out_f.close()
 
 
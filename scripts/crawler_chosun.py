@@ -1,25 +1,29 @@
 import re, json, time, argparse
-from urllib.parse import urlparse
 import orjson
 import requests
-from dateutil import parser as dateparser
+from _dateutil_cache import iso_date
 from pathlib import Path
 
 from config import ensure_dir
+from _urlutil import iter_urls, netloc
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; W1-ChosunCrawler/1.0)"}
 
+# 정규식은 모듈 로드 시 한 번만 컴파일
+# 가장 안전한 패턴: globalContent 시작 ~ globalContentConfig 직전까지 캡쳐
+_FUSION_RE = re.compile(
+    r"Fusion\.globalContent\s*=\s*(\{.*?\});\s*Fusion\.globalContentConfig",
+    re.DOTALL
+)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
+
 
 def _find_fusion_json(html: str):
     """
     조선일보(Arc/Fusion) 내장 스크립트에서 Fusion.globalContent JSON을 뽑아낸다.
     """
-    # 가장 안전한 패턴: globalContent 시작 ~ globalContentConfig 직전까지 캡쳐
-    m = re.search(
-        r"Fusion\.globalContent\s*=\s*(\{.*?\});\s*Fusion\.globalContentConfig",
-        html,
-        flags=re.DOTALL
-    )
+    m = _FUSION_RE.search(html)
     if not m:
         return None
     raw = m.group(1)
@@ -28,8 +32,8 @@ def _find_fusion_json(html: str):
         return json.loads(raw)
     except Exception:
         # 가끔 특수제어문자/주석 등으로 실패하는 경우 대비: 느슨한 정리
-        cleaned = re.sub(r"/\*.*?\*/", "", raw, flags=re.DOTALL)
-        cleaned = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F]", "", cleaned)
+        cleaned = _BLOCK_COMMENT_RE.sub("", raw)
+        cleaned = _CONTROL_CHARS_RE.sub("", cleaned)
         return json.loads(cleaned)
 
 
@@ -61,10 +65,7 @@ def parse_chosun(url: str, html: str):
     # 날짜
     published = gc.get("display_date") or gc.get("first_publish_date")  # ISO8601
     if published:
-        try:
-            published = dateparser.parse(published).date().isoformat()
-        except Exception:
-            pass
+        published = iso_date(published) or published
     # 섹션
     section = None
     tax = gc.get("taxonomy") or {}
@@ -81,7 +82,7 @@ def parse_chosun(url: str, html: str):
     # if author_elems:
     #     author = ", ".join([a.get("name") for a in author_elems if a.get("name")])
 
-    domain = urlparse(url).netloc
+    domain = netloc(url)
     return {
         "source": domain,
         "url": url,
@@ -102,25 +103,22 @@ def fetch(url: str) -> str:
 
 def main(inp: str, out: str):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as fi:
-        for line in fi:
-            url = line.strip()
-            if not url or url.startswith("#"):
+    # 1MB 버퍼: 레코드마다 write 시스템 콜이 나가지 않도록
+    out_f = open(out, "ab", buffering=1 << 20)
+    for url in iter_urls(inp):
+        try:
+            if "chosun.com" not in url:
+                rec = {"url": url, "error": "not_chosun"}
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
                 continue
-            try:
-                if "chosun.com" not in url:
-                    rec = {"url": url, "error": "not_chosun"}
-                    out_f.write(orjson.dumps(rec) + b"\n")
-                    continue
-                html = fetch(url)
-                rec = parse_chosun(url, html)
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.5)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
+            html = fetch(url)
+            rec = parse_chosun(url, html)
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            time.sleep(0.5)
+        except Exception as e:
+            rec = {"url": url, "error": str(e)}
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            time.sleep(0.2)
     out_f.close()
 
 
@@ -1,14 +1,19 @@
 import re
 import time
 import argparse
-from urllib.parse import urlparse
 import orjson
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from _dateutil_cache import iso_date
+from _ldjson import news_article
 from pathlib import Path
+from typing import Optional, Tuple
 
 from config import ensure_dir
+from _urlutil import iter_urls, netloc
+from url_cache import URLCache, DEFAULT_CACHE_PATH, body_digest
+from _souputil import JUNK_TAGS, strip_junk
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -25,29 +30,24 @@ HANI_BODY_CANDIDATES = [
     ("article", {"id": "renewal2023"}),
 ]
 
+# CSS selectors used by parse_hani, compiled once at import time
+_SEL_TITLE = sv.compile("h3[class*='ArticleDetailView_title']")
+_SEL_SUBTITLE = sv.compile("h4[class*='ArticleDetailView_subtitle']")
+_SEL_BREADCRUMB = sv.compile("div[class*='ArticleDetailView_breadcrumb']")
+_SEL_REPORTER = sv.compile("div[class*='ArticleDetailView_reporterList']")
+_SEL_DATE_LIST = sv.compile("ul[class*='ArticleDetailView_dateList']")
+_SEL_ARTICLE_TEXT = sv.compile("div.article-text")
+
+# Patterns compiled once at import time
+_JUNK_RE = re.compile(r"ad|banner|recommend|related|share|sns|BaseAd", re.I)
+_AUDIO_IMAGE_RE = re.compile(r"AudioPlayer|imageContainer", re.I)
+_BODY_DIV_RE = re.compile(r"BaseAd|AudioPlayer|imageContainer", re.I)
+
 
 def _clean_html(node: BeautifulSoup) -> str:
     """Remove ads, scripts, and unwanted elements"""
-    # Remove ads and scripts
-    for bad in node(["script", "style", "noscript", "iframe", "aside", "footer", "header"]):
-        bad.decompose()
-
-    # Remove ads and unwanted sections
-    junk_patterns = ["ad", "banner", "recommend",
-                     "related", "share", "sns", "BaseAd"]
-    for pat in junk_patterns:
-        for d in node.find_all(attrs={"class": re.compile(pat, re.I)}):
-            d.decompose()
-        for d in node.find_all(id=re.compile(pat, re.I)):
-            d.decompose()
-
-    # Remove audio player
-    for d in node.find_all("div", class_=re.compile(r"AudioPlayer", re.I)):
-        d.decompose()
-
-    # Remove image containers (extract text only)
-    for d in node.find_all("div", class_=re.compile(r"imageContainer", re.I)):
-        d.decompose()
+    # Remove scripts, ads, audio player and image containers in one walk
+    strip_junk(node, JUNK_TAGS, _JUNK_RE, _JUNK_RE, _AUDIO_IMAGE_RE)
 
     # Extract text
     lines = [t.strip() for t in node.get_text("\n").splitlines() if t.strip()]
@@ -55,10 +55,16 @@ def _clean_html(node: BeautifulSoup) -> str:
 
 
 def parse_hani(url: str, html: str):
+    # 0) Fast path: a NewsArticle JSON-LD block with the full body needs no DOM parse
+    ld = news_article(html)
+    if ld and ld["headline"] and len(ld["body_text"]) >= 200:
+        domain = netloc(url)
+        return {"source": domain, "url": url, **ld, "domain": domain}
+
     soup = BeautifulSoup(html, "lxml")
 
     # 1) Title: <h3 class="ArticleDetailView_title__*">
-    title_h3 = soup.select_one("h3[class*='ArticleDetailView_title']")
+    title_h3 = _SEL_TITLE.select_one(soup)
     title = title_h3.get_text(strip=True) if title_h3 else None
 
     # Fallback to <title> tag
@@ -66,15 +72,14 @@ def parse_hani(url: str, html: str):
         title = soup.title.string.strip().split("|")[0].strip()
 
     # 2) Subtitle: <h4 class="ArticleDetailView_subtitle__*">
-    subtitle_h4 = soup.select_one("h4[class*='ArticleDetailView_subtitle']")
+    subtitle_h4 = _SEL_SUBTITLE.select_one(soup)
     subtitle = None
     if subtitle_h4:
         subtitle = subtitle_h4.get_text("\n", strip=True)
 
     # 3) Section/Category: <div class="ArticleDetailView_breadcrumb___*">
     section = None
-    breadcrumb_div = soup.select_one(
-        "div[class*='ArticleDetailView_breadcrumb']")
+    breadcrumb_div = _SEL_BREADCRUMB.select_one(soup)
     if breadcrumb_div:
         categories = [a.get_text(strip=True)
                       for a in breadcrumb_div.find_all("a")]
@@ -82,8 +87,7 @@ def parse_hani(url: str, html: str):
 
     # 4) Author: <div class="ArticleDetailView_reporterList__*">
     author = None
-    reporter_div = soup.select_one(
-        "div[class*='ArticleDetailView_reporterList']")
+    reporter_div = _SEL_REPORTER.select_one(soup)
     if reporter_div:
         reporters = [a.get_text(strip=True)
                      for a in reporter_div.find_all("a")]
@@ -100,43 +104,31 @@ def parse_hani(url: str, html: str):
 
     # 5) Date: <ul class="ArticleDetailView_dateList__*">
     published = None
-    date_list = soup.select_one("ul[class*='ArticleDetailView_dateList']")
+    date_list = _SEL_DATE_LIST.select_one(soup)
     if date_list:
         for li in date_list.find_all("li"):
             li_text = li.get_text(strip=True)
             if "등록" in li_text:
                 date_span = li.find("span")
                 if date_span:
-                    try:
-                        published = dateparser.parse(
-                            date_span.get_text(strip=True)).date().isoformat()
+                    published = iso_date(date_span.get_text(strip=True))
+                    if published:
                         break
-                    except Exception:
-                        pass
 
     # Fallback to meta tag
     if not published:
         meta_date = soup.find(
             "meta", attrs={"property": "article:published_time"})
         if meta_date and meta_date.get("content"):
-            try:
-                published = dateparser.parse(
-                    meta_date.get("content")).date().isoformat()
-            except Exception:
-                pass
+            published = iso_date(meta_date.get("content"))
 
     # 6) Body: <div class="article-text">
     body_text = ""
-    article_text_div = soup.select_one("div.article-text")
+    article_text_div = _SEL_ARTICLE_TEXT.select_one(soup)
 
     if article_text_div:
-        # Remove ads and audio player
-        for ad in article_text_div.find_all("div", class_=re.compile(r"BaseAd|AudioPlayer", re.I)):
-            ad.decompose()
-
-        # Remove image containers
-        for img_container in article_text_div.find_all("div", class_=re.compile(r"imageContainer", re.I)):
-            img_container.decompose()
+        # Remove ads, audio player and image containers
+        strip_junk(article_text_div, div_cls_re=_BODY_DIV_RE)
 
         # Extract paragraphs
         paragraphs = []
@@ -164,7 +156,7 @@ def parse_hani(url: str, html: str):
         if node:
             body_text = _clean_html(node)
 
-    domain = urlparse(url).netloc
+    domain = netloc(url)
     return {
         "source": domain,
         "url": url,
@@ -183,33 +175,67 @@ def fetch(url: str) -> str:
     return r.text
 
 
-def main(inp: str, out: str):
+def fetch_if_changed(url: str, cache: URLCache) -> Optional[Tuple[str, tuple]]:
+    """
+    Conditional GET; returns None if the article is unchanged since the last crawl.
+
+    Otherwise returns (html, validators), where validators is the
+    (etag, last_modified, body_sha) to pass to cache.update() once the
+    record has been written.
+    """
+    r = requests.get(url, headers=cache.conditional_headers(url, HEADERS), timeout=30)
+    if r.status_code == 304:
+        return None
+    r.raise_for_status()
+    validators = (r.headers.get("ETag"), r.headers.get("Last-Modified"),
+                  body_digest(r.content))
+    if not cache.is_changed(url, validators[2]):
+        # Same body; only refresh the validators
+        cache.update(url, *validators)
+        return None
+    return r.text, validators
+
+
+def main(inp: str, out: str, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as fi:
-        for line in fi:
-            url = line.strip()
-            if not url or url.startswith("#"):
+    cache = URLCache(cache_path) if cache_path else None
+    # 1 MiB buffer so records are not flushed one syscall at a time
+    out_f = open(out, "ab", buffering=1 << 20)
+    for url in iter_urls(inp):
+        try:
+            if "hani.co.kr" not in url:
+                rec = {"url": url, "error": "not_hani"}
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
                 continue
-            try:
-                if "hani.co.kr" not in url:
-                    rec = {"url": url, "error": "not_hani"}
-                    out_f.write(orjson.dumps(rec) + b"\n")
+            validators = None
+            if cache:
+                fetched = fetch_if_changed(url, cache)
+                if fetched is None:
                     continue
+                html, validators = fetched
+            else:
                 html = fetch(url)
-                rec = parse_hani(url, html)
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.5)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
+            rec = parse_hani(url, html)
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            if validators:
+                cache.update(url, *validators)
+            time.sleep(0.5)
+        except Exception as e:
+            rec = {"url": url, "error": str(e)}
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+            time.sleep(0.2)
     out_f.close()
+    if cache:
+        cache.close()
 
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--in", dest="inp", required=True)
     ap.add_argument("--out", dest="out", required=True)
+    ap.add_argument("--cache", dest="cache", default=DEFAULT_CACHE_PATH,
+                    help="URL cache for incremental crawls")
+    ap.add_argument("--no-cache", dest="cache", action="store_const", const=None,
+                    help="Re-download every URL")
     args = ap.parse_args()
-    main(args.inp, args.out)
+    main(args.inp, args.out, args.cache)
@@ -1,14 +1,19 @@
 import re
-import time
+import asyncio
 import argparse
-from urllib.parse import urlparse
 import orjson
-import requests
 from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from lxml import etree
+from _dateutil_cache import iso_date
+from _ldjson import news_article
 from pathlib import Path
 
 from config import ensure_dir
+from _httputil import make_session
+from _urlutil import iter_urls, netloc
+from crawl_async import crawl
+from _souputil import JUNK_TAGS, strip_junk
+from _lxmlutil import drop_junk, first, has_class, parse_html, text_of
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -19,95 +24,112 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# Module-level session so fetch() reuses keep-alive connections
+SESSION = make_session(HEADERS)
+
 HANKOOK_BODY_CANDIDATES = [
     ("div", {"class": "col-main", "itemprop": "articleBody"}),
     ("div", {"class": "article-body"}),
     ("div", {"itemprop": "articleBody"}),
 ]
 
+# Patterns compiled once at import time
+_JUNK_RE = re.compile(
+    r"ad|banner|recommend|related|share|sns|utility|end-ad|module", re.I)
+# <div> classes dropped by _clean_html: image boxes, editor notes, div-line
+_CLEAN_DIV_RE = re.compile(r"(?i:editor-img-box)|^(?:editor-note|div-line)$")
+# <div> classes dropped from the article body: ads, images, editor notes, div-line
+_BODY_DIV_RE = re.compile(
+    r"(?i:ad|banner|module|img-box)|^(?:editor-note|div-line)$")
+_DATE_RE = re.compile(r"(20\d{2}[.\-\/]\d{1,2}[.\-\/]\d{1,2})")
+
+# XPath selectors used by parse_hankook, compiled once at import time
+_X_TITLE = etree.XPath(
+    "(//h1[%s or %s])[1]" % (has_class("headline"), has_class("tit")))
+_X_TITLE_TAG = etree.XPath("(//title)[1]")
+_X_OG_TITLE = etree.XPath("(//meta[@property='og:title'])[1]/@content")
+_X_SUBTITLE = etree.XPath(
+    "(//h2[%s or %s])[1]" % (has_class("sub-tit-ll"), has_class("sub-title")))
+_X_META_SECTION = etree.XPath(
+    "(//meta[@property='article:section'])[1]/@content")
+_X_BREADCRUMB = etree.XPath(
+    "(//div[{0}] | //nav[{0}])[1]".format(has_class("breadcrumb")))
+_X_META_AUTHOR = etree.XPath("(//meta[@name='author'])[1]/@content")
+_X_BYLINE = etree.XPath("(//*[%s or %s or %s])[1]" % (
+    has_class("byline"), has_class("reporter"), has_class("author")))
+_X_META_PUB = etree.XPath(
+    "(//meta[@property='article:published_time'])[1]/@content")
+_X_META_PUB_NAME = etree.XPath(
+    "(//meta[@name='article:published_time'])[1]/@content")
+_X_DATE = etree.XPath("(//*[%s or %s] | //time)[1]" % (
+    has_class("date"), has_class("datetime")))
+_X_BODY_MAIN = etree.XPath(
+    "(//div[%s][@itemprop='articleBody'])[1]" % has_class("col-main"))
+_X_BODY = etree.XPath("(//div[@itemprop='articleBody'])[1]")
+# Section titles and body paragraphs, collected in one traversal
+_X_BODY_PARTS = etree.XPath(".//h3[%s] | .//p[contains(@class, 'editor-p')]"
+                            % has_class("editor-tit"))
+
 
 def _clean_html(node: BeautifulSoup) -> str:
     """Remove ads, scripts, and unwanted elements"""
-    # Remove ads and scripts
-    for bad in node(["script", "style", "noscript", "iframe", "aside", "footer", "header"]):
-        bad.decompose()
-
-    # Remove ads and unwanted sections
-    junk_patterns = ["ad", "banner", "recommend",
-                     "related", "share", "sns", "utility", "end-ad", "module"]
-    for pat in junk_patterns:
-        for d in node.find_all(attrs={"class": re.compile(pat, re.I)}):
-            d.decompose()
-        for d in node.find_all(id=re.compile(pat, re.I)):
-            d.decompose()
-
-    # Remove image boxes
-    for d in node.find_all("div", class_=re.compile(r"editor-img-box", re.I)):
-        d.decompose()
-
-    # Remove editor notes
-    for d in node.find_all("div", class_="editor-note"):
-        d.decompose()
-
-    # Remove div-line
-    for d in node.find_all("div", class_="div-line"):
-        d.decompose()
+    # Remove scripts, ads, image boxes, editor notes and div-line in one walk
+    strip_junk(node, JUNK_TAGS, _JUNK_RE, _JUNK_RE, _CLEAN_DIV_RE)
 
     # Extract text
     lines = [t.strip() for t in node.get_text("\n").splitlines() if t.strip()]
     return "\n".join(lines)
 
 
-def parse_hankook(url: str, html: str):
-    soup = BeautifulSoup(html, "lxml")
+def parse_hankook(url: str, html: bytes):
+    # 0) Fast path: a NewsArticle JSON-LD block with the full body needs no DOM parse
+    ld = news_article(html)
+    if ld and ld["headline"] and len(ld["body_text"]) >= 200:
+        domain = netloc(url)
+        return {"source": domain, "url": url, **ld, "domain": domain}
+
+    root = parse_html(html)
 
     # 1) Title: <h1 class="headline"> or <h1 class="tit">
-    title_h1 = soup.select_one("h1.headline, h1.tit")
-    title = title_h1.get_text(strip=True) if title_h1 else None
+    title_h1 = first(_X_TITLE(root))
+    title = text_of(title_h1) if title_h1 is not None else None
 
     # Fallback to <title> tag
-    if not title and soup.title:
-        title_text = soup.title.string.strip() if soup.title.string else ""
-        # Remove site name (e.g., " - 한국일보")
-        title = title_text.split(" - ")[0].strip() if title_text else None
+    if not title:
+        title_tag = first(_X_TITLE_TAG(root))
+        if title_tag is not None:
+            title_text = title_tag.text.strip() if title_tag.text else ""
+            # Remove site name (e.g., " - 한국일보")
+            title = title_text.split(" - ")[0].strip() if title_text else None
 
     # Fallback to meta tag
     if not title:
-        meta_title = soup.find("meta", attrs={"property": "og:title"})
-        if meta_title and meta_title.get("content"):
-            title = meta_title.get("content")
+        title = first(_X_OG_TITLE(root)) or None
 
     # 2) Subtitle: <h2 class="sub-tit-ll">
-    subtitle_h2 = soup.select_one("h2.sub-tit-ll, h2.sub-title")
+    subtitle_h2 = first(_X_SUBTITLE(root))
     subtitle = None
-    if subtitle_h2:
-        subtitle = subtitle_h2.get_text("\n", strip=True)
+    if subtitle_h2 is not None:
+        subtitle = text_of(subtitle_h2, "\n")
 
     # 3) Section/Category: meta tag or breadcrumb
-    section = None
-    meta_section = soup.find("meta", attrs={"property": "article:section"})
-    if meta_section and meta_section.get("content"):
-        section = meta_section.get("content")
+    section = first(_X_META_SECTION(root)) or None
 
     # Fallback to breadcrumb
     if not section:
-        breadcrumb = soup.select_one("div.breadcrumb, nav.breadcrumb")
-        if breadcrumb:
-            categories = [a.get_text(strip=True)
-                          for a in breadcrumb.find_all("a")]
+        breadcrumb = first(_X_BREADCRUMB(root))
+        if breadcrumb is not None:
+            categories = [text_of(a) for a in breadcrumb.iter("a")]
             section = " > ".join(categories) if categories else None
 
     # 4) Author: meta tag or byline
-    author = None
-    author_meta = soup.find("meta", attrs={"name": "author"})
-    if author_meta and author_meta.get("content"):
-        author = author_meta.get("content")
+    author = first(_X_META_AUTHOR(root)) or None
 
     # Fallback to byline class
     if not author:
-        byline = soup.select_one(".byline, .reporter, .author")
-        if byline:
-            author_text = byline.get_text(strip=True)
+        byline = first(_X_BYLINE(root))
+        if byline is not None:
+            author_text = text_of(byline)
             # Extract reporter names
             # Pattern: "신은별 기자", "신은별•이유진 기자" etc.
             if "기자" in author_text:
@@ -115,59 +137,35 @@ def parse_hankook(url: str, html: str):
 
     # 5) Date: meta tag
     published = None
-    date_meta = soup.find(
-        "meta", attrs={"property": "article:published_time"})
-    if date_meta and date_meta.get("content"):
-        try:
-            published = dateparser.parse(
-                date_meta.get("content")).date().isoformat()
-        except Exception:
-            pass
+    date_meta = first(_X_META_PUB(root))
+    if date_meta:
+        published = iso_date(date_meta)
 
     # Fallback to other meta tags
     if not published:
-        date_meta2 = soup.find("meta", attrs={"name": "article:published_time"})
-        if date_meta2 and date_meta2.get("content"):
-            try:
-                published = dateparser.parse(
-                    date_meta2.get("content")).date().isoformat()
-            except Exception:
-                pass
+        date_meta2 = first(_X_META_PUB_NAME(root))
+        if date_meta2:
+            published = iso_date(date_meta2)
 
     # Fallback to date in text
     if not published:
-        date_div = soup.select_one(".date, .datetime, time")
-        if date_div:
-            date_text = date_div.get_text(strip=True)
-            m = re.search(
-                r"(20\d{2}[.\-\/]\d{1,2}[.\-\/]\d{1,2})", date_text)
+        date_div = first(_X_DATE(root))
+        if date_div is not None:
+            date_text = text_of(date_div)
+            m = _DATE_RE.search(date_text)
             if m:
-                try:
-                    published = dateparser.parse(
-                        m.group(1)).date().isoformat()
-                except Exception:
-                    pass
+                published = iso_date(m.group(1))
 
     # 6) Body: <div class="col-main" itemprop="articleBody">
     body_text = ""
-    article_body = soup.select_one('div.col-main[itemprop="articleBody"]')
+    article_body = first(_X_BODY_MAIN(root))
 
-    if not article_body:
-        article_body = soup.select_one('div[itemprop="articleBody"]')
+    if article_body is None:
+        article_body = first(_X_BODY(root))
 
-    if article_body:
+    if article_body is not None:
         # Remove ads, editor notes, images
-        for ad in article_body.find_all("div", class_=re.compile(r"ad|banner|module", re.I)):
-            ad.decompose()
-
-        for editor_note in article_body.find_all("div", class_="editor-note"):
-            editor_note.decompose()
-
-        for img_box in article_body.find_all("div", class_=re.compile(r"editor-img-box|img-box", re.I)):
-            img_box.decompose()
-
-        for div_line in article_body.find_all("div", class_="div-line"):
-            div_line.decompose()
+        drop_junk(article_body, div_cls_re=_BODY_DIV_RE)
 
         # Extract paragraphs
         paragraphs = []
@@ -176,26 +174,27 @@ def parse_hankook(url: str, html: str):
         if subtitle:
             paragraphs.append(subtitle)
 
+        # Text of each <h3 class="editor-tit"> / <p class="editor-p">, computed once
+        # (paragraphs that are just a break are skipped)
+        parts = [(el.tag, text_of(el)) for el in _X_BODY_PARTS(article_body)
+                 if el.tag == "h3" or el.get("data-break-type") != "break"]
+
         # Extract section titles
-        for h3 in article_body.find_all("h3", class_="editor-tit"):
-            text = h3.get_text(strip=True)
-            if text:
-                paragraphs.append(f"## {text}")
+        paragraphs.extend(f"## {text}" for tag, text in parts
+                          if tag == "h3" and text)
 
         # Extract body content (<p class="editor-p">)
-        for p in article_body.find_all("p", class_=re.compile(r"editor-p")):
-            # Skip if it's just a break
-            if p.get("data-break-type") == "break":
-                continue
-
-            text = p.get_text(strip=True)
-            if text and len(text) > 10:
-                paragraphs.append(text)
+        paragraphs.extend(text for tag, text in parts
+                          if tag == "p" and text and len(text) > 10)
 
         body_text = "\n\n".join(paragraphs)
 
-    # Fallback if body is too short
-    if not body_text or len(body_text) < 200:
+    # Fallback if body is too short. Skip the whole-document sweep when the
+    # article body was found and already reads like prose (short news items).
+    body_shaped = (article_body is not None and len(body_text) >= 80
+                   and ("\n" in body_text or "." in body_text))
+    if not body_shaped and (not body_text or len(body_text) < 200):
+        soup = BeautifulSoup(html, "lxml")
         node = None
         for tag, attrs in HANKOOK_BODY_CANDIDATES:
             node = soup.find(tag, attrs=attrs)
@@ -204,7 +203,7 @@ def parse_hankook(url: str, html: str):
         if node:
             body_text = _clean_html(node)
 
-    domain = urlparse(url).netloc
+    domain = netloc(url)
     return {
         "source": domain,
         "url": url,
@@ -217,34 +216,29 @@ def parse_hankook(url: str, html: str):
     }
 
 
-def fetch(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+def fetch(url: str) -> bytes:
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.text
+    return r.content
 
 
 def main(inp: str, out: str):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as fi:
-        for line in fi:
-            url = line.strip()
-            if not url or url.startswith("#"):
+    asyncio.run(_crawl(inp, out))
+
+
+async def _crawl(inp: str, out: str):
+    urls = []
+    # 1 MiB buffer so records are not flushed one syscall at a time
+    with open(out, "ab", buffering=1 << 20) as out_f:
+        for url in iter_urls(inp):
+            if "hankookilbo.com" not in url:
+                rec = {"url": url, "error": "not_hankook"}
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
                 continue
-            try:
-                if "hankookilbo.com" not in url:
-                    rec = {"url": url, "error": "not_hankook"}
-                    out_f.write(orjson.dumps(rec) + b"\n")
-                    continue
-                html = fetch(url)
-                rec = parse_hankook(url, html)
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.5)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
-    out_f.close()
+            urls.append(url)
+        async for rec in crawl(urls, parse_hankook, HEADERS, raw=True):
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
 
 
 if __name__ == "__main__":
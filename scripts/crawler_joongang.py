@@ -1,135 +1,175 @@
 import re
-import time
+import asyncio
 import argparse
-from urllib.parse import urlparse
 import orjson
-import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from readability import Document
-from dateutil import parser as dateparser
+from _dateutil_cache import iso_date
+from _ldjson import news_article
 from pathlib import Path
+from typing import Optional, Union
 
 from config import ensure_dir
+from _httputil import make_session
+from _urlutil import iter_urls, netloc
+from crawl_async import crawl
+from _souputil import JUNK_TAGS
+from _lxmlutil import decode_html, drop_junk, first, has_class, parse_html, text_of
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; W1-JoongangCrawler/1.0)"}
 
+# 연결 재사용을 위한 모듈 단위 세션 (keep-alive 커넥션 풀)
+SESSION = make_session(HEADERS)
+
+# 본문 후보 선택자 (EXSLT 정규식으로 class 를 대소문자 무시 검색)
+_RE_NS = {"re": "http://exslt.org/regular-expressions"}
 JOONGANG_BODY_CANDIDATES = [
-    ("div", {"class": re.compile(
-        r"(article_body|article_content|article_text|article|content)", re.I)}),
-    ("section", {"class": re.compile(r"(article|contents?)", re.I)}),
-    ("article", {"class": re.compile(r"article", re.I)}),
+    etree.XPath(
+        "(//div[re:test(@class, '(article_body|article_content|article_text|article|content)', 'i')])[1]",
+        namespaces=_RE_NS),
+    etree.XPath("(//section[re:test(@class, '(article|contents?)', 'i')])[1]",
+                namespaces=_RE_NS),
+    etree.XPath("(//article[re:test(@class, 'article', 'i')])[1]",
+                namespaces=_RE_NS),
 ]
 
-
-def _clean_html(node: BeautifulSoup) -> str:
+# 정규식은 모듈 로드 시 한 번만 컴파일
+_JUNK_RE = re.compile(r"ad|banner|recommend|related|share|sns|utility", re.I)
+_TITLE_JS_RE = re.compile(r'TITLE:\s*"([^"]+)"')
+_SERVICE_DAYTIME_RE = re.compile(r'SERVICE_DAYTIME:\s*"([^"]+)"')
+_DATE_RE = re.compile(
+    r"(20\d{2}[.\-\/]\d{1,2}[.\-\/]\d{1,2}(\s+\d{1,2}:\d{2})?)")
+
+# parse_joongang 의 XPath 선택자도 모듈 로드 시 한 번만 컴파일
+_X_META_DATE = etree.XPath("(//meta[@property='published_date'])[1]/@content")
+_X_TIME = etree.XPath("(//time[@datetime])[1]/@datetime")
+_X_H1 = etree.XPath("(//h1[%s])[1]" % has_class("headline"))
+_X_TITLE_TAG = etree.XPath("(//title)[1]")
+_X_CRUMB = etree.XPath(
+    "(//section[%s]//article[%s]//header[%s]//*[%s])[1]" % (
+        has_class("contents"), has_class("article"),
+        has_class("article_header"), has_class("subhead")))
+_X_BYLINE = etree.XPath("(//*[%s])[1]" % has_class("byline"))
+
+
+def _clean_html(node: HtmlElement) -> str:
     """광고/공유/스크립트/추천영역 제거"""
-    # 광고/스크립트 제거
-    for bad in node(["script", "style", "noscript", "iframe", "aside", "footer", "header"]):
-        bad.decompose()
-    junk_patterns = ["ad", "banner", "recommend",
-                     "related", "share", "sns", "utility"]
-    for pat in junk_patterns:
-        for d in node.find_all(attrs={"class": re.compile(pat, re.I)}):
-            d.decompose()
-        for d in node.find_all(id=re.compile(pat, re.I)):
-            d.decompose()
+    # 광고/스크립트 제거 (한 번의 순회)
+    drop_junk(node, JUNK_TAGS, _JUNK_RE, _JUNK_RE)
     # 텍스트 추출
-    lines = [t.strip() for t in node.get_text("\n").splitlines() if t.strip()]
+    lines = [t.strip() for t in text_of(node, "\n", strip=False).splitlines() if t.strip()]
     return "\n".join(lines)
 
 
+def _window_article_script(text: str) -> Optional[str]:
+    """
+    window.article 이 들어 있는 <script> 본문을 원문 문자열에서 바로 잘라냄
+    (트리의 모든 <script> 를 순회하지 않음)
+    """
+    i = text.find("window.article")
+    if i < 0:
+        return None
+    tag = text.rfind("<script", 0, i)
+    start = text.find(">", tag) + 1 if tag >= 0 else 0
+    end = text.find("</script", i)
+    return text[start:end] if end >= 0 else text[start:]
+
+
 def _parse_window_article(js_text: str) -> dict:
     """
     window.article = { TITLE: "...", SERVICE_DAYTIME: "YYYY-MM-DD HH:MM:SS", ... };
     """
     out = {}
-    m_title = re.search(r'TITLE:\s*"([^"]+)"', js_text)
+    m_title = _TITLE_JS_RE.search(js_text)
     if m_title:
         out["title_js"] = m_title.group(1)
-    m_time = re.search(r'SERVICE_DAYTIME:\s*"([^"]+)"', js_text)
+    m_time = _SERVICE_DAYTIME_RE.search(js_text)
     if m_time:
         out["published_js"] = m_time.group(1)
     return out
 
 
-def parse_joongang(url: str, html: str):
-    soup = BeautifulSoup(html, "lxml")
+def parse_joongang(url: str, html: Union[str, bytes]):
+    # 0) 빠른 경로: NewsArticle JSON-LD 에 본문 전체가 있으면 DOM 파싱 생략
+    ld = news_article(html)
+    if ld and ld["headline"] and len(ld["body_text"]) >= 400:
+        domain = netloc(url)
+        return {"source": domain, "url": url, **ld, "domain": domain}
+
+    text = decode_html(html)
+    root = parse_html(text)
 
     # 1) 메타/JS에서 제목·날짜 우선 추출
     #   - meta property="published_date" (예: 2025-11-11T05:00:00+09:00)
-    meta_date = soup.find("meta", attrs={"property": "published_date"})
-    meta_date_str = meta_date.get("content") if meta_date else None
-    time_tag = soup.select_one("time[datetime]")  # 2025.11.11 05:00 형태도 표기됨
+    meta_date_str = first(_X_META_DATE(root))
+    time_datetime = first(_X_TIME(root))  # 2025.11.11 05:00 형태도 표기됨
 
     # window.article 블록 파싱 (TITLE, SERVICE_DAYTIME)
     title_js, published_js = None, None
-    for sc in soup.find_all("script"):
-        if sc.string and "window.article" in sc.string:
-            parsed = _parse_window_article(sc.string)
-            title_js = parsed.get("title_js")
-            published_js = parsed.get("published_js")
-            break
+    js_text = _window_article_script(text)
+    if js_text:
+        parsed = _parse_window_article(js_text)
+        title_js = parsed.get("title_js")
+        published_js = parsed.get("published_js")
 
     # 2) 제목: JS → <h1.headline> → <title> 순
-    h1 = soup.select_one("h1.headline")
-    title = title_js or (h1.get_text(strip=True) if h1 else None) or (
-        soup.title.string.strip() if soup.title else "")
+    h1 = first(_X_H1(root))
+    title_tag = first(_X_TITLE_TAG(root))
+    title = title_js or (text_of(h1) if h1 is not None else None) or (
+        title_tag.text.strip() if title_tag is not None else "")
 
     # 3) 섹션/카테고리(상단 빵부스러기)
     #    ex) <a class="title">사회</a>, <a>검찰・법원</a>
     section = None
-    crumb = soup.select_one(
-        "section.contents article.article header.article_header .subhead")
-    if crumb:
-        cats = [a.get_text(strip=True) for a in crumb.find_all("a")]
+    crumb = first(_X_CRUMB(root))
+    if crumb is not None:
+        cats = [text_of(a) for a in crumb.iter("a")]
         section = " > ".join([c for c in cats if c])
 
     # 4) 기자명(상단 byline anchor 텍스트)
     author = None
-    byline = soup.select_one(".byline")
-    if byline:
-        names = [a.get_text(strip=True)
-                 for a in byline.find_all("a") if a.get_text(strip=True)]
+    byline = first(_X_BYLINE(root))
+    if byline is not None:
+        names = [n for n in (text_of(a) for a in byline.iter("a")) if n]
         author = ", ".join(names) if names else None
 
-    # 5) 본문: Readability → 후보 선택자 스캔
-    body_text = ""
-    try:
-        doc = Document(html)
-        content_html = doc.summary(html_partial=True)
-        body_text = _clean_html(BeautifulSoup(content_html, "lxml"))
-    except Exception:
-        pass
-
-    if not body_text or len(body_text) < 400:
-        node = None
-        for tag, attrs in JOONGANG_BODY_CANDIDATES:
-            node = soup.find(tag, attrs=attrs)
-            if node:
-                break
-        if node:
-            body_text = _clean_html(node)
-
-    # 6) 날짜 정리: JS → meta → time[datetime] → 텍스트 휴리스틱
+    # 5) 날짜 정리: JS → meta → time[datetime] → 텍스트 휴리스틱
+    #    (본문 정리로 트리가 바뀌기 전에 처리)
     published = None
-    for cand in [published_js, meta_date_str, (time_tag.get("datetime") if time_tag else None)]:
+    for cand in [published_js, meta_date_str, time_datetime]:
         if cand:
-            try:
-                published = dateparser.parse(cand).date().isoformat()
+            published = iso_date(cand)
+            if published:
                 break
-            except Exception:
-                continue
     if not published:
         # 페이지 내 YYYY.MM.DD HH:MM or YYYY-MM-DD 휴리스틱
-        m = re.search(
-            r"(20\d{2}[.\-\/]\d{1,2}[.\-\/]\d{1,2}(\s+\d{1,2}:\d{2})?)", soup.get_text(" "))
+        m = _DATE_RE.search(text_of(root, " ", strip=False))
         if m:
-            try:
-                published = dateparser.parse(m.group(1)).date().isoformat()
-            except Exception:
-                pass
+            published = iso_date(m.group(1))
+
+    # 6) 본문: 후보 선택자 스캔 → (부족하면) Readability
+    body_text = ""
+    node = None
+    for xp in JOONGANG_BODY_CANDIDATES:
+        node = first(xp(root))
+        if node is not None:
+            break
+    if node is not None:
+        body_text = _clean_html(node)
 
-    domain = urlparse(url).netloc
+    if not body_text or len(body_text) < 400:
+        # Readability 는 HTML 을 다시 파싱하므로 후보 선택자가 실패했을 때만 사용
+        try:
+            content_html = Document(text).summary(html_partial=True)
+            rb_text = _clean_html(lxml.html.fromstring(content_html))
+            if len(rb_text) > len(body_text):
+                body_text = rb_text
+        except Exception:
+            pass
+
+    domain = netloc(url)
     return {
         "source": domain,
         "url": url,
@@ -142,34 +182,29 @@ def parse_joongang(url: str, html: str):
     }
 
 
-def fetch(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+def fetch(url: str) -> bytes:
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.text
+    return r.content
 
 
 def main(inp: str, out: str):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as fi:
-        for line in fi:
-            url = line.strip()
-            if not url or url.startswith("#"):
+    asyncio.run(_crawl(inp, out))
+
+
+async def _crawl(inp: str, out: str):
+    urls = []
+    # 1MB 버퍼: 레코드마다 write 시스템 콜이 나가지 않도록
+    with open(out, "ab", buffering=1 << 20) as out_f:
+        for url in iter_urls(inp):
+            if "joongang.co.kr" not in url:
+                rec = {"url": url, "error": "not_joongang"}
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
                 continue
-            try:
-                if "joongang.co.kr" not in url:
-                    rec = {"url": url, "error": "not_joongang"}
-                    out_f.write(orjson.dumps(rec) + b"\n")
-                    continue
-                html = fetch(url)
-                rec = parse_joongang(url, html)
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.5)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
-    out_f.close()
+            urls.append(url)
+        async for rec in crawl(urls, parse_joongang, HEADERS, raw=True):
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
 
 
 if __name__ == "__main__":
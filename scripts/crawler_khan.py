@@ -1,14 +1,19 @@
 import re
-import time
+import asyncio
 import argparse
-from urllib.parse import urlparse
 import orjson
-import requests
 from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from lxml import etree
+from _dateutil_cache import iso_date
+from _ldjson import news_article
 from pathlib import Path
 
 from config import ensure_dir
+from _httputil import make_session
+from _urlutil import iter_urls, netloc
+from crawl_async import crawl
+from _souputil import JUNK_TAGS, strip_junk
+from _lxmlutil import first, has_class, parse_html, text_of
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -19,103 +24,109 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# 연결 재사용을 위한 모듈 단위 세션 (keep-alive 커넥션 풀)
+SESSION = make_session(HEADERS)
+
 KHAN_BODY_CANDIDATES = [
     ("div", {"id": "articleBody"}),
     ("div", {"class": "art_body"}),
     ("section", {"class": re.compile(r"art_cont", re.I)}),
 ]
 
+# 정규식은 모듈 로드 시 한 번만 컴파일
+_JUNK_RE = re.compile(
+    r"ad|banner|recommend|related|share|sns|utility|KH_View", re.I)
+_INPUT_DATE_RE = re.compile(
+    r"입력\s+(20\d{2}\.\d{1,2}\.\d{1,2}(?:\s+\d{1,2}:\d{2})?)")
+
+# parse_khan 의 XPath 선택자도 모듈 로드 시 한 번만 컴파일
+_X_TITLE = etree.XPath("(//article//header//h1)[1]")
+_X_TITLE_TAG = etree.XPath("(//title)[1]")
+_X_CATEGORY = etree.XPath(
+    "(//article//header//ul[%s]//li//a)[1]" % has_class("category"))
+_X_DATE = etree.XPath("(//article//header//div[%s])[1]" % has_class("date"))
+_X_META_PUB = etree.XPath(
+    "(//meta[@property='article:published_time'])[1]/@content")
+_X_EDITOR = etree.XPath("(//article//header//ul[%s]//li[%s]//a)[1]" % (
+    has_class("bottom"), has_class("editor")))
+_X_BODY = etree.XPath("(//div[@id='articleBody'])[1]")
+_X_SUBTITLE = etree.XPath("(.//div[%s])[1]" % has_class("editor-subtitle"))
+_X_PARAGRAPHS = etree.XPath(".//*[self::p or self::div][%s or %s]" % (
+    has_class("content_text"), has_class("editor-middle-title")))
+
 
 def _clean_html(node: BeautifulSoup) -> str:
     """광고/공유/스크립트/추천영역 제거"""
-    # 광고/스크립트 제거
-    for bad in node(["script", "style", "noscript", "iframe", "aside", "footer", "header"]):
-        bad.decompose()
-
-    # 광고 및 불필요한 영역 제거
-    junk_patterns = ["ad", "banner", "recommend",
-                     "related", "share", "sns", "utility", "KH_View"]
-    for pat in junk_patterns:
-        for d in node.find_all(attrs={"class": re.compile(pat, re.I)}):
-            d.decompose()
-        for d in node.find_all(id=re.compile(pat, re.I)):
-            d.decompose()
-
-    # 배너 관련 div 제거
-    for d in node.find_all("div", class_=re.compile(r"banner", re.I)):
-        d.decompose()
+    # 광고/스크립트/불필요한 영역을 한 번의 순회로 제거
+    # (배너 div 는 _JUNK_RE 의 "banner" 에 포함됨)
+    strip_junk(node, JUNK_TAGS, _JUNK_RE, _JUNK_RE)
 
     # 텍스트 추출
     lines = [t.strip() for t in node.get_text("\n").splitlines() if t.strip()]
     return "\n".join(lines)
 
 
-def parse_khan(url: str, html: str):
-    soup = BeautifulSoup(html, "lxml")
+def parse_khan(url: str, html: bytes):
+    # 0) 빠른 경로: NewsArticle JSON-LD 에 본문 전체가 있으면 DOM 파싱 생략
+    ld = news_article(html)
+    if ld and ld["headline"] and len(ld["body_text"]) >= 200:
+        domain = netloc(url)
+        return {"source": domain, "url": url, **ld, "domain": domain}
+
+    root = parse_html(html)
 
     # 1) 제목: <h1> 태그
-    h1 = soup.select_one("article header h1")
-    title = h1.get_text(strip=True) if h1 else None
+    h1 = first(_X_TITLE(root))
+    title = text_of(h1) if h1 is not None else None
 
     # 제목이 없으면 <title> 태그에서 추출
-    if not title and soup.title:
-        title = soup.title.string.strip().split("|")[0].strip()
+    if not title:
+        title_tag = first(_X_TITLE_TAG(root))
+        if title_tag is not None:
+            title = title_tag.text.strip().split("|")[0].strip()
 
     # 2) 카테고리/섹션: <ul class="category"> 내의 <a> 태그
     section = None
-    category_link = soup.select_one("article header ul.category li a")
-    if category_link:
-        section = category_link.get_text(strip=True)
+    category_link = first(_X_CATEGORY(root))
+    if category_link is not None:
+        section = text_of(category_link)
 
     # 3) 날짜: <div class="date"> 내의 텍스트에서 추출
     published = None
-    date_div = soup.select_one("article header div.date")
-    if date_div:
+    date_div = first(_X_DATE(root))
+    if date_div is not None:
         # "입력 2025.11.11 06:00" 형태의 텍스트에서 날짜 추출
-        date_text = date_div.get_text(" ", strip=True)
+        date_text = text_of(date_div, " ")
         # "입력" 다음의 날짜를 찾음
-        m = re.search(
-            r"입력\s+(20\d{2}\.\d{1,2}\.\d{1,2}(?:\s+\d{1,2}:\d{2})?)", date_text)
+        m = _INPUT_DATE_RE.search(date_text)
         if m:
-            try:
-                published = dateparser.parse(m.group(1)).date().isoformat()
-            except Exception:
-                pass
+            published = iso_date(m.group(1))
 
     # 날짜를 찾지 못한 경우 meta 태그에서 시도
     if not published:
-        meta_date = soup.find(
-            "meta", attrs={"property": "article:published_time"})
-        if meta_date and meta_date.get("content"):
-            try:
-                published = dateparser.parse(
-                    meta_date.get("content")).date().isoformat()
-            except Exception:
-                pass
+        meta_date = first(_X_META_PUB(root))
+        if meta_date:
+            published = iso_date(meta_date)
 
     # 4) 기자명: <li class="editor"> 내의 <a> 태그
     author = None
-    editor_li = soup.select_one("article header ul.bottom li.editor a")
-    if editor_li:
-        author_text = editor_li.get_text(strip=True)
+    editor_li = first(_X_EDITOR(root))
+    if editor_li is not None:
+        author_text = text_of(editor_li)
         # "박은경 기자" 형태에서 이름만 추출
         author = author_text.split()[0] if author_text else None
 
     # 5) 본문: <div class="art_body" id="articleBody"> 내의 텍스트
     body_text = ""
-    article_body = soup.select_one("div#articleBody")
+    article_body = first(_X_BODY(root))
 
-    if article_body:
+    if article_body is not None:
         # 부제목 추출 (있는 경우)
-        subtitle_div = article_body.select_one("div.editor-subtitle")
+        subtitle_div = first(_X_SUBTITLE(article_body))
         subtitle = ""
-        if subtitle_div:
-            subtitle = subtitle_div.get_text("\n", strip=True)
-            subtitle_div.decompose()  # 본문에서 제거
-
-        # 중간 제목도 포함하여 추출
-        middle_titles = article_body.find_all(
-            "div", class_="editor-middle-title")
+        if subtitle_div is not None:
+            subtitle = text_of(subtitle_div, "\n")
+            subtitle_div.drop_tree()  # 본문에서 제거
 
         # 본문 단락들 추출 (<p class="content_text">)
         paragraphs = []
@@ -124,9 +135,9 @@ def parse_khan(url: str, html: str):
         if subtitle:
             paragraphs.append(subtitle)
 
-        # 본문 내용 순서대로 추출
-        for elem in article_body.find_all(["p", "div"], class_=["content_text", "editor-middle-title"]):
-            text = elem.get_text(strip=True)
+        # 본문 내용 순서대로 추출 (중간 제목 포함)
+        for elem in _X_PARAGRAPHS(article_body):
+            text = text_of(elem)
             if text:
                 paragraphs.append(text)
 
@@ -134,6 +145,7 @@ def parse_khan(url: str, html: str):
 
     # 본문이 충분하지 않은 경우 후보 선택자로 다시 시도
     if not body_text or len(body_text) < 200:
+        soup = BeautifulSoup(html, "lxml")
         node = None
         for tag, attrs in KHAN_BODY_CANDIDATES:
             node = soup.find(tag, attrs=attrs)
@@ -142,7 +154,7 @@ def parse_khan(url: str, html: str):
         if node:
             body_text = _clean_html(node)
 
-    domain = urlparse(url).netloc
+    domain = netloc(url)
     return {
         "source": domain,
         "url": url,
@@ -155,34 +167,29 @@ def parse_khan(url: str, html: str):
     }
 
 
-def fetch(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+def fetch(url: str) -> bytes:
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.text
+    return r.content
 
 
 def main(inp: str, out: str):
     ensure_dir(out)
-    out_f = open(out, "ab")
-    with open(inp, "r", encoding="utf-8") as fi:
-        for line in fi:
-            url = line.strip()
-            if not url or url.startswith("#"):
+    asyncio.run(_crawl(inp, out))
+
+
+async def _crawl(inp: str, out: str):
+    urls = []
+    # 1MB 버퍼: 레코드마다 write 시스템 콜이 나가지 않도록
+    with open(out, "ab", buffering=1 << 20) as out_f:
+        for url in iter_urls(inp):
+            if "khan.co.kr" not in url:
+                rec = {"url": url, "error": "not_khan"}
+                out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
                 continue
-            try:
-                if "khan.co.kr" not in url:
-                    rec = {"url": url, "error": "not_khan"}
-                    out_f.write(orjson.dumps(rec) + b"\n")
-                    continue
-                html = fetch(url)
-                rec = parse_khan(url, html)
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.5)
-            except Exception as e:
-                rec = {"url": url, "error": str(e)}
-                out_f.write(orjson.dumps(rec) + b"\n")
-                time.sleep(0.2)
-    out_f.close()
+            urls.append(url)
+        async for rec in crawl(urls, parse_khan, HEADERS, raw=True):
+            out_f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
 
 
 if __name__ == "__main__":
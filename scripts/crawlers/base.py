@@ -5,8 +5,9 @@ Defines the interface that all crawler plugins must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List
 from dataclasses import dataclass
+from urllib.parse import urlparse
 
 
 @dataclass
@@ -77,39 +78,54 @@ class BaseCrawlerPlugin(ABC):
         """
         pass
 
+    def _domain_index(self) -> FrozenSet[str]:
+        """
+        Plugin domains with the www. prefix removed, as a set.
+
+        Rebuilt only when ``domains`` is replaced (e.g. by the registry
+        applying plugin_config.yaml).
+        """
+        cached = self.__dict__.get('_domain_cache')
+        if cached is None or cached[0] is not self.domains:
+            index = frozenset(
+                d[4:] if d.startswith('www.') else d for d in self.domains
+            )
+            cached = (self.domains, index)
+            self._domain_cache = cached
+        return cached[1]
+
     def can_handle(self, url: str) -> bool:
         """
         Check if this plugin can handle the given URL.
 
+        The URL host matches if it, or any parent domain of it, is one of
+        this plugin's domains, so the cost depends on the host's depth rather
+        than on the number of domains.
+
         Args:
             url: Article URL
 
         Returns:
             True if plugin can handle this URL
         """
-        from urllib.parse import urlparse
-
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
+            domains = self._domain_index()
+
+            # Wildcard support
+            if '*' in domains:
+                return True
+
+            domain = urlparse(url).hostname
+            if not domain:
+                return False
 
             # Remove www. prefix for comparison
             if domain.startswith('www.'):
                 domain = domain[4:]
 
-            # Check if domain matches any of this plugin's domains
-            for plugin_domain in self.domains:
-                # Wildcard support
-                if plugin_domain == '*':
-                    return True
-
-                if plugin_domain.startswith('www.'):
-                    plugin_domain = plugin_domain[4:]
-
-                if domain.endswith(plugin_domain):
-                    return True
-
-            return False
+            # Check the host and each parent domain against the index
+            parts = domain.split('.')
+            return any('.'.join(parts[i:]) in domains for i in range(len(parts)))
 
         except Exception:
             return False
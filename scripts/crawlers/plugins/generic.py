@@ -1,13 +1,23 @@
 """
-Generic fallback crawler plugin using Readability.
+Generic fallback crawler plugin using CNR extraction and Readability.
 
 Used when no site-specific plugin matches the URL.
 """
 
 import re
-from bs4 import BeautifulSoup
-from readability import Document
-from dateutil import parser as dateparser
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+import lxml.html
+from lxml import etree
+# readability, bs4 and dateutil are imported where used, so plugin discovery
+# does not pay for them
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional: _html_to_text falls back to lxml
+    LexborHTMLParser = None
 
 import sys
 from pathlib import Path
@@ -16,9 +26,106 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from crawlers.base import BaseCrawlerPlugin, CrawlerResult
 
 
+# Patterns are compiled once at import time rather than per article
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+_STRIP_TAGS = ("script", "style", "noscript", "iframe", "header", "footer", "aside", "nav")
+
+# Raw-text payloads dropped before any parsing; they are often most of the page
+_STRIP_TAGS_RE = re.compile(r'<(script|style|noscript|iframe)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+
+# Common ad/recommendation boxes, matched case-insensitively on the class attribute
+_AD_CLASSES = ("ad", "banner", "recommend", "related", "widget", "sidebar")
+_AD_NODES = etree.XPath(
+    ".//*[re:test(@class, '%s', 'i')]" % "|".join(_AD_CLASSES),
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+_AD_CSS = ",".join('[class*="%s" i]' % c for c in _AD_CLASSES)
+# Same classes as whole class-name parts, so e.g. "read" or "header" don't match
+_AD_TOKEN_NODES = etree.XPath(
+    ".//*[re:test(@class, '(^|[\\s_-])(%s)([\\s_-]|$)', 'i')]" % "|".join(_AD_CLASSES),
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+# Content-to-node ratio (CNR) extraction: the block container with the most
+# non-link text per element wins, among those holding a real share of the text
+_CNR_CONTAINERS = frozenset(["div", "article", "section", "main", "td", "body"])
+_CNR_MIN_CHARS = 200
+_CNR_MIN_SHARE = 0.3
+
+# Page chrome and link lists (related/recommended articles, series indexes,
+# teaser cards) are left out of the scoring and removed from the result
+_CNR_PRUNE_TAGS = frozenset(["aside", "footer", "nav", "header", "form"])
+_CNR_BLOCKS = _CNR_CONTAINERS | frozenset(["ul", "ol", "dl", "table", "figure"])
+_CNR_MAX_LINK_DENSITY = 0.5
+# Blocks inside the chosen one with less text per element than this share of
+# its ratio are widgets (share buttons, toasts, ad slots) and are removed too
+_CNR_MIN_DENSITY_SHARE = 0.1
+
+_BODY_SELECTORS = [
+    (tag, re.compile(class_pattern, re.I))
+    for tag, class_pattern in [
+        ('div', 'article-body'),
+        ('article', 'article'),
+        ('div', 'content'),
+        ('main', 'main'),
+    ]
+]
+
+# The publication date sits in <head> meta or near the top of the article,
+# so only this much of the page is scanned
+_DATE_SCAN_LIMIT = 65536
+
+_PUBLISHED_META_RE = re.compile(
+    r'<meta[^>]+property=["\']article:published_time["\'][^>]*?content=["\']([^"\']+)'
+    r'|<meta[^>]+content=["\']([^"\']+)["\'][^>]*?property=["\']article:published_time',
+    re.I,
+)
+
+_DATE_RE = re.compile(
+    r'(20\d{2}[./-]\d{1,2}[./-]\d{1,2})'  # 2024-01-15 or 2024.01.15
+    r'|(20\d{2}년\s*\d{1,2}월\s*\d{1,2}일)'  # 2024년 1월 15일
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Shapes matched by _DATE_RE (after whitespace is removed)
+_DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y년%m월%d일')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_fast(s: str) -> Optional[str]:
+    """
+    Parse a date string to YYYY-MM-DD.
+
+    ISO timestamps and the known regex shapes are parsed directly; anything
+    else falls back to dateutil. Cached, since pages from one site repeat
+    the same publication dates.
+    """
+    try:
+        return datetime.fromisoformat(s).date().isoformat()
+    except ValueError:
+        pass
+
+    compact = _WHITESPACE_RE.sub('', s)
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(compact, fmt).date().isoformat()
+        except ValueError:
+            continue
+
+    from dateutil import parser as dateparser  # only needed for unusual formats
+
+    try:
+        parsed_date = dateparser.parse(s)
+    except (ValueError, OverflowError):
+        return None
+    return parsed_date.date().isoformat() if parsed_date else None
+
+
 class GenericCrawler(BaseCrawlerPlugin):
     """
-    Generic crawler using Readability for content extraction.
+    Generic crawler using CNR extraction, then Readability, for content.
 
     Falls back to this when no site-specific crawler is available.
     """
@@ -30,7 +137,7 @@ class GenericCrawler(BaseCrawlerPlugin):
 
     def parse(self, url: str, html: str) -> CrawlerResult:
         """
-        Parse article using Readability.
+        Parse article using the CNR extractor, falling back to Readability.
 
         Args:
             url: Article URL
@@ -39,18 +146,29 @@ class GenericCrawler(BaseCrawlerPlugin):
         Returns:
             CrawlerResult with extracted content
         """
-        # Try Readability first
+        # Date from the raw page: JSON-LD datePublished lives in a <script>
+        date = self._extract_date(html)
+
+        # Scripts/styles never contribute text, so don't make lxml parse them
+        html = _STRIP_TAGS_RE.sub('', html)
+
+        # Single-pass CNR extraction first
+        result = self._parse_cnr(html, date)
+        if result is not None:
+            return result
+
+        # Then Readability, on a tree we parse once ourselves
+        # (Readability works on a cleaned copy, so its reparse is skipped)
         try:
-            doc = Document(html)
+            from readability import Document
+
+            doc = Document(self._parse_tree(html))
             content_html = doc.summary(html_partial=True)
             headline = doc.short_title()
 
             # Extract text from HTML
             body_text = self._html_to_text(content_html)
 
-            # Try to extract date
-            date = self._extract_date(html)
-
             return CrawlerResult(
                 headline=headline,
                 body_text=body_text,
@@ -63,6 +181,8 @@ class GenericCrawler(BaseCrawlerPlugin):
 
         except Exception as e:
             # Fallback to basic BeautifulSoup parsing
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(html, "lxml")
 
             headline = ""
@@ -71,14 +191,8 @@ class GenericCrawler(BaseCrawlerPlugin):
 
             # Try common article body selectors
             body_node = None
-            for selector in [
-                ('div', 'article-body'),
-                ('article', 'article'),
-                ('div', 'content'),
-                ('main', 'main')
-            ]:
-                tag, class_pattern = selector
-                body_node = soup.find(tag, class_=re.compile(class_pattern, re.I))
+            for tag, class_re in _BODY_SELECTORS:
+                body_node = soup.find(tag, class_=class_re)
                 if body_node:
                     break
 
@@ -87,7 +201,6 @@ class GenericCrawler(BaseCrawlerPlugin):
                 body_node = soup.body or soup
 
             body_text = self._html_to_text(str(body_node))
-            date = self._extract_date(html)
 
             return CrawlerResult(
                 headline=headline,
@@ -100,6 +213,125 @@ class GenericCrawler(BaseCrawlerPlugin):
                 }
             )
 
+    def _parse_cnr(self, html: str, date: Optional[str] = None) -> Optional[CrawlerResult]:
+        """
+        Parse article with the CNR extractor.
+
+        Args:
+            html: HTML content (scripts/styles already stripped)
+            date: Publication date extracted from the raw page
+
+        Returns:
+            CrawlerResult, or None if no block qualifies (Readability is used then)
+        """
+        from readability.htmls import shorten_title
+
+        try:
+            root = self._parse_tree(html)
+        except (etree.ParserError, ValueError):
+            return None
+
+        node = self._cnr_extract(root)
+        if node is None:
+            return None
+
+        headline = shorten_title(root)  # same title heuristic as Readability
+
+        # Remove unwanted elements and ad boxes from the chosen block only
+        # (link lists and widgets were already dropped by _cnr_extract)
+        etree.strip_elements(node, *_STRIP_TAGS, with_tail=False)
+        for element in _AD_TOKEN_NODES(node):
+            element.drop_tree()
+
+        body_text = self._filter_lines("\n".join(node.itertext()))
+        if not body_text:
+            return None
+
+        return CrawlerResult(
+            headline=headline,
+            body_text=body_text,
+            date=date,
+            metadata={
+                'parser_used': 'cnr',
+                'extractor': 'generic'
+            }
+        )
+
+    @staticmethod
+    def _cnr_extract(root: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+        """
+        Pick the main content block in one post-order walk of the tree.
+
+        Each element's text length, link text length and element count are
+        summed up from its children as the walk leaves it. _CNR_PRUNE_TAGS and
+        blocks that are mostly link text are pruned: they add no non-link text
+        to their parents and are removed from the tree. Among block containers holding
+        at least _CNR_MIN_SHARE of the page text (and _CNR_MIN_CHARS), the one
+        with the highest non-link chars-per-element ratio is returned, with its
+        low-density widget blocks removed.
+        """
+        # One [chars, link_chars, nodes] entry per open element
+        stack = [[0, 0, 0]]
+        candidates = []
+        blocks = {}
+        pruned = []
+
+        for event, element in etree.iterwalk(root, events=("start", "end")):
+            if event == "start":
+                stack.append([0, 0, 1])
+                continue
+
+            entry = stack.pop()
+            parent = stack[-1]
+            tag = element.tag
+            if isinstance(tag, str):  # skip comments and processing instructions
+                entry[0] += len((element.text or "").strip())
+                if tag == "a":
+                    entry[1] = entry[0]
+                elif tag in _CNR_PRUNE_TAGS:
+                    pruned.append(element)
+                    parent[0] += len((element.tail or "").strip())
+                    continue
+                elif tag in _CNR_BLOCKS and entry[1] > _CNR_MAX_LINK_DENSITY * entry[0]:
+                    # Still counted as link text, so a heading wrapped around
+                    # a pruned list is pruned along with it
+                    pruned.append(element)
+                    parent[0] += entry[0] + len((element.tail or "").strip())
+                    parent[1] += entry[0]
+                    continue
+                elif tag in _CNR_BLOCKS:
+                    blocks[element] = entry
+                    if tag in _CNR_CONTAINERS:
+                        candidates.append((element, entry[0] - entry[1], entry[2]))
+
+            parent[0] += entry[0] + len((element.tail or "").strip())
+            parent[1] += entry[1]
+            parent[2] += entry[2]
+
+        total = max((chars for _, chars, _ in candidates), default=0)
+        threshold = max(_CNR_MIN_CHARS, _CNR_MIN_SHARE * total)
+
+        best, best_ratio = None, 0.0
+        for element, chars, nodes in candidates:
+            if chars >= threshold and chars / nodes > best_ratio:
+                best, best_ratio = element, chars / nodes
+
+        if best is None:
+            return None
+
+        widgets = [
+            element for element in best.iterdescendants()
+            if element in blocks
+            and (blocks[element][0] - blocks[element][1])
+            < _CNR_MIN_DENSITY_SHARE * best_ratio * blocks[element][2]
+        ]
+        keep = {best, *best.iterancestors()}
+        for element in pruned + widgets:
+            if element not in keep and element.getparent() is not None:
+                element.drop_tree()
+
+        return best
+
     def _html_to_text(self, html_content: str) -> str:
         """
         Extract clean text from HTML.
@@ -110,26 +342,62 @@ class GenericCrawler(BaseCrawlerPlugin):
         Returns:
             Clean text content
         """
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Remove unwanted elements
-        for element in soup(["script", "style", "noscript", "iframe", "header", "footer", "aside", "nav"]):
-            element.decompose()
+        if LexborHTMLParser is not None:
+            text = self._lexbor_text(html_content)
+        else:
+            text = self._lxml_text(html_content)
 
-        # Remove common ad/recommendation boxes
-        for class_pattern in ["ad", "banner", "recommend", "related", "widget", "sidebar"]:
-            for element in soup.find_all(class_=re.compile(class_pattern, re.I)):
-                element.decompose()
+        return self._filter_lines(text)
 
-        # Extract text
+    @staticmethod
+    def _filter_lines(text: str) -> str:
+        """Strip lines and drop the short ones (captions, buttons, bylines)."""
         text_lines = []
-        for line in soup.get_text("\n").splitlines():
+        for line in text.splitlines():
             line = line.strip()
             if line and len(line) > 10:  # Filter out very short lines
                 text_lines.append(line)
 
         return "\n".join(text_lines)
 
+    @staticmethod
+    def _lexbor_text(html_content: str) -> str:
+        """Strip unwanted elements and ad boxes, then return the text (selectolax)."""
+        tree = LexborHTMLParser(html_content)
+
+        # Remove unwanted elements (text following them is kept)
+        tree.strip_tags(list(_STRIP_TAGS))
+
+        # Remove common ad/recommendation boxes
+        for node in tree.css(_AD_CSS):
+            node.decompose()
+
+        return tree.root.text(separator="\n") if tree.root is not None else ""
+
+    @classmethod
+    def _lxml_text(cls, html_content: str) -> str:
+        """Strip unwanted elements and ad boxes, then return the text (lxml)."""
+        try:
+            root = cls._parse_tree(html_content)
+        except (etree.ParserError, ValueError):
+            return ""  # empty or markup-free fragment
+
+        # Remove unwanted elements (text following them is kept)
+        etree.strip_elements(root, *_STRIP_TAGS, with_tail=False)
+
+        # Remove common ad/recommendation boxes
+        for element in _AD_NODES(root):
+            element.drop_tree()
+
+        return "\n".join(root.itertext())
+
+    @staticmethod
+    def _parse_tree(html: str) -> lxml.html.HtmlElement:
+        """Parse HTML into an lxml tree the same way Readability does."""
+        return lxml.html.document_fromstring(
+            html.encode("utf-8", "replace"), parser=_UTF8_PARSER
+        )
+
     def _extract_date(self, html: str) -> str:
         """
         Try to extract publication date from HTML.
@@ -140,21 +408,14 @@ class GenericCrawler(BaseCrawlerPlugin):
         Returns:
             ISO format date string or None
         """
-        # Try to find date patterns
-        patterns = [
-            r'(20\d{2}[./-]\d{1,2}[./-]\d{1,2})',  # 2024-01-15 or 2024.01.15
-            r'(20\d{2}년\s*\d{1,2}월\s*\d{1,2}일)',  # 2024년 1월 15일
-        ]
+        head = html[:_DATE_SCAN_LIMIT]
 
-        for pattern in patterns:
-            match = re.search(pattern, html)
+        # Prefer the article:published_time meta, then any date-shaped text
+        for pattern in (_PUBLISHED_META_RE, _DATE_RE):
+            match = pattern.search(head)
             if match:
-                try:
-                    date_str = match.group(1)
-                    parsed_date = dateparser.parse(date_str)
-                    if parsed_date:
-                        return parsed_date.date().isoformat()
-                except Exception:
-                    continue
+                date = _parse_date_fast(match.group(1) or match.group(2))
+                if date:
+                    return date
 
         return None
@@ -6,16 +6,44 @@ for a given URL.
 """
 
 import os
+import asyncio
 import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
+import importlib.metadata
 import importlib.util
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 from observability import get_logger
+from _urlutil import hostname
 from .base import BaseCrawlerPlugin, CrawlerResult
 
 logger = get_logger(__name__)
 
+# Installed packages can register plugin classes under this entry-point group
+PLUGIN_ENTRY_POINT_GROUP = 'crawler_plugins'
+
+# Most hosts each registry remembers a plugin selection for
+HOST_CACHE_SIZE = 1024
+
+
+def _plugin_classes() -> List[Type[BaseCrawlerPlugin]]:
+    """All (direct and indirect) subclasses of BaseCrawlerPlugin, in definition order."""
+    classes: List[Type[BaseCrawlerPlugin]] = []
+    pending = list(BaseCrawlerPlugin.__subclasses__())
+    while pending:
+        cls = pending.pop(0)
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
 
 class CrawlerRegistry:
     """
@@ -57,6 +85,14 @@ class CrawlerRegistry:
         # Storage
         self._plugins: Dict[str, BaseCrawlerPlugin] = {}
         self._config: Dict[str, any] = {}
+        self._config_by_name: Dict[str, Dict] = {}
+
+        # Plugins indexed by domain (www. removed), each list highest priority first
+        self._by_domain: Dict[str, List[BaseCrawlerPlugin]] = defaultdict(list)
+        self._wildcard: List[BaseCrawlerPlugin] = []
+
+        # host -> selected plugin, reset whenever the index is rebuilt
+        self._host_cache: Dict[str, Optional[BaseCrawlerPlugin]] = {}
 
         # Load plugins and config
         self._load_config()
@@ -71,8 +107,9 @@ class CrawlerRegistry:
 
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml.load(f, Loader=_YamlLoader) or {}
 
+            self._config_by_name = self._index_config(self._config)
             self.logger.info(f"Loaded config with {len(self._config.get('plugins', []))} plugin configs")
 
         except Exception as e:
@@ -125,16 +162,27 @@ class CrawlerRegistry:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(default_config, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(default_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
 
             self.logger.info(f"Created default config file: {self.config_file}")
             self._config = default_config
+            self._config_by_name = self._index_config(default_config)
 
         except Exception as e:
             self.logger.error("Failed to create default config", exc=e)
 
     def _discover_plugins(self):
-        """Discover and load all plugins from plugins directory."""
+        """
+        Discover and load all plugins.
+
+        Plugins registered as entry points are used when there are any;
+        otherwise the plugins directory is scanned.
+        """
+        if self._discover_entry_point_plugins():
+            self._index_plugins()
+            self.logger.info(f"Discovered {len(self._plugins)} plugins (entry points)")
+            return
+
         if not self.plugins_dir.exists():
             self.logger.warning(f"Plugins directory not found: {self.plugins_dir}")
             self.plugins_dir.mkdir(parents=True, exist_ok=True)
@@ -145,6 +193,12 @@ class CrawlerRegistry:
             if plugin_file.name.startswith('_'):
                 continue
 
+            # Don't import plugins the config explicitly disables (by file name)
+            file_config = self._get_plugin_config(plugin_file.stem)
+            if file_config and not file_config.get('enabled', True):
+                self.logger.info(f"Skipping disabled plugin: {plugin_file.stem}")
+                continue
+
             try:
                 # Load module dynamically
                 module_name = plugin_file.stem
@@ -152,47 +206,109 @@ class CrawlerRegistry:
 
                 if spec and spec.loader:
                     module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
 
-                    # Find plugin classes
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
+                    # Plugin classes are the subclasses that executing the module creates
+                    before = set(_plugin_classes())
+                    spec.loader.exec_module(module)
 
-                        # Check if it's a plugin class (subclass of BaseCrawlerPlugin)
-                        if (isinstance(attr, type) and
-                            issubclass(attr, BaseCrawlerPlugin) and
-                            attr is not BaseCrawlerPlugin):
+                    for plugin_class in _plugin_classes():
+                        if plugin_class not in before:
+                            self._register_plugin_class(plugin_class)
 
-                            # Instantiate plugin
-                            plugin = attr()
+            except Exception as e:
+                self.logger.error(f"Failed to load plugin from {plugin_file}", exc=e)
 
-                            # Apply config overrides
-                            plugin_config = self._get_plugin_config(plugin.name)
+        self._index_plugins()
+        self.logger.info(f"Discovered {len(self._plugins)} plugins")
 
-                            if plugin_config:
-                                plugin.enabled = plugin_config.get('enabled', plugin.enabled)
-                                plugin.priority = plugin_config.get('priority', plugin.priority)
-                                plugin.domains = plugin_config.get('domains', plugin.domains)
+    def _discover_entry_point_plugins(self) -> bool:
+        """
+        Load plugin classes registered under PLUGIN_ENTRY_POINT_GROUP.
 
-                            # Register plugin if enabled
-                            if plugin.enabled:
-                                self._plugins[plugin.name] = plugin
-                                self.logger.info(f"Loaded plugin: {plugin.name} (priority={plugin.priority})")
+        Returns:
+            True if any entry points were found
+        """
+        all_entry_points = importlib.metadata.entry_points()
+        if hasattr(all_entry_points, 'select'):
+            entry_points = all_entry_points.select(group=PLUGIN_ENTRY_POINT_GROUP)
+        else:
+            # Python < 3.10 returns a dict of group -> entry points
+            entry_points = all_entry_points.get(PLUGIN_ENTRY_POINT_GROUP, [])
+        if not entry_points:
+            return False
+
+        for ep in entry_points:
+            # Don't import plugins the config explicitly disables
+            ep_config = self._get_plugin_config(ep.name)
+            if ep_config and not ep_config.get('enabled', True):
+                self.logger.info(f"Skipping disabled plugin: {ep.name}")
+                continue
 
+            try:
+                plugin_class = ep.load()
             except Exception as e:
-                self.logger.error(f"Failed to load plugin from {plugin_file}", exc=e)
+                self.logger.error(f"Failed to load plugin entry point {ep.value}: {e}")
+                continue
 
-        self.logger.info(f"Discovered {len(self._plugins)} plugins")
+            if isinstance(plugin_class, type) and issubclass(plugin_class, BaseCrawlerPlugin):
+                self._register_plugin_class(plugin_class)
+            else:
+                self.logger.warning(f"Entry point {ep.value} is not a BaseCrawlerPlugin subclass")
 
-    def _get_plugin_config(self, plugin_name: str) -> Optional[Dict]:
-        """Get configuration for a specific plugin."""
-        plugins_config = self._config.get('plugins', [])
+        return True
+
+    def _register_plugin_class(self, plugin_class: Type[BaseCrawlerPlugin]):
+        """Instantiate a plugin, apply config overrides and register it if enabled."""
+        plugin = plugin_class()
+
+        # Apply config overrides
+        plugin_config = self._get_plugin_config(plugin.name)
+
+        if plugin_config:
+            plugin.enabled = plugin_config.get('enabled', plugin.enabled)
+            plugin.priority = plugin_config.get('priority', plugin.priority)
+            plugin.domains = plugin_config.get('domains', plugin.domains)
+
+        # Register plugin if enabled
+        if plugin.enabled:
+            self._plugins[plugin.name] = plugin
+            self.logger.info(f"Loaded plugin: {plugin.name} (priority={plugin.priority})")
 
-        for plugin_config in plugins_config:
-            if plugin_config.get('name') == plugin_name:
-                return plugin_config
+    def _index_plugins(self):
+        """Rebuild the domain -> plugins index used by get_plugin_for_url."""
+        by_domain: Dict[str, List[BaseCrawlerPlugin]] = defaultdict(list)
+        wildcard: List[BaseCrawlerPlugin] = []
 
-        return None
+        for plugin in self._plugins.values():
+            for domain in plugin.domains:
+                if domain == '*':
+                    wildcard.append(plugin)
+                    continue
+                if domain.startswith('www.'):
+                    domain = domain[4:]
+                if plugin not in by_domain[domain]:
+                    by_domain[domain].append(plugin)
+
+        # Stable sort, so equal priorities keep registration order
+        for plugins in by_domain.values():
+            plugins.sort(key=lambda p: -p.priority)
+        wildcard.sort(key=lambda p: -p.priority)
+
+        self._by_domain = by_domain
+        self._wildcard = wildcard
+        self._host_cache = {}
+
+    @staticmethod
+    def _index_config(config: Dict) -> Dict[str, Dict]:
+        """Map plugin name -> plugin config (first entry wins, as before)."""
+        by_name: Dict[str, Dict] = {}
+        for plugin_config in config.get('plugins', []):
+            by_name.setdefault(plugin_config.get('name'), plugin_config)
+        return by_name
+
+    def _get_plugin_config(self, plugin_name: str) -> Optional[Dict]:
+        """Get configuration for a specific plugin."""
+        return self._config_by_name.get(plugin_name)
 
     def get_plugin_for_url(self, url: str) -> Optional[BaseCrawlerPlugin]:
         """
@@ -209,25 +325,125 @@ class CrawlerRegistry:
             if plugin:
                 result = plugin.parse(url, html)
         """
-        # Find all plugins that can handle this URL
-        matching_plugins = [
-            plugin for plugin in self._plugins.values()
-            if plugin.can_handle(url)
-        ]
+        try:
+            host = hostname(url) or ''
+        except ValueError:
+            host = ''
+        if host.startswith('www.'):
+            host = host[4:]
+
+        selected = self._pick_plugin_by_host(host)
 
-        if not matching_plugins:
+        if selected is None:
             self.logger.warning(f"No plugin found for URL: {url}")
             return None
 
-        # Sort by priority (highest first)
-        matching_plugins.sort(key=lambda p: p.priority, reverse=True)
+        self.logger.info(f"Selected plugin '{selected.name}' for URL: {url[:50]}...")
 
-        selected = matching_plugins[0]
+        return selected
 
-        self.logger.info(f"Selected plugin '{selected.name}' for URL: {url[:50]}...")
+    def _pick_plugin_by_host(self, host: str) -> Optional[BaseCrawlerPlugin]:
+        """
+        Select the plugin for a host (www. already removed).
 
+        Cached in self._host_cache; cleared whenever the index is rebuilt.
+        """
+        try:
+            return self._host_cache[host]
+        except KeyError:
+            pass
+
+        selected = None
+
+        # Look up the host, then each parent domain (a.b.c -> b.c -> c)
+        parts = host.split('.') if host else []
+        for i in range(len(parts)):
+            plugins = self._by_domain.get('.'.join(parts[i:]))
+            if plugins:
+                selected = plugins[0]
+                break
+
+        # Wildcard plugins only win over a domain match on higher priority
+        if self._wildcard and (selected is None or self._wildcard[0].priority > selected.priority):
+            selected = self._wildcard[0]
+
+        if len(self._host_cache) >= HOST_CACHE_SIZE:
+            self._host_cache.clear()
+        self._host_cache[host] = selected
         return selected
 
+    def _parse_one(self, url: str, html: str) -> Optional[CrawlerResult]:
+        """Select a plugin and parse one page; None if no plugin or parsing fails."""
+        plugin = self.get_plugin_for_url(url)
+        if plugin is None:
+            return None
+
+        try:
+            return plugin.parse(url, html)
+        except Exception as e:
+            self.logger.error(f"Plugin '{plugin.name}' failed to parse {url[:50]}: {e}")
+            return None
+
+    def parse_many(self, items: Iterable[Tuple[str, str]],
+                   max_workers: int = 8) -> List[Optional[CrawlerResult]]:
+        """
+        Parse many already-fetched pages on a thread pool.
+
+        lxml does its parsing in C with the GIL released, so threads overlap
+        the heavy part of each parse.
+
+        Args:
+            items: (url, html) pairs
+            max_workers: Number of worker threads
+
+        Returns:
+            Results in input order (None where no plugin matched or parsing failed)
+
+        Example:
+            results = registry.parse_many([(url, html), ...])
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self._parse_one, url, html) for url, html in items]
+            return [future.result() for future in futures]
+
+    async def aparse_many(self, urls: Iterable[str],
+                          fetch: Callable[[str], Awaitable[str]],
+                          concurrency: int = 8) -> List[Optional[CrawlerResult]]:
+        """
+        Fetch and parse many URLs, with at most `concurrency` in flight.
+
+        Parsing runs on the event loop's default executor so it does not
+        block other fetches.
+
+        Args:
+            urls: Article URLs
+            fetch: Async callable returning the HTML for a URL
+            concurrency: Maximum number of URLs fetched/parsed at once
+
+        Returns:
+            Results in input order (None where fetching or parsing failed)
+
+        Example:
+            results = await registry.aparse_many(urls, fetch_html)
+        """
+        sem = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def run(url: str) -> Optional[CrawlerResult]:
+            async with sem:
+                try:
+                    html = await fetch(url)
+                except Exception as e:
+                    self.logger.error(f"Failed to fetch {url[:50]}: {e}")
+                    return None
+                return await loop.run_in_executor(None, self._parse_one, url, html)
+
+        return await asyncio.gather(*(run(url) for url in urls))
+
     def get_plugin(self, name: str) -> Optional[BaseCrawlerPlugin]:
         """
         Get plugin by name.
@@ -266,5 +482,6 @@ class CrawlerRegistry:
         """Reload plugins from disk."""
         self.logger.info("Reloading plugins")
         self._plugins.clear()
+        self._index_plugins()
         self._load_config()
         self._discover_plugins()
@@ -7,9 +7,11 @@ Provides:
 - Database initialization and migration support
 """
 
-from .models import RequestLog, AnalysisResult, ProviderMetric, FeatureFlag, Base
-from .repository import AnalyticsRepository
-from .init_db import init_database, get_session, get_engine, session_scope, check_database_health
+from .models import RequestLog, AnalysisResult, ProviderMetric, FeatureFlag, Base, content_hash
+from .repository import AnalyticsRepository, AnalyticsLogBuffer, get_log_buffer
+from .init_db import (
+    init_database, get_session, get_engine, session_scope, bulk_session_scope, check_database_health
+)
 
 __all__ = [
     'RequestLog',
@@ -17,10 +19,14 @@ __all__ = [
     'ProviderMetric',
     'FeatureFlag',
     'Base',
+    'content_hash',
     'AnalyticsRepository',
+    'AnalyticsLogBuffer',
+    'get_log_buffer',
     'init_database',
     'get_session',
     'get_engine',
     'session_scope',
+    'bulk_session_scope',
     'check_database_health',
 ]
@@ -8,11 +8,15 @@ Provides functions for:
 """
 
 from pathlib import Path
-from sqlalchemy import create_engine
+
+import orjson
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 
-from .models import Base
+from .models import Base, FeatureFlag, RequestLog, AnalysisResult, ProviderMetric
 from config import settings
 from observability import get_logger
 
@@ -22,6 +26,33 @@ logger = get_logger(__name__)
 _engine = None
 _SessionFactory = None
 
+# Applied to every new SQLite connection. WAL with synchronous=NORMAL avoids an
+# fsync per commit on the request-log write path, which is an acceptable
+# durability trade-off for analytics data.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _json_dumps(obj) -> str:
+    """Serializer for JSON columns."""
+    return orjson.dumps(obj).decode()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connection event hook that applies SQLITE_PRAGMAS."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def get_engine():
     """Get or create SQLAlchemy engine."""
@@ -37,8 +68,15 @@ def get_engine():
         _engine = create_engine(
             database_url,
             echo=settings.database.echo,
-            connect_args={'check_same_thread': False}  # Needed for SQLite
+            connect_args={'check_same_thread': False},  # Needed for SQLite
+            poolclass=QueuePool,
+            pool_size=settings.database.pool_size,
+            max_overflow=10,
+            query_cache_size=1200,  # compiled-SQL cache (default 500)
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
         )
+        event.listen(_engine, "connect", _apply_sqlite_pragmas)
 
         logger.info(f"Database engine created: {settings.database.path}")
 
@@ -101,6 +139,137 @@ def session_scope():
         session.close()
 
 
+class BulkWriter:
+    """
+    Buffers new ORM objects and writes them to a session in batches.
+
+    Used through bulk_session_scope(); objects are inserted with
+    bulk_save_objects, so they are not attached to the session afterwards.
+    """
+
+    def __init__(self, session: Session, batch_size: int):
+        self.session = session
+        self.batch_size = batch_size
+        self._pending = []
+
+    def add(self, obj):
+        """Queue one object, flushing the buffer when it reaches batch_size."""
+        self._pending.append(obj)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_all(self, objs):
+        """Queue several objects."""
+        for obj in objs:
+            self.add(obj)
+
+    def flush(self):
+        """Write the buffered objects (no commit)."""
+        if self._pending:
+            self.session.bulk_save_objects(self._pending)
+            self._pending.clear()
+
+
+@contextmanager
+def bulk_session_scope(batch_size: int = 500):
+    """
+    Context manager for high-volume inserts with a single commit.
+
+    Objects are written every `batch_size` adds and committed once on exit;
+    everything is rolled back on error.
+
+    Args:
+        batch_size: Number of buffered objects per bulk write
+
+    Yields:
+        BulkWriter (its session is available as .session)
+
+    Example:
+        with bulk_session_scope() as writer:
+            for log in logs:
+                writer.add(RequestLog(**log))
+            # One commit on exit
+    """
+    session = get_session()
+    writer = BulkWriter(session, batch_size)
+    try:
+        yield writer
+        writer.flush()
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+# Tables whose DateTime column was replaced by an epoch-milliseconds column:
+# model -> (old column, new column)
+_EPOCH_MS_MIGRATIONS = (
+    (RequestLog, 'timestamp', 'timestamp_ms'),
+    (AnalysisResult, 'timestamp', 'timestamp_ms'),
+    (ProviderMetric, 'hour_bucket', 'hour_bucket_ms'),
+)
+
+
+def _migrate_epoch_ms_columns(engine):
+    """
+    Rebuild tables created before timestamps were stored as epoch ms.
+
+    SQLite cannot change a column in place, so each outdated table is renamed,
+    recreated from the current model (with its indexes), refilled with the old
+    DateTime values converted to UTC epoch ms, and the old copy dropped. All
+    tables are migrated in one transaction.
+
+    Raises:
+        RuntimeError: If a table has neither the old nor the new column
+    """
+    with engine.begin() as conn:
+        # Keep FOREIGN KEY ... REFERENCES request_log pointing at the new table
+        conn.exec_driver_sql("PRAGMA legacy_alter_table=ON")
+
+        for model, old_column, new_column in _EPOCH_MS_MIGRATIONS:
+            table = model.__table__
+            columns = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")
+            }
+            if not columns or new_column in columns:
+                continue
+            if old_column not in columns:
+                raise RuntimeError(
+                    f"Table {table.name} has neither {old_column} nor {new_column}; "
+                    f"cannot migrate {settings.database.path}. Move the database "
+                    f"aside or run init_database(reset=True) to recreate it."
+                )
+
+            logger.warning(f"Migrating {table.name}.{old_column} to {new_column}")
+            legacy_name = f"{table.name}_legacy"
+
+            # Old indexes follow the renamed table and would clash by name
+            index_names = conn.execute(
+                text("SELECT name FROM sqlite_master "
+                     "WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"),
+                {'table': table.name}
+            ).scalars().all()
+            for name in index_names:
+                conn.exec_driver_sql(f'DROP INDEX "{name}"')
+
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {legacy_name}")
+            table.create(conn)
+
+            copied = [c.name for c in table.columns if c.name in columns]
+            column_list = ", ".join(copied)
+            conn.exec_driver_sql(
+                f"INSERT INTO {table.name} ({column_list}, {new_column}) "
+                f"SELECT {column_list}, "
+                f"CAST(ROUND((julianday({old_column}) - 2440587.5) * 86400000) AS INTEGER) "
+                f"FROM {legacy_name}"
+            )
+            conn.exec_driver_sql(f"DROP TABLE {legacy_name}")
+
+        conn.exec_driver_sql("PRAGMA legacy_alter_table=OFF")
+
+
 def init_database(reset: bool = False):
     """
     Initialize the database schema.
@@ -119,6 +288,17 @@ def init_database(reset: bool = False):
     if reset:
         logger.warning("Dropping all database tables (reset=True)")
         Base.metadata.drop_all(engine)
+    else:
+        # Bring databases from before the epoch-ms columns up to date
+        try:
+            _migrate_epoch_ms_columns(engine)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Could not migrate {settings.database.path} to the current schema: {e}. "
+                f"Move the database aside or run init_database(reset=True) to recreate it."
+            ) from e
 
     # Create all tables
     Base.metadata.create_all(engine)
@@ -130,8 +310,6 @@ def init_database(reset: bool = False):
 
 def _initialize_default_flags():
     """Initialize default feature flags if they don't exist."""
-    from .repository import AnalyticsRepository
-
     default_flags = [
         {
             'flag_name': 'cache_enabled',
@@ -155,18 +333,16 @@ def _initialize_default_flags():
         },
     ]
 
+    # One INSERT ... ON CONFLICT DO NOTHING; existing flags keep their values
+    stmt = sqlite_insert(FeatureFlag).values(default_flags).on_conflict_do_nothing(
+        index_elements=['flag_name']
+    )
+
     with session_scope() as session:
-        repo = AnalyticsRepository(session)
-
-        for flag_data in default_flags:
-            existing = repo.get_feature_flag(flag_data['flag_name'])
-            if not existing:
-                repo.set_feature_flag(
-                    flag_name=flag_data['flag_name'],
-                    enabled=flag_data['enabled'],
-                    description=flag_data['description']
-                )
-                logger.info(f"Initialized feature flag: {flag_data['flag_name']}")
+        result = session.execute(stmt)
+
+    if result.rowcount:
+        logger.info(f"Initialized {result.rowcount} default feature flags")
 
 
 def check_database_health() -> dict:
@@ -180,7 +356,7 @@ def check_database_health() -> dict:
         with session_scope() as session:
             # Try a simple query
             from .models import FeatureFlag
-            count = session.query(FeatureFlag).count()
+            count = session.execute(select(func.count()).select_from(FeatureFlag)).scalar_one()
 
             return {
                 'status': 'healthy',
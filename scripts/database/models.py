@@ -8,13 +8,50 @@ Defines tables for:
 - Feature flags configuration
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Index
+import hashlib
+import time
+from datetime import datetime, timezone
+
+import orjson
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, Text, JSON, ForeignKey, Index, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 Base = declarative_base()
 
+# JSON columns are stored as TEXT in SQLite and (de)serialized by the engine
+# (orjson, see init_db.get_engine). Python None is stored as SQL NULL.
+JSONColumn = JSON(none_as_null=True)
+
+
+def now_ms() -> int:
+    """Current time as integer epoch milliseconds (UTC)."""
+    return int(time.time() * 1000)
+
+
+def to_epoch_ms(dt: datetime) -> int:
+    """Convert a datetime to epoch milliseconds; naive values are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def decode_json_text(value):
+    """
+    Decode a value given as an already-encoded JSON string.
+
+    Columns that used to be Text took JSON strings; a JSON column would store
+    such a string as a JSON string literal, so it is decoded first.
+    """
+    if isinstance(value, (str, bytes)):
+        return orjson.loads(value)
+    return value
+
+
+def content_hash(text: str) -> str:
+    """128-bit BLAKE2b hex digest of an article text (analysis memo key)."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class RequestLog(Base):
     """
@@ -28,21 +65,29 @@ class RequestLog(Base):
     correlation_id = Column(String(50), unique=True, nullable=False, index=True)
     url = Column(Text, nullable=False)
     mode = Column(String(20), nullable=False)  # 'single' or 'consensus'
-    providers = Column(Text)  # JSON array of provider names
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    providers = Column(JSONColumn)  # List of provider names
+    timestamp_ms = Column(BigInteger, default=now_ms, nullable=False)  # Epoch milliseconds (UTC)
     status = Column(String(20), nullable=False)  # 'success', 'error', 'partial'
     duration_ms = Column(Integer)
     error_message = Column(Text)
     error_type = Column(String(100))
 
+    @validates('providers')
+    def _decode_providers(self, key, value):
+        """Accept providers given as a JSON string, as the old Text column did."""
+        return decode_json_text(value)
+
     # Relationship to analysis results
     analysis_results = relationship("AnalysisResult", back_populates="request", cascade="all, delete-orphan")
 
-    # Indexes for common queries
+    # Indexes for common queries (status/mode filters are ordered or ranged by time)
     __table_args__ = (
-        Index('idx_request_timestamp', 'timestamp'),
-        Index('idx_request_status', 'status'),
-        Index('idx_request_mode', 'mode'),
+        # Time-range scans that also filter or count by status/mode (prefix serves cleanup)
+        Index('idx_request_ts_status_mode', 'timestamp_ms', 'status', 'mode'),
+        Index('idx_request_status_ts', 'status', 'timestamp_ms'),
+        Index('idx_request_mode_ts', 'mode', 'timestamp_ms'),
+        # Partial index over the (rare) error rows only, for error breakdowns
+        Index('idx_request_errors', 'timestamp_ms', sqlite_where=text("status = 'error'")),
     )
 
     def __repr__(self):
@@ -59,23 +104,29 @@ class AnalysisResult(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     correlation_id = Column(String(50), ForeignKey('request_log.correlation_id'), nullable=False, index=True)
-    provider = Column(String(50), nullable=False, index=True)
+    provider = Column(String(50), nullable=False)
     sentence_count = Column(Integer)
     model_name = Column(String(100))
     success = Column(Boolean, default=True, nullable=False)
     error_type = Column(String(100))
     error_message = Column(Text)
     latency_ms = Column(Integer)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    content_hash = Column(String(32))  # content_hash() of the analyzed article text
+    sentences = Column(JSONColumn)  # {sentence: reason}, reused for repeat articles
+    timestamp_ms = Column(BigInteger, default=now_ms, nullable=False)  # Epoch milliseconds (UTC)
 
     # Relationship to request log
     request = relationship("RequestLog", back_populates="analysis_results")
 
     # Indexes
     __table_args__ = (
-        Index('idx_analysis_provider', 'provider'),
-        Index('idx_analysis_timestamp', 'timestamp'),
+        Index('idx_analysis_provider_success_ts', 'provider', 'success', 'timestamp_ms'),
+        Index('idx_analysis_provider_ts', 'provider', 'timestamp_ms'),
+        Index('idx_analysis_timestamp', 'timestamp_ms'),
         Index('idx_analysis_success', 'success'),
+        Index('idx_analysis_content_hash', 'content_hash', 'provider'),
+        # Partial index over failed analyses only
+        Index('idx_analysis_failures', 'provider', 'timestamp_ms', sqlite_where=text('success = 0')),
     )
 
     def __repr__(self):
@@ -91,25 +142,24 @@ class ProviderMetric(Base):
     __tablename__ = 'provider_metrics'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    provider = Column(String(50), nullable=False, index=True)
-    hour_bucket = Column(DateTime, nullable=False, index=True)  # Hourly aggregation
+    provider = Column(String(50), nullable=False)
+    hour_bucket_ms = Column(BigInteger, nullable=False)  # Hourly aggregation, epoch milliseconds of the hour start
     total_requests = Column(Integer, default=0)
     successful_requests = Column(Integer, default=0)
     failed_requests = Column(Integer, default=0)
     avg_latency_ms = Column(Float)
-    error_types = Column(Text)  # JSON object of error type counts
+    error_types = Column(JSONColumn)  # {error type: count}
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    # Unique constraint on provider + hour_bucket
+    # Unique constraint on provider + hour_bucket (also serves provider lookups)
     __table_args__ = (
-        Index('idx_provider_metrics_unique', 'provider', 'hour_bucket', unique=True),
-        Index('idx_provider_metrics_provider', 'provider'),
-        Index('idx_provider_metrics_hour', 'hour_bucket'),
+        Index('idx_provider_metrics_unique', 'provider', 'hour_bucket_ms', unique=True),
+        Index('idx_provider_metrics_hour', 'hour_bucket_ms'),
     )
 
     def __repr__(self):
-        return f"<ProviderMetric(provider='{self.provider}', hour_bucket='{self.hour_bucket}', total={self.total_requests})>"
+        return f"<ProviderMetric(provider='{self.provider}', hour_bucket_ms={self.hour_bucket_ms}, total={self.total_requests})>"
 
 
 class FeatureFlag(Base):
@@ -123,7 +173,7 @@ class FeatureFlag(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     flag_name = Column(String(100), unique=True, nullable=False, index=True)
     enabled = Column(Boolean, default=False, nullable=False)
-    config = Column(Text)  # JSON configuration
+    config = Column(JSONColumn)  # Configuration dict
     description = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
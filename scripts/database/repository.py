@@ -4,17 +4,47 @@ Repository pattern for database access.
 Provides a clean interface for querying and persisting analytics data.
 """
 
+import atexit
+import threading
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-import json
+from sqlalchemy import func, desc, insert, delete, select, bindparam, case
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from .models import RequestLog, AnalysisResult, ProviderMetric, FeatureFlag
+from .models import (
+    RequestLog, AnalysisResult, ProviderMetric, FeatureFlag, now_ms, to_epoch_ms, decode_json_text
+)
+from .init_db import get_session
 from observability import get_logger
 
 logger = get_logger(__name__)
 
+HOUR_MS = 3600 * 1000
+
+# Rows removed per transaction by cleanup_old_records
+CLEANUP_CHUNK_SIZE = 10000
+
+# Hot lookups built once; bound parameters keep their compiled SQL cached
+_REQUEST_BY_CID = select(RequestLog).where(RequestLog.correlation_id == bindparam('cid')).limit(1)
+_ANALYSES_BY_CID = select(AnalysisResult).where(AnalysisResult.correlation_id == bindparam('cid'))
+_FLAG_BY_NAME = select(FeatureFlag).where(FeatureFlag.flag_name == bindparam('name')).limit(1)
+_ALL_FLAGS = select(FeatureFlag)
+# Sentences are only stored for successful analyses, so no success filter
+# (which would also steer SQLite onto idx_analysis_success)
+_SENTENCES_BY_HASH = (
+    select(AnalysisResult.sentences)
+    .where(
+        AnalysisResult.content_hash == bindparam('hash'),
+        AnalysisResult.provider == bindparam('provider'),
+        AnalysisResult.model_name == bindparam('model_name'),
+        AnalysisResult.timestamp_ms >= bindparam('since_ms'),
+        AnalysisResult.sentences.is_not(None),
+    )
+    .order_by(AnalysisResult.id.desc())
+    .limit(1)
+)
+
 
 class AnalyticsRepository:
     """
@@ -51,7 +81,7 @@ class AnalyticsRepository:
             correlation_id: Unique request ID
             url: Article URL
             mode: Analysis mode ('single' or 'consensus')
-            providers: List of provider names
+            providers: List of provider names (a JSON-encoded list is decoded)
             status: Request status ('success', 'error', 'partial')
             duration_ms: Request duration in milliseconds
             error_message: Optional error message
@@ -64,7 +94,7 @@ class AnalyticsRepository:
             correlation_id=correlation_id,
             url=url,
             mode=mode,
-            providers=json.dumps(providers),
+            providers=providers,
             status=status,
             duration_ms=duration_ms,
             error_message=error_message,
@@ -87,7 +117,9 @@ class AnalyticsRepository:
         success: bool = True,
         error_type: Optional[str] = None,
         error_message: Optional[str] = None,
-        latency_ms: Optional[int] = None
+        latency_ms: Optional[int] = None,
+        content_hash: Optional[str] = None,
+        sentences: Optional[Dict[str, str]] = None
     ) -> AnalysisResult:
         """
         Log an LLM analysis result.
@@ -101,6 +133,9 @@ class AnalyticsRepository:
             error_type: Optional error type
             error_message: Optional error message
             latency_ms: Provider latency in milliseconds
+            content_hash: Optional content_hash() of the article text
+            sentences: Optional selected sentences of a successful analysis,
+                stored for get_cached_sentences
 
         Returns:
             Created AnalysisResult instance
@@ -113,7 +148,9 @@ class AnalyticsRepository:
             success=success,
             error_type=error_type,
             error_message=error_message,
-            latency_ms=latency_ms
+            latency_ms=latency_ms,
+            content_hash=content_hash,
+            sentences=sentences
         )
 
         self.session.add(analysis_result)
@@ -142,14 +179,14 @@ class AnalyticsRepository:
         Returns:
             List of RequestLog instances
         """
-        query = self.session.query(RequestLog).order_by(desc(RequestLog.timestamp))
+        stmt = select(RequestLog).order_by(desc(RequestLog.timestamp_ms))
 
         if status:
-            query = query.filter(RequestLog.status == status)
+            stmt = stmt.where(RequestLog.status == status)
         if mode:
-            query = query.filter(RequestLog.mode == mode)
+            stmt = stmt.where(RequestLog.mode == mode)
 
-        return query.limit(limit).offset(offset).all()
+        return self.session.execute(stmt.limit(limit).offset(offset)).scalars().all()
 
     def get_request_by_correlation_id(self, correlation_id: str) -> Optional[RequestLog]:
         """
@@ -161,9 +198,7 @@ class AnalyticsRepository:
         Returns:
             RequestLog instance or None
         """
-        return self.session.query(RequestLog).filter(
-            RequestLog.correlation_id == correlation_id
-        ).first()
+        return self.session.execute(_REQUEST_BY_CID, {'cid': correlation_id}).scalar_one_or_none()
 
     def get_request_stats(
         self,
@@ -180,49 +215,63 @@ class AnalyticsRepository:
         Returns:
             Dictionary with request statistics
         """
-        query = self.session.query(RequestLog)
-
+        conditions = []
         if since:
-            query = query.filter(RequestLog.timestamp >= since)
+            conditions.append(RequestLog.timestamp_ms >= to_epoch_ms(since))
         if mode:
-            query = query.filter(RequestLog.mode == mode)
-
-        requests = query.all()
-
-        if not requests:
+            conditions.append(RequestLog.mode == mode)
+
+        # Counts and average in one aggregate pass (no rows are loaded)
+        def status_count(status):
+            return func.sum(case((RequestLog.status == status, 1), else_=0))
+
+        row = self.session.execute(
+            select(
+                func.count(),
+                status_count('success'),
+                status_count('error'),
+                status_count('partial'),
+                func.count(RequestLog.duration_ms),
+                func.avg(RequestLog.duration_ms),
+            ).where(*conditions)
+        ).one()
+        total, successful, failed, partial, duration_count, avg_duration = row
+
+        if not total:
             return {}
 
-        total = len(requests)
-        successful = sum(1 for r in requests if r.status == 'success')
-        failed = sum(1 for r in requests if r.status == 'error')
-        partial = sum(1 for r in requests if r.status == 'partial')
-
-        durations = [r.duration_ms for r in requests if r.duration_ms is not None]
-
-        if durations:
-            durations_sorted = sorted(durations)
-            avg_duration = sum(durations) / len(durations)
-            p50_idx = int(len(durations_sorted) * 0.5)
-            p95_idx = int(len(durations_sorted) * 0.95)
-            p99_idx = int(len(durations_sorted) * 0.99)
-
-            return {
-                'total_requests': total,
-                'successful_requests': successful,
-                'failed_requests': failed,
-                'partial_requests': partial,
-                'avg_duration_ms': avg_duration,
-                'p50_duration_ms': durations_sorted[p50_idx],
-                'p95_duration_ms': durations_sorted[p95_idx],
-                'p99_duration_ms': durations_sorted[p99_idx]
-            }
-        else:
-            return {
-                'total_requests': total,
-                'successful_requests': successful,
-                'failed_requests': failed,
-                'partial_requests': partial
+        stats = {
+            'total_requests': total,
+            'successful_requests': successful,
+            'failed_requests': failed,
+            'partial_requests': partial
+        }
+
+        if duration_count:
+            # Nearest-rank percentiles: the durations at sorted positions int(n * q),
+            # picked in SQL with one window-function sort
+            positions = {
+                'p50_duration_ms': int(duration_count * 0.5),
+                'p95_duration_ms': int(duration_count * 0.95),
+                'p99_duration_ms': int(duration_count * 0.99),
             }
+            ranked = select(
+                RequestLog.duration_ms,
+                (func.row_number().over(order_by=RequestLog.duration_ms) - 1).label('pos')
+            ).where(RequestLog.duration_ms.is_not(None), *conditions).subquery()
+
+            rows = self.session.execute(
+                select(ranked.c.duration_ms, ranked.c.pos).where(
+                    ranked.c.pos.in_(set(positions.values()))
+                )
+            )
+            by_pos = {pos: duration for duration, pos in rows}
+
+            stats['avg_duration_ms'] = avg_duration
+            for key, pos in positions.items():
+                stats[key] = by_pos[pos]
+
+        return stats
 
     def get_analyses_by_correlation_id(self, correlation_id: str) -> List[AnalysisResult]:
         """
@@ -234,9 +283,33 @@ class AnalyticsRepository:
         Returns:
             List of AnalysisResult instances
         """
-        return self.session.query(AnalysisResult).filter(
-            AnalysisResult.correlation_id == correlation_id
-        ).all()
+        return list(self.session.scalars(_ANALYSES_BY_CID, {'cid': correlation_id}))
+
+    def get_cached_sentences(
+        self,
+        content_hash: str,
+        provider: str,
+        model_name: str,
+        max_age_seconds: int
+    ) -> Optional[Dict[str, str]]:
+        """
+        Get the sentences from the latest successful analysis of the same article text.
+
+        Args:
+            content_hash: content_hash() of the article text
+            provider: LLM provider name
+            model_name: Model the analysis must have been made with
+            max_age_seconds: Ignore analyses older than this
+
+        Returns:
+            Sentence -> reason mapping, or None if no recent analysis matches
+        """
+        return self.session.execute(_SENTENCES_BY_HASH, {
+            'hash': content_hash,
+            'provider': provider,
+            'model_name': model_name,
+            'since_ms': now_ms() - max_age_seconds * 1000,
+        }).scalar_one_or_none()
 
     def get_error_breakdown(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
@@ -248,31 +321,18 @@ class AnalyticsRepository:
         Returns:
             List of dictionaries with error statistics
         """
-        query = self.session.query(RequestLog).filter(
-            RequestLog.status == 'error'
-        )
-
-        if since:
-            query = query.filter(RequestLog.timestamp >= since)
+        error_type = func.coalesce(RequestLog.error_type, 'Unknown')
 
-        error_requests = query.all()
+        stmt = select(
+            error_type.label('error_type'),
+            func.count().label('count'),
+            func.min(RequestLog.error_message).label('sample_message')
+        ).where(RequestLog.status == 'error').group_by(error_type)
 
-        # Group by error type
-        error_types: Dict[str, Dict[str, Any]] = {}
-
-        for req in error_requests:
-            error_type = req.error_type or 'Unknown'
-
-            if error_type not in error_types:
-                error_types[error_type] = {
-                    'error_type': error_type,
-                    'count': 0,
-                    'sample_message': req.error_message
-                }
-
-            error_types[error_type]['count'] += 1
+        if since:
+            stmt = stmt.where(RequestLog.timestamp_ms >= to_epoch_ms(since))
 
-        return list(error_types.values())
+        return [dict(row._mapping) for row in self.session.execute(stmt)]
 
     def get_provider_stats(
         self,
@@ -294,68 +354,24 @@ class AnalyticsRepository:
         if not since:
             since = datetime.utcnow() - timedelta(hours=hours)
 
-        query = self.session.query(AnalysisResult).filter(
-            AnalysisResult.timestamp >= since
-        )
-
-        if provider:
-            query = query.filter(AnalysisResult.provider == provider)
-
-        results = query.all()
+        total = func.count()
 
-        if not results:
-            return []
+        # avg() skips NULL latencies; missing sentence counts count as 0
+        stmt = select(
+            AnalysisResult.provider.label('provider'),
+            total.label('total_analyses'),
+            func.sum(case((AnalysisResult.success, 1), else_=0)).label('successful_analyses'),
+            func.sum(case((AnalysisResult.success, 0), else_=1)).label('failed_analyses'),
+            func.coalesce(func.avg(AnalysisResult.latency_ms), 0).label('avg_latency_ms'),
+            (func.coalesce(func.sum(AnalysisResult.sentence_count), 0) * 1.0 / total).label('avg_sentences')
+        ).where(
+            AnalysisResult.timestamp_ms >= to_epoch_ms(since)
+        ).group_by(AnalysisResult.provider)
 
-        # Group by provider
-        provider_stats: Dict[str, Dict[str, Any]] = {}
-
-        for result in results:
-            prov = result.provider
-
-            if prov not in provider_stats:
-                provider_stats[prov] = {
-                    'provider': prov,
-                    'total_analyses': 0,
-                    'successful_analyses': 0,
-                    'failed_analyses': 0,
-                    'total_latency': 0,
-                    'total_sentences': 0,
-                    'latency_count': 0
-                }
-
-            stats = provider_stats[prov]
-            stats['total_analyses'] += 1
-
-            if result.success:
-                stats['successful_analyses'] += 1
-            else:
-                stats['failed_analyses'] += 1
-
-            if result.latency_ms is not None:
-                stats['total_latency'] += result.latency_ms
-                stats['latency_count'] += 1
-
-            if result.sentence_count is not None:
-                stats['total_sentences'] += result.sentence_count
-
-        # Calculate averages
-        for prov, stats in provider_stats.items():
-            if stats['latency_count'] > 0:
-                stats['avg_latency_ms'] = stats['total_latency'] / stats['latency_count']
-            else:
-                stats['avg_latency_ms'] = 0
-
-            if stats['total_analyses'] > 0:
-                stats['avg_sentences'] = stats['total_sentences'] / stats['total_analyses']
-            else:
-                stats['avg_sentences'] = 0
-
-            # Remove intermediate fields
-            del stats['total_latency']
-            del stats['total_sentences']
-            del stats['latency_count']
+        if provider:
+            stmt = stmt.where(AnalysisResult.provider == provider)
 
-        return list(provider_stats.values())
+        return [dict(row._mapping) for row in self.session.execute(stmt)]
 
     def update_provider_metrics(
         self,
@@ -382,32 +398,89 @@ class AnalyticsRepository:
         Returns:
             ProviderMetric instance
         """
-        # Try to find existing metric
-        metric = self.session.query(ProviderMetric).filter(
-            ProviderMetric.provider == provider,
-            ProviderMetric.hour_bucket == hour_bucket
-        ).first()
-
-        if metric:
-            # Update existing
-            metric.total_requests = total_requests
-            metric.successful_requests = successful_requests
-            metric.failed_requests = failed_requests
-            metric.avg_latency_ms = avg_latency_ms
-            metric.error_types = json.dumps(error_types)
-            metric.updated_at = datetime.utcnow()
-        else:
-            # Create new
-            metric = ProviderMetric(
-                provider=provider,
-                hour_bucket=hour_bucket,
-                total_requests=total_requests,
-                successful_requests=successful_requests,
-                failed_requests=failed_requests,
-                avg_latency_ms=avg_latency_ms,
-                error_types=json.dumps(error_types)
-            )
-            self.session.add(metric)
+        values = {
+            'total_requests': total_requests,
+            'successful_requests': successful_requests,
+            'failed_requests': failed_requests,
+            'avg_latency_ms': avg_latency_ms,
+            'error_types': error_types,
+        }
+
+        # Single atomic upsert on the (provider, hour_bucket_ms) unique index
+        stmt = sqlite_insert(ProviderMetric).values(
+            provider=provider,
+            hour_bucket_ms=to_epoch_ms(hour_bucket),
+            **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['provider', 'hour_bucket_ms'],
+            set_={**values, 'updated_at': datetime.utcnow()}
+        )
+
+        return self._upsert_provider_metric(stmt)
+
+    def record_provider_event(
+        self,
+        provider: str,
+        success: bool,
+        latency_ms: Optional[float] = None,
+        at_ms: Optional[int] = None
+    ) -> ProviderMetric:
+        """
+        Add one analysis outcome to the provider's hourly metrics.
+
+        Counts and the running average latency are updated in SQL by a single
+        INSERT ... ON CONFLICT DO UPDATE, so concurrent writers don't race.
+        error_types is left to update_provider_metrics.
+
+        Args:
+            provider: Provider name
+            success: Whether the analysis succeeded
+            latency_ms: Optional provider latency in milliseconds
+            at_ms: Event time in epoch milliseconds (defaults to now)
+
+        Returns:
+            ProviderMetric instance
+        """
+        if at_ms is None:
+            at_ms = now_ms()
+
+        stmt = sqlite_insert(ProviderMetric).values(
+            provider=provider,
+            hour_bucket_ms=at_ms - at_ms % HOUR_MS,
+            total_requests=1,
+            successful_requests=1 if success else 0,
+            failed_requests=0 if success else 1,
+            avg_latency_ms=latency_ms,
+            error_types={}
+        )
+
+        set_ = {
+            'total_requests': ProviderMetric.total_requests + 1,
+            'successful_requests': ProviderMetric.successful_requests + stmt.excluded.successful_requests,
+            'failed_requests': ProviderMetric.failed_requests + stmt.excluded.failed_requests,
+            'updated_at': datetime.utcnow(),
+        }
+        if latency_ms is not None:
+            # Running mean over the requests seen so far (NULL average counts as empty)
+            set_['avg_latency_ms'] = (
+                func.coalesce(ProviderMetric.avg_latency_ms * ProviderMetric.total_requests, 0)
+                + stmt.excluded.avg_latency_ms
+            ) / (ProviderMetric.total_requests + 1)
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['provider', 'hour_bucket_ms'],
+            set_=set_
+        )
+
+        return self._upsert_provider_metric(stmt)
+
+    def _upsert_provider_metric(self, stmt) -> ProviderMetric:
+        """Execute a ProviderMetric upsert, commit, and return the stored row."""
+        metric = self.session.scalars(
+            stmt.returning(ProviderMetric),
+            execution_options={'populate_existing': True}
+        ).one()
 
         self.session.commit()
 
@@ -423,9 +496,7 @@ class AnalyticsRepository:
         Returns:
             FeatureFlag instance or None
         """
-        return self.session.query(FeatureFlag).filter(
-            FeatureFlag.flag_name == flag_name
-        ).first()
+        return self.session.execute(_FLAG_BY_NAME, {'name': flag_name}).scalar_one_or_none()
 
     def get_all_feature_flags(self) -> List[FeatureFlag]:
         """
@@ -434,7 +505,7 @@ class AnalyticsRepository:
         Returns:
             List of FeatureFlag instances
         """
-        return self.session.query(FeatureFlag).all()
+        return self.session.execute(_ALL_FLAGS).scalars().all()
 
     def set_feature_flag(
         self,
@@ -460,7 +531,7 @@ class AnalyticsRepository:
         if flag:
             flag.enabled = enabled
             if config is not None:
-                flag.config = json.dumps(config)
+                flag.config = config
             if description is not None:
                 flag.description = description
             flag.updated_at = datetime.utcnow()
@@ -468,7 +539,7 @@ class AnalyticsRepository:
             flag = FeatureFlag(
                 flag_name=flag_name,
                 enabled=enabled,
-                config=json.dumps(config) if config else None,
+                config=config if config else None,
                 description=description
             )
             self.session.add(flag)
@@ -486,23 +557,226 @@ class AnalyticsRepository:
         Args:
             days: Keep records from last N days
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = to_epoch_ms(datetime.utcnow() - timedelta(days=days))
 
-        # Delete old request logs (cascade will delete analysis results)
-        deleted_requests = self.session.query(RequestLog).filter(
-            RequestLog.timestamp < cutoff
-        ).delete()
+        # Bulk DELETEs bypass the ORM relationship cascade (and SQLite does not
+        # enforce foreign keys here), so old analysis results go explicitly
+        deleted_analyses = self._delete_in_chunks(AnalysisResult, AnalysisResult.timestamp_ms < cutoff)
 
-        # Delete old provider metrics
-        deleted_metrics = self.session.query(ProviderMetric).filter(
-            ProviderMetric.hour_bucket < cutoff
-        ).delete()
+        # Delete old request logs
+        deleted_requests = self._delete_in_chunks(RequestLog, RequestLog.timestamp_ms < cutoff)
 
-        self.session.commit()
+        # Delete old provider metrics
+        deleted_metrics = self._delete_in_chunks(ProviderMetric, ProviderMetric.hour_bucket_ms < cutoff)
 
-        logger.info(f"Cleaned up {deleted_requests} old requests and {deleted_metrics} old metrics")
+        logger.info(
+            f"Cleaned up {deleted_requests} old requests, {deleted_analyses} old analysis results "
+            f"and {deleted_metrics} old metrics"
+        )
 
         return {
             'deleted_requests': deleted_requests,
+            'deleted_analyses': deleted_analyses,
             'deleted_metrics': deleted_metrics
         }
+
+    def _delete_in_chunks(self, model, condition) -> int:
+        """
+        Delete matching rows CLEANUP_CHUNK_SIZE at a time, committing each chunk.
+
+        Keeps each write transaction (and the WAL) small so concurrent
+        request logging isn't blocked behind one huge DELETE.
+
+        Returns:
+            Total number of deleted rows
+        """
+        ids = select(model.id).where(condition).limit(CLEANUP_CHUNK_SIZE).scalar_subquery()
+        stmt = delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+
+        total = 0
+        while True:
+            deleted = self.session.execute(stmt).rowcount
+            self.session.commit()
+            total += deleted
+            if deleted < CLEANUP_CHUNK_SIZE:
+                return total
+
+
+class AnalyticsLogBuffer:
+    """
+    Process-wide buffer for request and analysis log rows.
+
+    log_request/log_analysis_result only queue a row; rows are written with
+    executemany INSERTs and a single commit once `batch_size` rows are
+    queued, `flush_interval` seconds after the first queued row, on an
+    explicit flush(), or at interpreter exit.
+
+    Example:
+        buffer = get_log_buffer()
+        buffer.log_request(correlation_id, url, mode, providers, status, duration_ms)
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 5.0):
+        """
+        Initialize the buffer.
+
+        Args:
+            batch_size: Queued rows that trigger a flush
+            flush_interval: Max seconds a queued row waits before a flush
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending_requests: List[Dict[str, Any]] = []
+        self._pending_results: List[Dict[str, Any]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def log_request(
+        self,
+        correlation_id: str,
+        url: str,
+        mode: str,
+        providers: List[str],
+        status: str,
+        duration_ms: int,
+        error_message: Optional[str] = None,
+        error_type: Optional[str] = None
+    ):
+        """Queue an API request log row (same arguments as AnalyticsRepository.log_request)."""
+        self._queue(self._pending_requests, {
+            'correlation_id': correlation_id,
+            'url': url,
+            'mode': mode,
+            'providers': decode_json_text(providers),
+            'timestamp_ms': now_ms(),
+            'status': status,
+            'duration_ms': duration_ms,
+            'error_message': error_message,
+            'error_type': error_type,
+        })
+
+    def log_analysis_result(
+        self,
+        correlation_id: str,
+        provider: str,
+        sentence_count: int,
+        model_name: Optional[str] = None,
+        success: bool = True,
+        error_type: Optional[str] = None,
+        error_message: Optional[str] = None,
+        latency_ms: Optional[int] = None,
+        content_hash: Optional[str] = None,
+        sentences: Optional[Dict[str, str]] = None
+    ):
+        """Queue an analysis result row (same arguments as AnalyticsRepository.log_analysis_result)."""
+        self._queue(self._pending_results, {
+            'correlation_id': correlation_id,
+            'provider': provider,
+            'sentence_count': sentence_count,
+            'model_name': model_name,
+            'success': success,
+            'error_type': error_type,
+            'error_message': error_message,
+            'latency_ms': latency_ms,
+            'content_hash': content_hash,
+            'sentences': sentences,
+            'timestamp_ms': now_ms(),
+        })
+
+    def _queue(self, pending: List[Dict[str, Any]], row: Dict[str, Any]):
+        with self._lock:
+            pending.append(row)
+            queued = len(self._pending_requests) + len(self._pending_results)
+
+            if queued < self.batch_size and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if queued >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all queued rows.
+
+        Request rows are committed before analysis rows (which reference
+        request_log.correlation_id), each kind in its own transaction, so a
+        failing analysis row cannot drop the request logs.
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            requests, self._pending_requests = self._pending_requests, []
+            results, self._pending_results = self._pending_results, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not requests and not results:
+            return 0
+
+        # A duplicate correlation ID skips that row instead of failing the batch
+        written_requests = self._insert_rows(
+            insert(RequestLog).prefix_with('OR IGNORE'), requests, 'request log'
+        )
+        written_results = self._insert_rows(insert(AnalysisResult), results, 'analysis result')
+
+        logger.debug(f"Flushed {written_requests} request logs and {written_results} analysis results")
+
+        return written_requests + written_results
+
+    @staticmethod
+    def _insert_rows(stmt, rows: List[Dict[str, Any]], kind: str) -> int:
+        """
+        Insert rows in one transaction.
+
+        If the batch fails, the rows are retried one at a time so only the
+        failing ones are dropped.
+
+        Returns:
+            Number of rows written (rows skipped by INSERT OR IGNORE are not counted)
+        """
+        if not rows:
+            return 0
+
+        session = get_session()
+        try:
+            # Core execution on the session's connection, for the cursor rowcount
+            try:
+                written = session.connection().execute(stmt, rows).rowcount
+                session.commit()
+                return written
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"Failed to write {len(rows)} {kind} rows, retrying one by one: {e}")
+
+            written = 0
+            for row in rows:
+                try:
+                    written += session.connection().execute(stmt, [row]).rowcount
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Dropped {kind} row for {row.get('correlation_id')}: {e}")
+            return written
+        finally:
+            session.close()
+
+
+_log_buffer: Optional[AnalyticsLogBuffer] = None
+_log_buffer_lock = threading.Lock()
+
+
+def get_log_buffer() -> AnalyticsLogBuffer:
+    """Get the process-wide AnalyticsLogBuffer (flushed automatically at exit)."""
+    global _log_buffer
+
+    if _log_buffer is None:
+        with _log_buffer_lock:
+            if _log_buffer is None:
+                _log_buffer = AnalyticsLogBuffer()
+                atexit.register(_log_buffer.flush)
+
+    return _log_buffer
@@ -4,10 +4,11 @@ Extracts literacy-enhancing sentences from news articles
 """
 
 import os
-import json
+import re
+import asyncio
 import logging
 from typing import List, Dict, Optional
-import google.generativeai as genai
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +18,12 @@ logger = logging.getLogger(__name__)
 GEMINI_MODEL = 'gemini-2.5-flash-lite'
 MIN_SENTENCES = 3
 MAX_SENTENCES = 5
+MAX_CONCURRENT_REQUESTS = 16
+REQUEST_TIMEOUT = 40  # seconds per API call
+
+# Markdown code fence around the JSON payload (same pattern as llm.base;
+# this module is installed standalone, so it keeps its own copy)
+_FENCE_RE = re.compile(r'```(?:json|JSON)?\s*(.*?)\s*(?:```|\Z)', re.DOTALL)
 
 # System prompt for Gemini API
 SYSTEM_PROMPT = """시스템 역할: 당신은 비판적 읽기 훈련 코치이자 언론 분석가입니다.
@@ -36,6 +43,11 @@ SYSTEM_PROMPT = """시스템 역할: 당신은 비판적 읽기 훈련 코치이
 """
 
 
+# Only the article goes in each request; SYSTEM_PROMPT is set once as the
+# model's system instruction, so every request shares the same prefix
+ARTICLE_PREFIX = "기사 본문:\n"
+
+
 class GeminiAPIError(Exception):
     """Custom exception for Gemini API errors"""
     pass
@@ -65,8 +77,13 @@ class GeminiAnalyzer:
                 "Provide via environment variable or constructor argument."
             )
 
+        # Imported here: the SDK pulls in grpc/protobuf, which callers that
+        # never construct an analyzer should not pay for
+        import google.generativeai as genai
+
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name, system_instruction=SYSTEM_PROMPT)
         logger.info(f"Gemini API initialized with model: {model_name}")
 
     def _clean_json_response(self, text: str) -> str:
@@ -82,15 +99,8 @@ class GeminiAnalyzer:
         text = text.strip()
 
         # Remove markdown code blocks if present
-        if text.startswith("```"):
-            parts = text.split("```")
-            if len(parts) >= 2:
-                text = parts[1]
-                # Remove language identifier (e.g., "json")
-                if text.startswith("json"):
-                    text = text[4:].strip()
-
-        return text
+        match = _FENCE_RE.match(text)
+        return match.group(1) if match else text
 
     def analyze_article(self, article_text: str) -> Dict[str, str]:
         """
@@ -105,34 +115,118 @@ class GeminiAnalyzer:
         Raises:
             GeminiAPIError: If API call or parsing fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             logger.warning("Empty article text provided")
             return {}
 
-        prompt = f"{SYSTEM_PROMPT}\n\n기사 본문:\n{article_text}"
+        prompt = f"{ARTICLE_PREFIX}{article_text}"
 
         try:
             logger.info("Sending request to Gemini API...")
-            response = self.model.generate_content(prompt)
-            result_text = self._clean_json_response(response.text)
+            response = self.model.generate_content(
+                prompt, request_options={"timeout": REQUEST_TIMEOUT}
+            )
+            return self._parse_response(response)
 
-            logger.debug(f"Cleaned response: {result_text[:200]}...")
-            parsed = json.loads(result_text)
-            if len(parsed) > MAX_SENTENCES:
-                parsed = dict(list(parsed.items())[:MAX_SENTENCES])
+        except GeminiAPIError:
+            raise
 
-            logger.info(f"Successfully extracted {len(parsed)} sentences")
-            return parsed
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise GeminiAPIError(f"API call failed: {e}")
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
-            logger.error(f"Raw response: {response.text}")
-            raise GeminiAPIError(f"Failed to parse JSON response: {e}")
+    async def analyze_article_async(self, article_text: str) -> Dict[str, str]:
+        """
+        Async version of analyze_article
+
+        The request is awaited instead of blocking a thread, so many articles
+        can be in flight at once (see analyze_articles).
+
+        Args:
+            article_text: Article body text to analyze
+
+        Returns:
+            Dictionary mapping sentences to selection reasons
+
+        Raises:
+            GeminiAPIError: If API call or parsing fails
+        """
+        if not article_text or article_text.isspace():
+            logger.warning("Empty article text provided")
+            return {}
+
+        prompt = f"{ARTICLE_PREFIX}{article_text}"
+
+        try:
+            logger.info("Sending request to Gemini API...")
+            response = await self.model.generate_content_async(
+                prompt, request_options={"timeout": REQUEST_TIMEOUT}
+            )
+            return self._parse_response(response)
+
+        except GeminiAPIError:
+            raise
 
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             raise GeminiAPIError(f"API call failed: {e}")
 
+    async def analyze_articles(
+        self,
+        article_texts: List[str],
+        concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Dict[str, str]]:
+        """
+        Analyze several articles concurrently
+
+        Args:
+            article_texts: Article body texts to analyze
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            One result per article, in input order ({} for articles that failed)
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(text: str) -> Dict[str, str]:
+            async with sem:
+                try:
+                    return await self.analyze_article_async(text)
+                except GeminiAPIError as e:
+                    logger.error(f"Failed to analyze article: {e}")
+                    return {}
+
+        return await asyncio.gather(*(one(text) for text in article_texts))
+
+    def _parse_response(self, response) -> Dict[str, str]:
+        """
+        Parse a Gemini response into the sentence -> reason mapping
+
+        Args:
+            response: Response object from generate_content(_async)
+
+        Returns:
+            Dictionary mapping sentences to selection reasons (at most MAX_SENTENCES)
+
+        Raises:
+            GeminiAPIError: If the response is not valid JSON
+        """
+        result_text = self._clean_json_response(response.text)
+
+        logger.debug(f"Cleaned response: {result_text[:200]}...")
+        try:
+            parsed = orjson.loads(result_text)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON parsing error: {e}")
+            logger.error(f"Raw response: {response.text}")
+            raise GeminiAPIError(f"Failed to parse JSON response: {e}")
+
+        if len(parsed) > MAX_SENTENCES:
+            parsed = dict(list(parsed.items())[:MAX_SENTENCES])
+
+        logger.info(f"Successfully extracted {len(parsed)} sentences")
+        return parsed
+
     def get_highlight_sentences(self, article_text: str) -> List[str]:
         """
         Extract only the sentences to highlight (without reasons)
@@ -18,7 +18,7 @@ Usage:
 """
 
 from .factory import LLMFactory
-from .base import AnalysisResult, LLMProvider, LLMConfig
+from .base import AnalysisResult, LLMProvider, LLMConfig, analyze_all
 from .exceptions import (
     LLMError,
     LLMProviderError,
@@ -37,6 +37,8 @@ __all__ = [
     "AnalysisResult",
     "LLMProvider",
     "LLMConfig",
+    # Helpers
+    "analyze_all",
     # Exceptions
     "LLMError",
     "LLMProviderError",
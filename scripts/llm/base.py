@@ -6,11 +6,27 @@ All providers inherit from BaseLLMProvider and must implement abstract methods.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-import json
+import re
+import sys
+
+import orjson
+
+
+# Default worker threads for analyze_articles; API calls are I/O-bound
+MAX_CONCURRENT_REQUESTS = 16
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Markdown code fence around a JSON payload, with optional language tag;
+# a missing closing fence is tolerated
+_FENCE_RE = re.compile(r'```(?:json|JSON)?\s*(.*?)\s*(?:```|\Z)', re.DOTALL)
 
 
 class LLMProvider(Enum):
@@ -22,9 +38,9 @@ class LLMProvider(Enum):
     MISTRAL = "mistral"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LLMConfig:
-    """Configuration for LLM provider"""
+    """Configuration for LLM provider (not frozen: the factory and providers fill in defaults)"""
     provider: LLMProvider
     api_key: str
     model_name: str
@@ -36,7 +52,7 @@ class LLMConfig:
     additional_params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AnalysisResult:
     """Standardized analysis result across all providers"""
     sentences: Dict[str, str]  # {sentence: reason}
@@ -54,6 +70,9 @@ class BaseLLMProvider(ABC):
     Common functionality like JSON parsing is provided in this base class.
     """
 
+    # Provider loggers by name, shared by all instances
+    _LOGGERS: Dict[str, logging.Logger] = {}
+
     def __init__(self, config: LLMConfig):
         """
         Initialize provider with configuration
@@ -109,6 +128,64 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def analyze_article_async(self, article_text: str, system_prompt: str) -> AnalysisResult:
+        """
+        Async version of analyze_article
+
+        Runs the blocking analyze_article on the event loop's default executor;
+        providers with an async SDK client override this to await it directly.
+
+        Args:
+            article_text: Full article body text
+            system_prompt: System prompt for analysis
+
+        Returns:
+            AnalysisResult with extracted sentences and metadata
+
+        Raises:
+            LLMProviderError: If analysis fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_article, article_text, system_prompt)
+
+    def analyze_articles(
+        self,
+        article_texts: List[str],
+        system_prompt: str,
+        max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze many articles concurrently on a thread pool
+
+        Each article is a separate API call through this provider's client,
+        so its HTTP connection pool is shared by all workers.
+
+        Args:
+            article_texts: Article body texts
+            system_prompt: System prompt for analysis
+            max_workers: Maximum number of API calls in flight
+
+        Returns:
+            Results in input order (None where analysis failed)
+        """
+        if not article_texts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.analyze_article, text, system_prompt)
+                for text in article_texts
+            ]
+
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Batch analysis failed for one article: {e}")
+                    results.append(None)
+            return results
+
     def _clean_json_response(self, text: str) -> str:
         """
         Clean response text to extract pure JSON
@@ -124,17 +201,8 @@ class BaseLLMProvider(ABC):
         text = text.strip()
 
         # Remove markdown code blocks if present
-        if text.startswith("```"):
-            parts = text.split("```")
-            if len(parts) >= 2:
-                text = parts[1]
-                # Remove language identifier (e.g., "json")
-                if text.startswith("json"):
-                    text = text[4:].strip()
-                elif text.startswith("JSON"):
-                    text = text[4:].strip()
-
-        return text
+        match = _FENCE_RE.match(text)
+        return match.group(1) if match else text
 
     def _parse_json_response(self, text: str) -> Dict[str, str]:
         """
@@ -153,20 +221,19 @@ class BaseLLMProvider(ABC):
 
         try:
             cleaned = self._clean_json_response(text)
-            parsed = json.loads(cleaned)
+            parsed = orjson.loads(cleaned)
 
             # Validate format: should be {sentence: reason}
             if not isinstance(parsed, dict):
                 raise JSONParseError(f"Expected dict, got {type(parsed)}")
 
-            # Ensure all values are strings
-            for key, value in parsed.items():
-                if not isinstance(key, str) or not isinstance(value, str):
-                    raise JSONParseError(f"All keys and values must be strings")
+            # Ensure all values are strings (JSON object keys always are)
+            if not all(type(value) is str for value in parsed.values()):
+                raise JSONParseError(f"All keys and values must be strings")
 
             return parsed
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON parsing failed: {e}")
             self.logger.error(f"Raw text: {text[:500]}...")
             raise JSONParseError(f"Failed to parse JSON: {e}")
@@ -201,7 +268,45 @@ class BaseLLMProvider(ABC):
     def _setup_logger(self):
         """Setup provider-specific logger"""
         logger_name = f"llm.{self.config.provider.value}"
-        return logging.getLogger(logger_name)
+        logger = self._LOGGERS.get(logger_name)
+        if logger is None:
+            # getLogger takes the logging module lock, so only once per name
+            logger = self._LOGGERS[logger_name] = logging.getLogger(logger_name)
+        return logger
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.config.model_name})"
+
+
+async def analyze_all(
+    providers: List[BaseLLMProvider],
+    article_text: str,
+    system_prompt: str
+) -> List[Any]:
+    """
+    Analyze one article with several providers concurrently
+
+    Total latency is that of the slowest provider rather than the sum.
+
+    Args:
+        providers: Provider instances to compare
+        article_text: Article body text
+        system_prompt: System prompt for analysis
+
+    Returns:
+        One entry per provider, in input order: its AnalysisResult, or the
+        LLMProviderError it failed with
+    """
+    from .exceptions import LLMProviderError
+
+    results = await asyncio.gather(
+        *(p.analyze_article_async(article_text, system_prompt) for p in providers),
+        return_exceptions=True
+    )
+
+    return [
+        LLMProviderError(f"{provider!r} failed: {result}")
+        if isinstance(result, Exception) and not isinstance(result, LLMProviderError)
+        else result
+        for provider, result in zip(providers, results)
+    ]
@@ -6,24 +6,42 @@ environment variable overrides.
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 from .base import LLMProvider, LLMConfig
 
 
 # Default model names for each provider (NEWEST 2025 LIGHTWEIGHT MODELS)
-DEFAULT_MODELS = {
+DEFAULT_MODELS = MappingProxyType({
     LLMProvider.GEMINI: "gemini-2.5-flash-lite",
     LLMProvider.OPENAI: "gpt-5-nano",
     LLMProvider.CLAUDE: "claude-4.5-haiku",
     LLMProvider.LLAMA: "meta-llama/Llama-3.1-8B-Instruct",
     LLMProvider.MISTRAL: "mistral-small-2506"
-}
+})
 
 # Default base URLs for providers that need them
-DEFAULT_BASE_URLS = {
+DEFAULT_BASE_URLS = MappingProxyType({
     LLMProvider.OPENAI: "https://api.openai.com/v1",
     LLMProvider.LLAMA: "https://api.together.xyz/v1",
-}
+})
+
+# (default model, default base URL or None) per provider, for a single lookup
+_PROVIDER_DEFAULTS = MappingProxyType({
+    provider: (DEFAULT_MODELS[provider], DEFAULT_BASE_URLS.get(provider))
+    for provider in LLMProvider
+})
+
+
+@lru_cache(maxsize=None)
+def _read_env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    os.getenv, read once per variable for the life of the process
+
+    Call _read_env.cache_clear() after changing the environment (e.g. in tests).
+    """
+    return os.getenv(name, default)
 
 
 def get_default_config(provider: LLMProvider, api_key: str = "") -> LLMConfig:
@@ -37,24 +55,26 @@ def get_default_config(provider: LLMProvider, api_key: str = "") -> LLMConfig:
     Returns:
         LLMConfig with default settings from environment or hardcoded defaults
     """
+    default_model, default_base_url = _PROVIDER_DEFAULTS[provider]
+
     # Get model name from environment or use default
     model_env_var = f"{provider.value.upper()}_MODEL"
-    model_name = os.getenv(model_env_var, DEFAULT_MODELS[provider])
+    model_name = _read_env(model_env_var, default_model)
 
     # Get common LLM settings from environment
-    temperature = float(os.getenv("LLM_TEMPERATURE", "0.2"))
+    temperature = float(_read_env("LLM_TEMPERATURE", "0.2"))
 
-    max_tokens_env = os.getenv("LLM_MAX_TOKENS")
+    max_tokens_env = _read_env("LLM_MAX_TOKENS")
     max_tokens = int(max_tokens_env) if max_tokens_env else None
 
-    timeout = int(os.getenv("LLM_TIMEOUT", "40"))
-    max_retries = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    timeout = int(_read_env("LLM_TIMEOUT", "40"))
+    max_retries = int(_read_env("LLM_MAX_RETRIES", "3"))
 
     # Get base URL if provider needs one
     base_url = None
-    if provider in DEFAULT_BASE_URLS:
+    if default_base_url is not None:
         base_url_env_var = f"{provider.value.upper()}_BASE_URL"
-        base_url = os.getenv(base_url_env_var, DEFAULT_BASE_URLS[provider])
+        base_url = _read_env(base_url_env_var, default_base_url)
 
     return LLMConfig(
         provider=provider,
@@ -75,4 +95,4 @@ def get_provider_from_env() -> str:
     Returns:
         Provider name (default: "gemini")
     """
-    return os.getenv("LLM_PROVIDER", "gemini")
+    return _read_env("LLM_PROVIDER", "gemini")
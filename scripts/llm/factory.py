@@ -5,15 +5,44 @@ Handles provider registration, instantiation, and configuration.
 Supports fallback chains for reliability.
 """
 
+from dataclasses import fields, replace
 from typing import Optional, List
-from .base import BaseLLMProvider, LLMProvider
+from .base import BaseLLMProvider, LLMConfig, LLMProvider
 from .exceptions import UnsupportedProviderError, APIKeyError
 from .config import get_default_config, get_provider_from_env
 from .utils.security import get_api_key
+import importlib
+import importlib.util
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Provider implementations by module, class and SDK package. Each is imported
+# the first time it is requested, so importing llm does not load every SDK
+# (grpc/protobuf for Gemini, httpx for OpenAI, ...)
+_PROVIDER_MODULES = {
+    LLMProvider.GEMINI: ('.providers.gemini', 'GeminiProvider', 'google.generativeai'),
+    LLMProvider.OPENAI: ('.providers.openai_provider', 'OpenAIProvider', 'openai'),
+    LLMProvider.CLAUDE: ('.providers.claude', 'ClaudeProvider', 'anthropic'),
+    LLMProvider.LLAMA: ('.providers.llama', 'LlamaProvider', 'openai'),
+    LLMProvider.MISTRAL: ('.providers.mistral', 'MistralProvider', 'mistralai'),
+}
+
+# Provider enum by name, for a plain dict lookup instead of LLMProvider(name)
+_STR_TO_PROVIDER = {p.value: p for p in LLMProvider}
+
+# LLMConfig fields that create() accepts as keyword overrides
+_CONFIG_FIELDS = frozenset(f.name for f in fields(LLMConfig))
+
+
+def _is_installed(package: str) -> bool:
+    """Check whether a package can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(package) is not None
+    except ModuleNotFoundError:
+        # Parent of a dotted name (e.g. google) is missing
+        return False
+
 
 class LLMFactory:
     """Factory for creating LLM provider instances"""
@@ -32,6 +61,35 @@ class LLMFactory:
         cls._provider_registry[provider] = provider_class
         logger.debug(f"Registered provider: {provider.value}")
 
+    @classmethod
+    def _get_provider_class(cls, provider: LLMProvider):
+        """
+        Get the provider implementation, importing and registering it on first use
+
+        Args:
+            provider: LLMProvider enum value
+
+        Returns:
+            Provider class, or None if its SDK is not installed
+        """
+        provider_class = cls._provider_registry.get(provider)
+        if provider_class is None and provider in _PROVIDER_MODULES:
+            module_name, class_name, sdk = _PROVIDER_MODULES[provider]
+            if not _is_installed(sdk):
+                logger.warning(f"{provider.value} provider not available: {sdk} is not installed")
+                return None
+
+            try:
+                module = importlib.import_module(module_name, __package__)
+            except ImportError as e:
+                logger.warning(f"{provider.value} provider not available: {e}")
+                return None
+
+            provider_class = getattr(module, class_name)
+            cls.register_provider(provider, provider_class)
+
+        return provider_class
+
     @classmethod
     def create(
         cls,
@@ -61,9 +119,10 @@ class LLMFactory:
         if provider is None:
             provider = get_provider_from_env()
 
-        try:
-            provider_enum = LLMProvider(provider.lower())
-        except ValueError:
+        provider_enum = _STR_TO_PROVIDER.get(provider)
+        if provider_enum is None:
+            provider_enum = _STR_TO_PROVIDER.get(provider.lower())
+        if provider_enum is None:
             raise UnsupportedProviderError(
                 f"Provider '{provider}' not supported. "
                 f"Supported: {[p.value for p in LLMProvider]}"
@@ -79,24 +138,21 @@ class LLMFactory:
                     f"store in system keyring, or provide via api_key parameter."
                 )
 
-        # Get default configuration
-        config = get_default_config(provider_enum, api_key)
-
-        # Override with provided values
+        # Default configuration with provided values applied in one copy
+        overrides = {key: value for key, value in kwargs.items() if key in _CONFIG_FIELDS}
         if model_name:
-            config.model_name = model_name
+            overrides['model_name'] = model_name
 
-        # Apply additional kwargs
-        for key, value in kwargs.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
+        config = get_default_config(provider_enum, api_key)
+        if overrides:
+            config = replace(config, **overrides)
 
         # Get provider class
-        provider_class = cls._provider_registry.get(provider_enum)
+        provider_class = cls._get_provider_class(provider_enum)
         if not provider_class:
             raise UnsupportedProviderError(
-                f"Provider {provider} registered but implementation not found. "
-                f"This is likely a bug."
+                f"Provider {provider} is not available. "
+                f"Check that its SDK is installed."
             )
 
         # Create and return instance
@@ -141,45 +197,3 @@ class LLMFactory:
             f"Failed to initialize any provider from: {providers_to_try}. "
             f"Last error: {last_error}"
         )
-
-
-# Auto-register all available providers
-def _register_providers():
-    """Register all available providers"""
-    logger.debug("Registering LLM providers...")
-
-    try:
-        from .providers.gemini import GeminiProvider
-        LLMFactory.register_provider(LLMProvider.GEMINI, GeminiProvider)
-    except ImportError as e:
-        logger.warning(f"Gemini provider not available: {e}")
-
-    try:
-        from .providers.openai_provider import OpenAIProvider
-        LLMFactory.register_provider(LLMProvider.OPENAI, OpenAIProvider)
-    except ImportError as e:
-        logger.warning(f"OpenAI provider not available: {e}")
-
-    try:
-        from .providers.claude import ClaudeProvider
-        LLMFactory.register_provider(LLMProvider.CLAUDE, ClaudeProvider)
-    except ImportError as e:
-        logger.warning(f"Claude provider not available: {e}")
-
-    try:
-        from .providers.llama import LlamaProvider
-        LLMFactory.register_provider(LLMProvider.LLAMA, LlamaProvider)
-    except ImportError as e:
-        logger.warning(f"Llama provider not available: {e}")
-
-    try:
-        from .providers.mistral import MistralProvider
-        LLMFactory.register_provider(LLMProvider.MISTRAL, MistralProvider)
-    except ImportError as e:
-        logger.warning(f"Mistral provider not available: {e}")
-
-    logger.info(f"Registered {len(LLMFactory._provider_registry)} providers")
-
-
-# Auto-register on import
-_register_providers()
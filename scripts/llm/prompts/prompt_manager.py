@@ -6,16 +6,33 @@ performance tracking.
 """
 
 import os
+import re
 import yaml
 import random
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+import orjson
+
 from observability import get_logger
 
 logger = get_logger(__name__)
 
+# Rendered prompts kept per PromptManager, keyed by template and arguments
+RENDER_CACHE_SIZE = 256
+
+# {variable_name} placeholders in a template
+_VAR_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+
+# libyaml's C loader when available; same safe subset as yaml.safe_load
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class PromptTemplate:
     """
@@ -46,6 +63,9 @@ class PromptTemplate:
         self.description = description
         self.metadata = metadata or {}
 
+        # Checked against the render() kwargs with one set difference
+        self._required = frozenset(self.variables)
+
     def render(self, **kwargs) -> str:
         """
         Render template with provided variables.
@@ -68,11 +88,11 @@ class PromptTemplate:
         """
         try:
             # Validate required variables
-            missing = [var for var in self.variables if var not in kwargs]
+            missing = self._required - kwargs.keys()
             if missing:
-                logger.warning(f"Missing template variables: {missing}")
+                logger.warning(f"Missing template variables: {sorted(missing)}")
 
-            return self.template.format(**kwargs)
+            return self.template.format_map(kwargs)
 
         except KeyError as e:
             logger.error(f"Template variable not provided: {e}")
@@ -111,6 +131,13 @@ class PromptExperiment:
         self.control_variant = control_variant
         self.description = description
 
+        # Share of requests in the experiment, as a fraction for random.random()
+        self._traffic_threshold = traffic_percentage / 100
+
+        # Variant names and cumulative weights for random.choices
+        self._names = [v.get('name') for v in variants]
+        self._cum_weights = list(accumulate(v.get('weight', 1) for v in variants))
+
     def select_variant(self) -> Optional[str]:
         """
         Select a variant based on traffic percentage and weights.
@@ -135,21 +162,15 @@ class PromptExperiment:
             return None
 
         # Check if this request should be in experiment
-        if random.randint(1, 100) > self.traffic_percentage:
+        if random.random() >= self._traffic_threshold:
             return self.control_variant
 
         # Select variant based on weights
-        total_weight = sum(v.get('weight', 1) for v in self.variants)
-        rand_val = random.uniform(0, total_weight)
-
-        current_weight = 0
-        for variant in self.variants:
-            current_weight += variant.get('weight', 1)
-            if rand_val <= current_weight:
-                return variant.get('name')
+        if self._cum_weights and self._cum_weights[-1] > 0:
+            return random.choices(self._names, cum_weights=self._cum_weights)[0]
 
         # Fallback to first variant
-        return self.variants[0].get('name') if self.variants else None
+        return self._names[0] if self._names else None
 
     def __repr__(self):
         return f"<PromptExperiment(name='{self.name}', active={self.active})>"
@@ -181,7 +202,7 @@ class PromptManager:
 
         Args:
             prompts_dir: Directory containing prompt template files
-            experiments_file: YAML file with experiment configurations
+            experiments_file: YAML (or .json) file with experiment configurations
         """
         self.logger = get_logger(__name__)
 
@@ -198,6 +219,9 @@ class PromptManager:
         # Storage
         self._templates: Dict[str, Dict[str, PromptTemplate]] = {}  # {name: {version: template}}
         self._experiments: Dict[str, PromptExperiment] = {}
+        self._experiments_mtime: Optional[int] = None  # st_mtime_ns of the last parsed file
+        self._latest: Dict[str, str] = {}  # {name: highest version key}
+        self._render_cached = lru_cache(maxsize=RENDER_CACHE_SIZE)(self._render)
 
         # Load prompts and experiments
         self._load_templates()
@@ -211,19 +235,24 @@ class PromptManager:
             return
 
         # Load .txt and .md files
-        for file_path in self.prompts_dir.glob('*.*'):
-            if file_path.suffix not in ['.txt', '.md']:
-                continue
+        with os.scandir(self.prompts_dir) as entries:
+            template_files = [
+                entry for entry in entries
+                if entry.name.endswith(('.txt', '.md')) and entry.is_file()
+            ]
+
+        for entry in template_files:
+            stem = entry.name.rsplit('.', 1)[0]
 
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(entry.path, 'r', encoding='utf-8') as f:
                     template_content = f.read()
 
                 # Parse filename: {name}_{version}.txt
-                name_parts = file_path.stem.split('_')
+                name_parts = stem.split('_')
 
                 if len(name_parts) < 2:
-                    name = file_path.stem
+                    name = stem
                     version = 'v1'
                 else:
                     version = name_parts[-1]
@@ -242,23 +271,41 @@ class PromptManager:
                     self._templates[name] = {}
 
                 self._templates[name][version] = template
+                self._latest[name] = max(self._latest.get(name, version), version)
 
                 self.logger.info(f"Loaded template: {name} ({version})")
 
             except Exception as e:
-                self.logger.error(f"Failed to load template {file_path}", exc=e)
+                self.logger.error(f"Failed to load template {entry.path}", exc=e)
 
     def _load_experiments(self):
-        """Load experiment configurations from YAML."""
+        """
+        Load experiment configurations from YAML, or JSON for a .json file.
+
+        The file is only re-parsed when its modification time has changed
+        since the last successful load.
+        """
         if not self.experiments_file.exists():
             self.logger.info(f"Experiments file not found: {self.experiments_file}")
+            self._experiments.clear()
+            self._experiments_mtime = None
             # Create default experiments file
             self._create_default_experiments_file()
             return
 
+        mtime = self.experiments_file.stat().st_mtime_ns
+        if mtime == self._experiments_mtime:
+            self.logger.debug("Experiments file unchanged, keeping loaded experiments")
+            return
+
+        self._experiments.clear()
+
         try:
-            with open(self.experiments_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            if self.experiments_file.suffix == '.json':
+                config = orjson.loads(self.experiments_file.read_bytes())
+            else:
+                with open(self.experiments_file, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=_YamlLoader)
 
             if not config or 'experiments' not in config:
                 self.logger.warning("No experiments found in config")
@@ -278,6 +325,8 @@ class PromptManager:
 
                 self.logger.info(f"Loaded experiment: {experiment.name} (active={experiment.active})")
 
+            self._experiments_mtime = mtime
+
         except Exception as e:
             self.logger.error("Failed to load experiments", exc=e)
 
@@ -302,8 +351,13 @@ class PromptManager:
         try:
             self.experiments_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.experiments_file, 'w', encoding='utf-8') as f:
-                yaml.dump(default_config, f, default_flow_style=False)
+            if self.experiments_file.suffix == '.json':
+                self.experiments_file.write_bytes(
+                    orjson.dumps(default_config, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(self.experiments_file, 'w', encoding='utf-8') as f:
+                    yaml.dump(default_config, f, default_flow_style=False)
 
             self.logger.info(f"Created default experiments file: {self.experiments_file}")
 
@@ -318,13 +372,9 @@ class PromptManager:
             template: Template string
 
         Returns:
-            List of variable names
+            List of variable names (each once, in order of first use)
         """
-        import re
-        # Match {variable_name} patterns
-        pattern = r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}'
-        matches = re.findall(pattern, template)
-        return list(set(matches))
+        return list(dict.fromkeys(_VAR_RE.findall(template)))
 
     def get_prompt(
         self,
@@ -381,10 +431,18 @@ class PromptManager:
             template = versions[version]
         else:
             # Use latest version (highest version key)
-            template = versions[max(versions.keys())]
+            template = versions[self._latest[name]]
 
-        # Render template
-        return template.render(**kwargs)
+        # Render template; the version is resolved by now, so a cached
+        # rendering is valid even when an experiment picked it
+        try:
+            return self._render_cached(name, template.version, frozenset(kwargs.items()))
+        except TypeError:  # unhashable variable values
+            return template.render(**kwargs)
+
+    def _render(self, name: str, version: str, kwargs_items: frozenset) -> str:
+        """Render a template version (wrapped by the per-instance LRU cache)."""
+        return self._templates[name][version].render(**dict(kwargs_items))
 
     def get_experiment_variant(self, experiment_name: str) -> Optional[str]:
         """
@@ -405,7 +463,8 @@ class PromptManager:
         """Reload templates and experiments from disk."""
         self.logger.info("Reloading prompts and experiments")
         self._templates.clear()
-        self._experiments.clear()
+        self._latest.clear()
+        self._render_cached.cache_clear()
         self._load_templates()
         self._load_experiments()
 
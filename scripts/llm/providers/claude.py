@@ -5,10 +5,36 @@ Uses claude-4.5-haiku model (NEWEST 2025).
 Fastest Claude model with excellent coding capability.
 """
 
-from anthropic import Anthropic
-from typing import Dict
-from ..base import BaseLLMProvider, AnalysisResult, LLMConfig
-from ..exceptions import LLMProviderError, ConfigurationError
+import asyncio
+
+import orjson
+from anthropic import Anthropic, AsyncAnthropic
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from ..base import BaseLLMProvider, AnalysisResult, LLMConfig, MAX_CONCURRENT_REQUESTS
+from ..exceptions import LLMProviderError, ConfigurationError, JSONParseError
+from ..utils.http import get_http_client
+
+
+# Tool the model is forced to call, so the API returns the {sentence: reason}
+# object as structured input instead of free text that needs JSON repair
+SENTENCES_TOOL = {
+    "name": "report_sentences",
+    "description": "Report the selected sentences, each mapped to the reason it was selected.",
+    "input_schema": {
+        "type": "object",
+        "additionalProperties": {"type": "string"},
+    },
+}
+
+
+@lru_cache(maxsize=8)
+def _get_clients(api_key: str) -> Tuple[Anthropic, AsyncAnthropic]:
+    """Sync and async Anthropic clients per key, reused by every provider instance"""
+    return (
+        Anthropic(api_key=api_key, http_client=get_http_client()),
+        AsyncAnthropic(api_key=api_key)
+    )
 
 
 class ClaudeProvider(BaseLLMProvider):
@@ -21,7 +47,7 @@ class ClaudeProvider(BaseLLMProvider):
 
         try:
             # Initialize Anthropic client
-            self.client = Anthropic(api_key=self.config.api_key)
+            self.client, self.aclient = _get_clients(self.config.api_key)
 
             self.logger.info(f"Claude initialized with model: {self.config.model_name}")
         except Exception as e:
@@ -37,29 +63,87 @@ class ClaudeProvider(BaseLLMProvider):
             system_prompt: System instructions
 
         Returns:
-            Raw response text
+            Raw response text (the tool input serialized as JSON)
+
+        Raises:
+            LLMProviderError: If API call fails
+        """
+        return self._read_sentences(self._create_message(prompt, system_prompt))[1]
+
+    def _create_message(self, prompt: str, system_prompt: str):
+        """
+        Send the request and return the Message object
 
         Raises:
             LLMProviderError: If API call fails
         """
         try:
             self.logger.debug("Sending request to Claude API...")
-            message = self.client.messages.create(
-                model=self.config.model_name,
-                max_tokens=self.config.max_tokens or 4096,
-                temperature=self.config.temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+            return self.client.messages.create(
+                **self._request_params(prompt, system_prompt)
             )
 
-            return message.content[0].text
+        except Exception as e:
+            self.logger.error(f"Claude API call failed: {e}")
+            raise LLMProviderError(f"Claude API error: {e}")
+
+    async def _create_message_async(self, prompt: str, system_prompt: str):
+        """
+        Async version of _create_message, using the AsyncAnthropic client
+
+        Raises:
+            LLMProviderError: If API call fails
+        """
+        try:
+            self.logger.debug("Sending async request to Claude API...")
+            return await self.aclient.messages.create(
+                **self._request_params(prompt, system_prompt)
+            )
 
         except Exception as e:
             self.logger.error(f"Claude API call failed: {e}")
             raise LLMProviderError(f"Claude API error: {e}")
 
+    def _read_sentences(self, message) -> Tuple[Dict[str, str], str]:
+        """
+        Extract the sentence mapping from a response
+
+        Uses the report_sentences tool input directly; a plain text reply
+        (no tool call) falls back to JSON parsing.
+
+        Returns:
+            (sentences, raw response text)
+
+        Raises:
+            JSONParseError: If the response does not hold a {sentence: reason} object
+        """
+        for block in message.content:
+            if block.type == "tool_use":
+                sentences = block.input
+                if not isinstance(sentences, dict):
+                    raise JSONParseError(f"Expected dict, got {type(sentences)}")
+                if not all(type(value) is str for value in sentences.values()):
+                    raise JSONParseError("All keys and values must be strings")
+                return sentences, orjson.dumps(sentences).decode()
+
+        text = message.content[0].text
+        return self._parse_json_response(text), text
+
+    def _request_params(self, prompt: str, system_prompt: str) -> Dict:
+        """Build messages.create() arguments shared by the sync and async calls"""
+        return {
+            'model': self.config.model_name,
+            'max_tokens': self.config.max_tokens or 4096,
+            'temperature': self.config.temperature,
+            'system': system_prompt,
+            'messages': [
+                {"role": "user", "content": prompt}
+            ],
+            'tools': [SENTENCES_TOOL],
+            'tool_choice': {"type": "tool", "name": SENTENCES_TOOL["name"]},
+            'timeout': self.config.timeout,
+        }
+
     def analyze_article(self, article_text: str, system_prompt: str) -> AnalysisResult:
         """
         Analyze article with Claude
@@ -74,7 +158,7 @@ class ClaudeProvider(BaseLLMProvider):
         Raises:
             LLMProviderError: If analysis fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             self.logger.warning("Empty article text provided")
             return AnalysisResult(
                 sentences={},
@@ -83,11 +167,51 @@ class ClaudeProvider(BaseLLMProvider):
             )
 
         try:
-            # Call API
-            raw_response = self._call_api(article_text, system_prompt)
+            # Call API; the sentences come back as structured tool input
+            message = self._create_message(article_text, system_prompt)
+            sentences, raw_response = self._read_sentences(message)
+
+            self.logger.info(f"Successfully extracted {len(sentences)} sentences")
+
+            return AnalysisResult(
+                sentences=sentences,
+                provider="claude",
+                model=self.config.model_name,
+                raw_response=raw_response
+            )
 
-            # Parse JSON response
-            sentences = self._parse_json_response(raw_response)
+        except Exception as e:
+            self.logger.error(f"Claude analysis failed: {e}")
+            raise LLMProviderError(f"Claude analysis error: {e}")
+
+    async def analyze_article_async(self, article_text: str, system_prompt: str) -> AnalysisResult:
+        """
+        Async version of analyze_article
+
+        The request is awaited instead of blocking a thread, so many articles
+        can be in flight at once (see analyze_many).
+
+        Args:
+            article_text: Article body text
+            system_prompt: System prompt for analysis
+
+        Returns:
+            AnalysisResult with extracted sentences
+
+        Raises:
+            LLMProviderError: If analysis fails
+        """
+        if not article_text or article_text.isspace():
+            self.logger.warning("Empty article text provided")
+            return AnalysisResult(
+                sentences={},
+                provider="claude",
+                model=self.config.model_name
+            )
+
+        try:
+            message = await self._create_message_async(article_text, system_prompt)
+            sentences, raw_response = self._read_sentences(message)
 
             self.logger.info(f"Successfully extracted {len(sentences)} sentences")
 
@@ -101,3 +225,31 @@ class ClaudeProvider(BaseLLMProvider):
         except Exception as e:
             self.logger.error(f"Claude analysis failed: {e}")
             raise LLMProviderError(f"Claude analysis error: {e}")
+
+    async def analyze_many(
+        self,
+        article_texts: List[str],
+        system_prompt: str,
+        concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze several articles concurrently on the event loop
+
+        Args:
+            article_texts: Article body texts
+            system_prompt: System prompt for analysis
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Results in input order (None where analysis failed)
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(text: str) -> Optional[AnalysisResult]:
+            async with sem:
+                try:
+                    return await self.analyze_article_async(text, system_prompt)
+                except LLMProviderError:
+                    return None
+
+        return await asyncio.gather(*(one(text) for text in article_texts))
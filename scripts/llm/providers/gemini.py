@@ -6,11 +6,23 @@ Uses gemini-2.5-flash-lite model (NEWEST 2025).
 """
 
 import google.generativeai as genai
+from functools import lru_cache
 from typing import Dict
 from ..base import BaseLLMProvider, AnalysisResult, LLMConfig
 from ..exceptions import LLMProviderError, ConfigurationError
 
 
+@lru_cache(maxsize=1)
+def _configure(api_key: str) -> None:
+    """
+    genai.configure, only when the key changes
+
+    configure() replaces the SDK's global clients, dropping their open
+    connections, so repeating it for every provider instance is wasteful.
+    """
+    genai.configure(api_key=api_key)
+
+
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini API provider"""
 
@@ -21,7 +33,9 @@ class GeminiProvider(BaseLLMProvider):
 
         try:
             # Initialize Gemini
-            genai.configure(api_key=self.config.api_key)
+            _configure(self.config.api_key)
+            # Not cached: a model binds the configured client on first use,
+            # so a shared one could keep serving an earlier key
             self.model = genai.GenerativeModel(self.config.model_name)
 
             self.logger.info(f"Gemini initialized with model: {self.config.model_name}")
@@ -48,7 +62,10 @@ class GeminiProvider(BaseLLMProvider):
 
         try:
             self.logger.debug("Sending request to Gemini API...")
-            response = self.model.generate_content(full_prompt)
+            response = self.model.generate_content(
+                full_prompt,
+                request_options={"timeout": self.config.timeout}
+            )
             return response.text
         except Exception as e:
             self.logger.error(f"Gemini API call failed: {e}")
@@ -68,7 +85,7 @@ class GeminiProvider(BaseLLMProvider):
         Raises:
             LLMProviderError: If analysis fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             self.logger.warning("Empty article text provided")
             return AnalysisResult(
                 sentences={},
@@ -5,10 +5,22 @@ Uses meta-llama/Llama-3.1-8B-Instruct model (lightweight).
 Together AI provides OpenAI-compatible API.
 """
 
+from functools import lru_cache
 from openai import OpenAI
 from typing import Dict
 from ..base import BaseLLMProvider, AnalysisResult, LLMConfig
 from ..exceptions import LLMProviderError, ConfigurationError
+from ..utils.http import get_http_client
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str, base_url: str) -> OpenAI:
+    """Together AI client per (key, endpoint), reused by every provider instance"""
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=get_http_client()
+    )
 
 
 class LlamaProvider(BaseLLMProvider):
@@ -31,10 +43,7 @@ class LlamaProvider(BaseLLMProvider):
 
         try:
             # Initialize Together AI client (OpenAI-compatible)
-            self.client = OpenAI(
-                api_key=self.config.api_key,
-                base_url=self.config.base_url
-            )
+            self.client = _get_client(self.config.api_key, self.config.base_url)
 
             self.logger.info(f"Llama initialized with model: {self.config.model_name}")
             self.logger.info(f"Using Together AI endpoint: {self.config.base_url}")
@@ -67,7 +76,8 @@ class LlamaProvider(BaseLLMProvider):
                 model=self.config.model_name,
                 messages=messages,
                 temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 4096
+                max_tokens=self.config.max_tokens or 4096,
+                timeout=self.config.timeout
             )
 
             return response.choices[0].message.content
@@ -90,7 +100,7 @@ class LlamaProvider(BaseLLMProvider):
         Raises:
             LLMProviderError: If analysis fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             self.logger.warning("Empty article text provided")
             return AnalysisResult(
                 sentences={},
@@ -5,10 +5,18 @@ Uses mistral-small-2506 model (NEWEST 2025, 24B params).
 Improved accuracy with 2x fewer infinite generations.
 """
 
+from functools import lru_cache
 from mistralai import Mistral
 from typing import Dict
 from ..base import BaseLLMProvider, AnalysisResult, LLMConfig
 from ..exceptions import LLMProviderError, ConfigurationError
+from ..utils.http import get_http_client
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> Mistral:
+    """Mistral client per key, reused by every provider instance"""
+    return Mistral(api_key=api_key, client=get_http_client())
 
 
 class MistralProvider(BaseLLMProvider):
@@ -21,7 +29,7 @@ class MistralProvider(BaseLLMProvider):
 
         try:
             # Initialize Mistral client
-            self.client = Mistral(api_key=self.config.api_key)
+            self.client = _get_client(self.config.api_key)
 
             self.logger.info(f"Mistral initialized with model: {self.config.model_name}")
         except Exception as e:
@@ -53,7 +61,8 @@ class MistralProvider(BaseLLMProvider):
                 model=self.config.model_name,
                 messages=messages,
                 temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens
+                max_tokens=self.config.max_tokens,
+                timeout_ms=self.config.timeout * 1000
             )
 
             return response.choices[0].message.content
@@ -76,7 +85,7 @@ class MistralProvider(BaseLLMProvider):
         Raises:
             LLMProviderError: If analysis fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             self.logger.warning("Empty article text provided")
             return AnalysisResult(
                 sentences={},
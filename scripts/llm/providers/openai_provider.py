@@ -5,10 +5,22 @@ Uses gpt-5-nano model (NEWEST 2025).
 Supports JSON mode for structured output.
 """
 
+from functools import lru_cache
 from openai import OpenAI
-from typing import Dict
+from typing import Dict, Optional
 from ..base import BaseLLMProvider, AnalysisResult, LLMConfig
 from ..exceptions import LLMProviderError, ConfigurationError
+from ..utils.http import get_http_client
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """OpenAI client per (key, endpoint), reused by every provider instance"""
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,  # Allows custom endpoints
+        http_client=get_http_client()
+    )
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -21,10 +33,7 @@ class OpenAIProvider(BaseLLMProvider):
 
         try:
             # Initialize OpenAI client
-            self.client = OpenAI(
-                api_key=self.config.api_key,
-                base_url=self.config.base_url  # Allows custom endpoints
-            )
+            self.client = _get_client(self.config.api_key, self.config.base_url)
 
             self.logger.info(f"OpenAI initialized with model: {self.config.model_name}")
         except Exception as e:
@@ -57,7 +66,8 @@ class OpenAIProvider(BaseLLMProvider):
                 messages=messages,
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
-                response_format={"type": "json_object"}  # Enforce JSON output
+                response_format={"type": "json_object"},  # Enforce JSON output
+                timeout=self.config.timeout
             )
 
             return response.choices[0].message.content
@@ -80,7 +90,7 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             LLMProviderError: If analysis fails
         """
-        if not article_text or not article_text.strip():
+        if not article_text or article_text.isspace():
             self.logger.warning("Empty article text provided")
             return AnalysisResult(
                 sentences={},
@@ -0,0 +1,45 @@
+"""
+Shared HTTP connection pool for provider SDK clients
+
+The OpenAI, Together AI (Llama), Mistral and Anthropic SDKs all run on httpx.
+Passing every client the same httpx.Client keeps TLS connections alive across
+providers and calls instead of each client opening its own pool.
+"""
+
+import threading
+
+# Pool limits and default timeouts (seconds); per-call timeouts override these
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS = 64
+DEFAULT_TIMEOUT = 60.0
+CONNECT_TIMEOUT = 10.0
+
+_http_client = None
+_lock = threading.Lock()
+
+
+def get_http_client():
+    """
+    Get the process-wide httpx.Client used by provider SDKs
+
+    httpx is imported on first use, since it only ships with the SDKs.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _lock:
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS
+                    ),
+                    timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT)
+                )
+
+    return _http_client
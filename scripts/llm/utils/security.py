@@ -67,6 +67,11 @@ def get_api_key(provider_name: str) -> Optional[str]:
 
         if env_path.exists():
             load_dotenv(env_path)
+
+            # .env may also set LLM_* settings that were already read
+            from ..config import _read_env
+            _read_env.cache_clear()
+
             api_key = os.getenv(key_name)
             if api_key:
                 logger.debug(f"Found {key_name} in .env file")
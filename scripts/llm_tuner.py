@@ -5,16 +5,23 @@ import random
 from pathlib import Path
 import orjson
 import pandas as pd
-from jsonschema import validate
+from jsonschema import validators
 from jsonschema.exceptions import ValidationError
 from tqdm import tqdm
 
 from config import OPENAI_API_KEY, OPENAI_BASE_URL, OPENAI_MODEL, REQUEST_TIMEOUT, MAX_RETRIES, ensure_dir
 
 # OpenAI SDK v1
-from openai import OpenAI
+from openai import OpenAI, RateLimitError
 client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
 
+MAX_BACKOFF = 60  # seconds
+
+# --batch: smaller runs use direct calls, the batch turnaround isn't worth it
+BATCH_MIN_ROWS = 10
+BATCH_INPUT = Path("results/batch_input.jsonl")
+BATCH_DONE_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
 PROMPT_DIR = Path("prompts")
 DEFAULT_PROMPT_FILE = "base_prompt_ko.txt"
 PROVIDER_PROMPT_FILES = {
@@ -58,83 +65,218 @@ SCHEMA = {
     "required": ["claims", "fallacies", "quality_scores", "highlight_spans", "study_tips"]
 }
 
+# SCHEMA is checked and its validator built once; jsonschema.validate() repeats
+# both on every call
+_Validator = validators.validator_for(SCHEMA)
+_Validator.check_schema(SCHEMA)
+_VALIDATOR = _Validator(SCHEMA)
+
+# Appended to the next attempt after a reply that was not valid JSON for SCHEMA
+SCHEMA_RETRY_HINT = (
+    "The previous reply was not valid JSON matching the required schema. "
+    f"Return only a JSON object with keys: {', '.join(SCHEMA['required'])}."
+)
+
+
+def _retry_delay(e: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying after API error e on the given attempt (0-based).
+
+    Rate limits honour Retry-After when the server sends it; other errors
+    (timeouts, connection errors, 5xx) back off exponentially with jitter.
+    """
+    if isinstance(e, RateLimitError):
+        retry_after = e.response.headers.get("retry-after")
+        try:
+            return min(MAX_BACKOFF, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    return min(MAX_BACKOFF, 2 ** attempt + random.random())
+
+
+def _sample_rows(inp: str, n: int) -> list:
+    """
+    Uniform random sample of up to n records with body_text, in random order.
+
+    Reservoir sampling (Algorithm R) in one pass over the JSONL file, so only
+    the sample is held in memory rather than the whole corpus.
+    """
+    rows = []
+    seen = 0
+    with open(inp, "rb") as f:
+        for line in f:
+            try:
+                rec = orjson.loads(line)
+            except Exception:
+                continue
+            if not rec.get("body_text"):
+                continue
+            if seen < n:
+                rows.append(rec)
+            else:
+                j = random.randrange(seen + 1)
+                if j < n:
+                    rows[j] = rec
+            seen += 1
+    random.shuffle(rows)
+    return rows
+
 
-def call_llm(payload: dict, sys_prompt: str):
+def _request_body(payload: dict, sys_prompt: str, retry_hint: str = "") -> dict:
+    """Chat completion parameters, shared by direct calls and Batch API lines."""
     messages = [
         {"role": "system", "content": sys_prompt},
         {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
     ]
+    if retry_hint:
+        messages.append({"role": "user", "content": retry_hint})
+    return {
+        "model": OPENAI_MODEL,
+        "messages": messages,
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"}
+    }
+
+
+def call_llm(payload: dict, sys_prompt: str, retry_hint: str = ""):
     resp = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=messages,
-        temperature=0.2,
-        response_format={"type": "json_object"}
+        **_request_body(payload, sys_prompt, retry_hint), timeout=REQUEST_TIMEOUT
     )
     return resp.choices[0].message.content
 
 
-def main(inp: str, out: str, n: int, provider: str):
+def _payload(rec: dict) -> dict:
+    return {
+        "title": rec.get("headline"),
+        "url": rec.get("url"),
+        "published_at": rec.get("date"),
+        "body_text": rec.get("body_text")[:12000]
+    }
+
+
+def _output_record(rec: dict, data: dict) -> dict:
+    return {
+        "url": rec.get("url"),
+        "domain": rec.get("domain"),
+        "headline": rec.get("headline"),
+        "date": rec.get("date"),
+        "credibility_score": rec.get("credibility_score"),
+        "llm_analysis": data
+    }
+
+
+def _log_result(log_path: Path, rec: dict, ok: bool, tries: int, err_msg: str = ""):
+    with open(log_path, "a", encoding="utf-8") as lg:
+        lg.write(
+            f"{rec.get('url')},{'ok' if ok else 'fail'},{tries}\n")
+    if not ok:
+        # 실패 샘플도 기록(디버그용)
+        fail_dump = Path("results/failed_samples.jsonl")
+        with open(fail_dump, "ab") as fd:
+            fd.write(orjson.dumps(
+                {"url": rec.get("url"), "error": err_msg}) + b"\n")
+
+
+def run_sync(rows: list, out_f, sys_prompt: str, log_path: Path):
+    """One chat completion per row, with retries."""
+    for rec in tqdm(rows, desc="LLM Tuning"):
+        payload = _payload(rec)
+        ok = False
+        err_msg = ""
+        retry_hint = ""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                content = call_llm(payload, sys_prompt, retry_hint)
+                data = json.loads(content)
+                _VALIDATOR.validate(data)
+                out_f.write(orjson.dumps(_output_record(rec, data), option=orjson.OPT_APPEND_NEWLINE))
+                ok = True
+                break
+            except (ValidationError, json.JSONDecodeError) as e:
+                # Model answered but not in the expected shape: reprompt now
+                err_msg = str(e)
+                retry_hint = SCHEMA_RETRY_HINT
+            except Exception as e:
+                err_msg = str(e)
+                if attempt < MAX_RETRIES:
+                    time.sleep(_retry_delay(e, attempt))
+        _log_result(log_path, rec, ok, attempt + 1, err_msg)
+
+
+def run_batch(rows: list, out_f, sys_prompt: str, log_path: Path):
+    """
+    Submit all rows as one OpenAI Batch API job, wait for it, then write results.
+
+    Batch requests cost about half as much and have no per-request round trip,
+    but can take up to the 24h completion window; failed rows are not retried.
+    """
+    # custom_id is the row index, since URLs are not guaranteed unique
+    with open(BATCH_INPUT, "wb") as f:
+        for i, rec in enumerate(rows):
+            f.write(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _request_body(_payload(rec), sys_prompt)
+            }, option=orjson.OPT_APPEND_NEWLINE))
+
+    with open(BATCH_INPUT, "rb") as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"Submitted batch {batch.id} with {len(rows)} requests")
+
+    delay = 5
+    while batch.status not in BATCH_DONE_STATUSES:
+        time.sleep(delay)
+        delay = min(MAX_BACKOFF, delay * 2)
+        batch = client.batches.retrieve(batch.id)
+    print(f"Batch {batch.id} finished: {batch.status}")
+
+    results = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).content.splitlines():
+            item = orjson.loads(line)
+            results[item["custom_id"]] = item
+
+    for i, rec in enumerate(tqdm(rows, desc="LLM Tuning (batch)")):
+        item = results.get(str(i))
+        try:
+            if item is None:
+                raise RuntimeError(f"no result in batch {batch.id} ({batch.status})")
+            response = item["response"]
+            if item.get("error") or response["status_code"] != 200:
+                raise RuntimeError(item.get("error") or response["body"])
+            data = json.loads(response["body"]["choices"][0]["message"]["content"])
+            _VALIDATOR.validate(data)
+        except Exception as e:
+            _log_result(log_path, rec, False, 1, str(e))
+            continue
+        out_f.write(orjson.dumps(_output_record(rec, data), option=orjson.OPT_APPEND_NEWLINE))
+        _log_result(log_path, rec, True, 1)
+
+
+def main(inp: str, out: str, n: int, provider: str, batch: bool = False):
     ensure_dir(out)
     prompt_path = _resolve_prompt_path(provider, OPENAI_MODEL)
     sys_prompt = prompt_path.read_text(encoding="utf-8")
     print(f"Using prompt: {prompt_path.name} for provider={provider}, model={OPENAI_MODEL}")
 
-    # 입력 JSONL 로드
-    rows = []
-    with open(inp, "rb") as f:
-        for line in f:
-            try:
-                rec = orjson.loads(line)
-                if not rec.get("body_text"):
-                    continue
-                rows.append(rec)
-            except Exception:
-                continue
-    random.shuffle(rows)
-    rows = rows[:n]
+    # 입력 JSONL에서 n건 무작위 표본 추출(한 번 읽기, 메모리는 n건분)
+    rows = _sample_rows(inp, n)
 
     log_path = Path("results/tuning_log.csv")
     if not log_path.exists():
         log_path.write_text("url,status,tries\n", encoding="utf-8")
 
     with open(out, "wb") as out_f:
-        for rec in tqdm(rows, desc="LLM Tuning"):
-            payload = {
-                "title": rec.get("headline"),
-                "url": rec.get("url"),
-                "published_at": rec.get("date"),
-                "body_text": rec.get("body_text")[:12000]
-            }
-            ok = False
-            err_msg = ""
-            for attempt in range(MAX_RETRIES + 1):
-                try:
-                    content = call_llm(payload, sys_prompt)
-                    data = json.loads(content)
-                    validate(instance=data, schema=SCHEMA)
-                    rec_out = {
-                        "url": rec.get("url"),
-                        "domain": rec.get("domain"),
-                        "headline": rec.get("headline"),
-                        "date": rec.get("date"),
-                        "credibility_score": rec.get("credibility_score"),
-                        "llm_analysis": data
-                    }
-                    out_f.write(orjson.dumps(rec_out) + b"\n")
-                    ok = True
-                    break
-                except Exception as e:
-                    err_msg = str(e)
-                    time.sleep(1.2)
-            with open(log_path, "a", encoding="utf-8") as lg:
-                lg.write(
-                    f"{rec.get('url')},{'ok' if ok else 'fail'},{attempt+1}\n")
-            if not ok:
-                # 실패 샘플도 기록(디버그용)
-                fail_dump = Path("results/failed_samples.jsonl")
-                with open(fail_dump, "ab") as fd:
-                    fd.write(orjson.dumps(
-                        {"url": rec.get("url"), "error": err_msg}) + b"\n")
+        if batch and len(rows) >= BATCH_MIN_ROWS:
+            run_batch(rows, out_f, sys_prompt, log_path)
+        else:
+            run_sync(rows, out_f, sys_prompt, log_path)
 
 
 if __name__ == "__main__":
@@ -149,5 +291,10 @@ if __name__ == "__main__":
         choices=sorted(PROVIDER_PROMPT_FILES.keys()),
         help="Prompt provider variant to use"
     )
+    ap.add_argument(
+        "--batch",
+        action="store_true",
+        help=f"Submit through the OpenAI Batch API (runs of {BATCH_MIN_ROWS}+ rows)"
+    )
     args = ap.parse_args()
-    main(args.inp, args.out, args.n, args.provider)
+    main(args.inp, args.out, args.n, args.provider, args.batch)
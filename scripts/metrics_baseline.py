@@ -1,76 +1,122 @@
 import argparse
+import os
 import re
-import orjson
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import orjson
+
+# 워커 프로세스 하나가 한 번에 처리하는 줄 수
+CHUNK_SIZE = 512
 
 MODALS_KO = ["수도", "수도있", "수도 있", "듯", "같", "아마", "가능", "추정"]
 
+_SENT_RE = re.compile(r"[\.!?\n]+")
+# 토큰에 MODALS_KO 중 하나라도 포함되는지(부분 문자열) 한 번에 검사
+_MODAL_RE = re.compile("|".join(map(re.escape, MODALS_KO)))
+
 
 def sentences(text: str):
     # 매우 단순한 문장 분할(1주차용)
-    return [s for s in re.split(r"[\.!?\n]+", text) if s.strip()]
+    return [s for s in _SENT_RE.split(text) if s.strip()]
 
 
 def tokens(text: str):
-    # 공백기반 토큰화(한국어 정교화 전 단계)
-    return [t for t in re.split(r"\s+", text) if t]
+    # 공백기반 토큰화(한국어 정교화 전 단계); str.split()은 \s+ 분할과 동일
+    return text.split()
 
 
-def ttr(text: str):
-    ts = tokens(text)
+def _ttr(ts: list):
     if not ts:
         return 0.0
     return len(set(ts)) / len(ts)
 
 
-def modal_ratio(text: str):
-    ts = tokens(text)
+def _modal_ratio(ts: list):
     if not ts:
         return 0.0
-    cnt = 0
-    for w in ts:
-        if any(m in w for m in MODALS_KO):
-            cnt += 1
-    return cnt / len(ts)
+    search = _MODAL_RE.search
+    return sum(1 for w in ts if search(w)) / len(ts)
 
 
-def avg_sent_len(text: str):
-    ss = sentences(text)
+def _avg_sent_len(ss: list):
     if not ss:
         return 0.0
-    return sum(len(tokens(s)) for s in ss) / len(ss)
+    return sum(len(s.split()) for s in ss) / len(ss)
+
+
+def ttr(text: str):
+    return _ttr(tokens(text))
+
+
+def modal_ratio(text: str):
+    return _modal_ratio(tokens(text))
+
+
+def avg_sent_len(text: str):
+    return _avg_sent_len(sentences(text))
+
+
+def _metrics(text: str):
+    # ttr/modal_ratio/avg_sent_len을 한 번에 계산(값은 개별 함수와 동일)
+    ts = text.split()
+    # 토큰 빈도 한 번으로 고유 토큰 수와 조동사 포함 토큰 수를 함께 구함
+    # (정규식 검사는 고유 토큰마다 한 번)
+    counts = Counter(ts)
+    search = _MODAL_RE.search
+    modal = sum(c for w, c in counts.items() if search(w))
+    # 문장별 토큰 수; 공백뿐인 조각은 토큰 0개이므로 제외
+    sent_lens = [n for n in map(len, map(str.split, _SENT_RE.split(text))) if n]
+    n_tok = len(ts)
+    return {
+        "ttr": round(len(counts) / n_tok, 4) if n_tok else 0.0,
+        "modal_ratio": round(modal / n_tok, 4) if n_tok else 0.0,
+        "avg_sent_len": round(sum(sent_lens) / len(sent_lens), 2) if sent_lens else 0.0
+    }
 
 
 def enrich(rec: dict):
     text = rec.get("body_text", "")
     rec.setdefault("metrics", {})
-    rec["metrics"].update({
-        "ttr": round(ttr(text), 4),
-        "modal_ratio": round(modal_ratio(text), 4),
-        "avg_sent_len": round(avg_sent_len(text), 2)
-    })
+    rec["metrics"].update(_metrics(text))
     return rec
 
 
-def main(inp: str, out: str):
-    import sys
-    tmp_lines = []
-    with open(inp, "rb") as f:
-        for line in f:
-            try:
-                rec = orjson.loads(line)
-                rec = enrich(rec)
-                tmp_lines.append(orjson.dumps(rec))
-            except Exception:
-                continue
-    with open(out, "wb") as g:
-        for b in tmp_lines:
-            g.write(b + b"\n")
+def _enrich_line(line: bytes):
+    # JSONL 한 줄 -> 메트릭이 추가된 한 줄(파싱 실패 시 None)
+    try:
+        rec = enrich(orjson.loads(line))
+    except Exception:
+        return None
+    return orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def main(inp: str, out: str, workers: int = None):
+    # workers: 프로세스 수(기본값: CPU 수, 0이면 현재 프로세스에서 처리)
+    workers = os.cpu_count() if workers is None else workers
+    with open(inp, "rb") as f, open(out, "wb") as g:
+        if not workers:
+            # 한 줄씩 읽고 바로 기록(입력 전체를 메모리에 올리지 않음)
+            for line in f:
+                b = _enrich_line(line)
+                if b is not None:
+                    g.write(b)
+            return
+
+        # 입력을 묶음 단위로 읽어 워커에 분배; 메모리는 묶음 크기만큼, 출력 순서는 입력 순서
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch in iter(lambda: list(islice(f, workers * CHUNK_SIZE)), []):
+                for b in pool.map(_enrich_line, batch, chunksize=CHUNK_SIZE):
+                    if b is not None:
+                        g.write(b)
 
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--in", dest="inp", required=True)
     ap.add_argument("--out", dest="out", required=True)
+    ap.add_argument("--workers", dest="workers", type=int, default=None,
+                    help="Worker processes (default: CPU count, 0: no pool)")
     args = ap.parse_args()
-    main(args.inp, args.out)
+    main(args.inp, args.out, args.workers)
@@ -28,7 +28,7 @@ from api.errors import (
     error_response,
     make_success_response
 )
-from database import init_database, get_session, session_scope, AnalyticsRepository, check_database_health
+from database import init_database, get_session, get_log_buffer, check_database_health
 
 # Setup logging first
 setup_logging(
@@ -77,36 +77,43 @@ def log_request_to_database(
     duration_ms: int,
     error_message: str = None
 ):
-    """Log request to analytics database."""
+    """Queue request log for the analytics database (written in batches)."""
     try:
-        with session_scope() as session:
-            repo = AnalyticsRepository(session)
-            repo.log_request(
-                correlation_id=get_correlation_id() or "unknown",
-                url=url,
-                mode=mode,
-                providers=providers,
-                status=status,
-                duration_ms=duration_ms,
-                error_message=error_message,
-                error_type=type(error_message).__name__ if error_message else None
-            )
+        get_log_buffer().log_request(
+            correlation_id=get_correlation_id() or "unknown",
+            url=url,
+            mode=mode,
+            providers=providers,
+            status=status,
+            duration_ms=duration_ms,
+            error_message=error_message,
+            error_type=type(error_message).__name__ if error_message else None
+        )
     except Exception as e:
         logger.error(f"Failed to log request to database: {e}")
 
 
-def log_analysis_to_database(provider: str, sentence_count: int, latency_ms: int, success: bool = True):
-    """Log analysis result to database."""
+def log_analysis_to_database(
+    provider: str,
+    sentence_count: int,
+    latency_ms: int,
+    success: bool = True,
+    content_hash: str = None,
+    sentences: dict = None,
+    model_name: str = None
+):
+    """Queue analysis result for the database (written in batches)."""
     try:
-        with session_scope() as session:
-            repo = AnalyticsRepository(session)
-            repo.log_analysis_result(
-                correlation_id=get_correlation_id() or "unknown",
-                provider=provider,
-                sentence_count=sentence_count,
-                latency_ms=latency_ms,
-                success=success
-            )
+        get_log_buffer().log_analysis_result(
+            correlation_id=get_correlation_id() or "unknown",
+            provider=provider,
+            sentence_count=sentence_count,
+            latency_ms=latency_ms,
+            success=success,
+            content_hash=content_hash,
+            sentences=sentences,
+            model_name=model_name
+        )
     except Exception as e:
         logger.error(f"Failed to log analysis to database: {e}")
 
@@ -196,13 +203,17 @@ def analyze_article_endpoint():
             use_cache=settings.enable_cache
         )
 
-        # Log to database
-        log_analysis_to_database(
-            provider='gemini',
-            sentence_count=len(analysis_result.sentences),
-            latency_ms=analysis_result.duration_ms,
-            success=True
-        )
+        # Log to database (a reused stored analysis made no provider call)
+        if not analysis_result.reused:
+            log_analysis_to_database(
+                provider='gemini',
+                sentence_count=len(analysis_result.sentences),
+                latency_ms=analysis_result.duration_ms,
+                success=True,
+                content_hash=analysis_result.content_hash,
+                sentences=analysis_result.sentences,
+                model_name=analysis_result.model_name
+            )
 
         # Step 3: Format response
         logger.info("[3/3] Formatting response")
@@ -12,6 +12,7 @@ from collections import defaultdict
 
 from .base_service import BaseService, ServiceError
 from observability import metrics
+from database import session_scope, AnalyticsRepository, content_hash
 
 
 @dataclass
@@ -23,6 +24,8 @@ class AnalysisResult:
     duration_ms: Optional[int] = None
     success: bool = True
     error_message: Optional[str] = None
+    content_hash: Optional[str] = None  # content_hash() of the analyzed article text
+    reused: bool = False  # served from a stored analysis, not a new provider call
 
 
 @dataclass
@@ -69,6 +72,14 @@ class AnalysisService(BaseService):
             self._gemini_analyzer = GeminiAnalyzer()
         return self._gemini_analyzer
 
+    @staticmethod
+    def _get_model_name(provider: str) -> Optional[str]:
+        """Model a single analysis with this provider runs on (None if unsupported)."""
+        if provider == 'gemini':
+            from gemini_handler import GEMINI_MODEL
+            return GEMINI_MODEL
+        return None
+
     def _get_consensus_analyzer(self, providers: List[str]):
         """Lazy load consensus analyzer."""
         import sys
@@ -218,6 +229,18 @@ class AnalysisService(BaseService):
             "token_estimated": True
         }
 
+    def _get_stored_sentences(self, text_hash: str, provider: str, model_name: str) -> Optional[Dict[str, str]]:
+        """Look up a recent stored analysis of the same article text (None on miss or DB error)."""
+        from config import settings
+        try:
+            with session_scope() as session:
+                return AnalyticsRepository(session).get_cached_sentences(
+                    text_hash, provider, model_name, settings.database.analysis_memo_ttl
+                )
+        except Exception as e:
+            self.log_warning("Stored analysis lookup failed", error=str(e))
+            return None
+
     def analyze_single(self, article_text: str, provider: str = 'gemini', url: Optional[str] = None, use_cache: bool = True) -> AnalysisResult:
         """
         Analyze article with a single LLM provider.
@@ -240,6 +263,7 @@ class AnalysisService(BaseService):
                 print(f"{sentence}: {reason}")
         """
         start_time = time.time()
+        text_hash = content_hash(article_text)
 
         self.log_info("Starting single LLM analysis", provider=provider, text_length=len(article_text))
         self.increment_counter("analysis_requests", tags={"mode": "single", "provider": provider})
@@ -254,7 +278,26 @@ class AnalysisService(BaseService):
                     provider=provider,
                     sentences=cached_result.get('sentences', {}),
                     duration_ms=cached_result.get('duration_ms'),
-                    success=True
+                    success=True,
+                    content_hash=text_hash
+                )
+
+        # Then the analytics database, for the same article text analyzed before
+        model_name = self._get_model_name(provider)
+        if use_cache and model_name:
+            stored_sentences = self._get_stored_sentences(text_hash, provider, model_name)
+            if stored_sentences is not None:
+                self.log_info("Stored analysis hit for single analysis", provider=provider)
+                self.increment_counter("analysis_memo_hits", tags={"provider": provider})
+
+                return AnalysisResult(
+                    provider=provider,
+                    sentences=stored_sentences,
+                    model_name=model_name,
+                    duration_ms=int((time.time() - start_time) * 1000),
+                    success=True,
+                    content_hash=text_hash,
+                    reused=True
                 )
 
         try:
@@ -270,8 +313,10 @@ class AnalysisService(BaseService):
             result = AnalysisResult(
                 provider=provider,
                 sentences=sentences,
+                model_name=model_name,
                 duration_ms=duration_ms,
-                success=True
+                success=True,
+                content_hash=text_hash
             )
 
             token_usage = self._record_single_token_usage(provider, article_text, sentences)
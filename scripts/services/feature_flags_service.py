@@ -5,9 +5,9 @@ Provides programmatic access to feature flags with in-memory caching
 for performance. Enables/disables features without code changes.
 """
 
-import json
+import time
+
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
 
 from .base_service import BaseService
 from database import session_scope, AnalyticsRepository
@@ -42,7 +42,7 @@ class FeatureFlagsService(BaseService):
         """
         super().__init__("FeatureFlagsService")
         self._cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_timestamp: Optional[datetime] = None
+        self._cache_timestamp: Optional[float] = None  # time.monotonic() of last load
         self._cache_duration = cache_duration
 
     def _load_flags_from_db(self) -> Dict[str, Dict[str, Any]]:
@@ -60,12 +60,7 @@ class FeatureFlagsService(BaseService):
                 all_flags = repo.get_all_feature_flags()
 
                 for flag in all_flags:
-                    flags[flag.flag_name] = {
-                        'enabled': flag.enabled,
-                        'config': self._parse_config(flag.config),
-                        'description': flag.description,
-                        'updated_at': flag.updated_at
-                    }
+                    flags[flag.flag_name] = self._flag_to_dict(flag)
 
                 self.log_info(f"Loaded {len(flags)} feature flags from database")
 
@@ -75,32 +70,22 @@ class FeatureFlagsService(BaseService):
 
         return flags
 
-    def _parse_config(self, config_str: Optional[str]) -> Optional[Dict[str, Any]]:
-        """
-        Parse JSON config string.
-
-        Args:
-            config_str: JSON config string
-
-        Returns:
-            Parsed config dict or None
-        """
-        if not config_str:
-            return None
-
-        try:
-            return json.loads(config_str)
-        except json.JSONDecodeError as e:
-            self.log_warning(f"Failed to parse feature flag config: {config_str}", exc=e)
-            return None
+    def _flag_to_dict(self, flag) -> Dict[str, Any]:
+        """Convert a FeatureFlag row to its cached dictionary form."""
+        return {
+            'enabled': flag.enabled,
+            'config': flag.config,  # JSON column, already a dict
+            'description': flag.description,
+            'updated_at': flag.updated_at
+        }
 
     def _refresh_cache_if_needed(self):
         """Refresh cache if it's expired."""
-        now = datetime.utcnow()
+        now = time.monotonic()
 
         # Refresh if cache is empty or expired
-        if (not self._cache_timestamp or
-            (now - self._cache_timestamp).total_seconds() > self._cache_duration):
+        if (self._cache_timestamp is None or
+            now - self._cache_timestamp > self._cache_duration):
 
             self.log_debug("Refreshing feature flags cache")
             self._cache = self._load_flags_from_db()
@@ -262,8 +247,10 @@ class FeatureFlagsService(BaseService):
                 )
 
                 if flag:
-                    # Invalidate cache to force reload
-                    self._cache_timestamp = None
+                    # Update just this entry; a loaded cache stays valid for
+                    # the other flags, so no full reload is needed
+                    if self._cache_timestamp is not None:
+                        self._cache[flag_name] = self._flag_to_dict(flag)
 
                     self.log_info(
                         f"Feature flag '{flag_name}' set to {enabled}",
@@ -0,0 +1,79 @@
+"""
+On-disk index of crawled URLs for incremental re-crawls.
+
+Stores the ETag / Last-Modified validators and a digest of the body for
+every fetched URL so crawlers can send conditional requests and skip
+articles that have not changed since the previous run.
+"""
+
+import hashlib
+import sqlite3
+from typing import Dict, Optional
+
+DEFAULT_CACHE_PATH = ".crawler_cache.sqlite3"
+
+
+def body_digest(content: bytes) -> str:
+    """Return a short, stable digest of a response body."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class URLCache:
+    """SQLite-backed map of url -> (etag, last_modified, body_sha)."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_cache ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " body_sha TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Optional[str]]]:
+        row = self._conn.execute(
+            "SELECT etag, last_modified, body_sha FROM url_cache WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "body_sha": row[2]}
+
+    def conditional_headers(self, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+        """Copy `headers` and add If-None-Match / If-Modified-Since when known."""
+        headers = dict(headers)
+        meta = self.get(url)
+        if meta:
+            if meta["etag"]:
+                headers["If-None-Match"] = meta["etag"]
+            if meta["last_modified"]:
+                headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def is_changed(self, url: str, body_sha: str) -> bool:
+        """
+        Return True if `body_sha` differs from the cached digest (or the URL is new),
+        False if the body is byte-identical to the previous crawl.
+        """
+        meta = self.get(url)
+        return meta is None or meta["body_sha"] != body_sha
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str],
+               body_sha: str):
+        """
+        Record a response for `url`.
+
+        Call this only once the article has been stored, so a URL whose parse
+        or write failed is fetched again on the next run.
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO url_cache (url, etag, last_modified, body_sha)"
+            " VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, body_sha),
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
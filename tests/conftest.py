@@ -34,6 +34,28 @@ def temp_database():
         os.unlink(db_path)
 
 
+@pytest.fixture
+def isolated_database(temp_database, monkeypatch):
+    """
+    Point the database module at a fresh temporary database.
+
+    The engine and session factory are module globals created from
+    settings.database.path on first use, so both are reset here and
+    restored after the test.
+    """
+    from config import settings
+    from database import init_db
+
+    monkeypatch.setattr(settings.database, 'path', temp_database)
+    monkeypatch.setattr(init_db, '_engine', None)
+    monkeypatch.setattr(init_db, '_SessionFactory', None)
+    init_db.init_database()
+
+    yield temp_database
+
+    init_db.get_engine().dispose()
+
+
 @pytest.fixture
 def mock_article_html():
     """Sample article HTML for testing crawlers."""
@@ -293,3 +293,90 @@ class TestEndToEndWorkflow:
         # Verify end-to-end
         logged = repo.get_analysis_results_by_url(url)
         assert len(logged) > 0
+
+
+class TestStoredAnalysisMemo:
+    """Test reuse of stored analyses for repeat article texts."""
+
+    ARTICLE_TEXT = "같은 기사 본문입니다. 두 번째 문장입니다."
+    STORED_SENTENCES = {"같은 기사 본문입니다.": "저장된 이유"}
+
+    @pytest.fixture
+    def analysis_service(self, isolated_database):
+        """AnalysisService with a stubbed Gemini analyzer and one stored analysis."""
+        from gemini_handler import GEMINI_MODEL
+        from database import AnalyticsRepository, content_hash, session_scope
+
+        with session_scope() as session:
+            AnalyticsRepository(session).log_analysis_result(
+                correlation_id="memo_seed",
+                provider="gemini",
+                sentence_count=len(self.STORED_SENTENCES),
+                model_name=GEMINI_MODEL,
+                content_hash=content_hash(self.ARTICLE_TEXT),
+                sentences=self.STORED_SENTENCES
+            )
+
+        service = AnalysisService()
+        service._gemini_analyzer = Mock()
+        service._gemini_analyzer.analyze_article.return_value = {"새 문장": "새 이유"}
+        return service
+
+    def test_same_text_reuses_stored_analysis(self, analysis_service):
+        """Test that the same content_hash is served from the database."""
+        result = analysis_service.analyze_single(self.ARTICLE_TEXT)
+
+        assert result.reused is True
+        assert result.sentences == self.STORED_SENTENCES
+        analysis_service._gemini_analyzer.analyze_article.assert_not_called()
+
+    def test_expired_analysis_is_not_reused(self, analysis_service, monkeypatch):
+        """Test that a stored analysis older than the TTL is a miss."""
+        from config import settings
+        from database import AnalysisResult as AnalysisResultModel, session_scope
+        from database.models import now_ms
+
+        monkeypatch.setattr(settings.database, 'analysis_memo_ttl', 60)
+        with session_scope() as session:
+            session.query(AnalysisResultModel).update({'timestamp_ms': now_ms() - 120 * 1000})
+
+        result = analysis_service.analyze_single(self.ARTICLE_TEXT)
+
+        assert result.reused is False
+        assert result.sentences == {"새 문장": "새 이유"}
+        analysis_service._gemini_analyzer.analyze_article.assert_called_once()
+
+    def test_different_text_is_not_reused(self, analysis_service):
+        """Test that a different article text is a miss."""
+        result = analysis_service.analyze_single(self.ARTICLE_TEXT + " 수정된 문장입니다.")
+
+        assert result.reused is False
+        analysis_service._gemini_analyzer.analyze_article.assert_called_once()
+
+    @pytest.mark.parametrize("reused, logged", [(True, False), (False, True)])
+    def test_reused_analysis_is_not_logged_again(self, monkeypatch, reused, logged):
+        """Test that /analyze logs an analysis result only for a new provider call."""
+        import server
+        from api import middleware
+        from services.analysis_service import AnalysisResult
+
+        # The request loggers take structured keyword fields the stdlib logger rejects
+        monkeypatch.setattr(server, 'logger', Mock())
+        monkeypatch.setattr(middleware, 'logger', Mock())
+        monkeypatch.setattr(server.crawler_service, 'crawl_article',
+                            Mock(return_value=Mock(body_text=self.ARTICLE_TEXT, headline="제목")))
+        monkeypatch.setattr(server.analysis_service, 'analyze_single', Mock(return_value=AnalysisResult(
+            provider="gemini",
+            sentences=self.STORED_SENTENCES,
+            success=True,
+            reused=reused
+        )))
+        log_analysis = Mock()
+        monkeypatch.setattr(server, 'log_analysis_to_database', log_analysis)
+        monkeypatch.setattr(server, 'log_request_to_database', Mock())
+
+        response = server.app.test_client().post('/analyze', json={"url": "https://test.com/article"})
+
+        assert response.status_code == 200
+        assert response.get_json()["count"] == len(self.STORED_SENTENCES)
+        assert log_analysis.called is logged
@@ -0,0 +1,116 @@
+"""
+Unit tests for the multi-LLM consensus analyzer.
+"""
+
+import threading
+import time
+
+import pytest
+
+from consensus_analyzer import ConsensusAnalyzer
+
+
+class FakeLLM:
+    """Provider stub returning fixed sentences, optionally once `release` is set."""
+
+    def __init__(self, sentences, release=None):
+        self.sentences = sentences
+        self.release = release
+        self.started = threading.Event()
+
+    def analyze(self, prompt):
+        self.started.set()
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        return self.sentences
+
+
+@pytest.fixture
+def slow_release():
+    """Event that holds the slow provider until the test is done with it."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def make_analyzer(llm_instances):
+    """ConsensusAnalyzer over fake providers, skipping real provider setup."""
+    analyzer = object.__new__(ConsensusAnalyzer)
+    analyzer.providers = list(llm_instances)
+    analyzer.llm_instances = llm_instances
+    return analyzer
+
+
+class TestEarlyExit:
+    """Test analyze_article(early_exit=True)."""
+
+    def test_returns_after_two_successes(self, slow_release):
+        """Test that a slow third provider is cancelled, not failed."""
+        slow = FakeLLM({"늦은 문장": "이유 D"}, release=slow_release)
+        # The fast providers answer once the slow one is running
+        analyzer = make_analyzer({
+            'gemini': FakeLLM({"공통 문장": "이유 A", "첫 문장": "이유 B"}, release=slow.started),
+            'mistral': FakeLLM({"공통 문장": "이유 C"}, release=slow.started),
+            'openai': slow,
+        })
+
+        start = time.time()
+        result = analyzer.analyze_article("기사 본문", early_exit=True)
+        elapsed = time.time() - start
+
+        # Returned while the slow provider was still in flight
+        assert elapsed < 2
+        assert slow.started.is_set()
+        assert not slow_release.is_set()
+        assert result['success'] is True
+        assert sorted(result['successful_providers']) == ['gemini', 'mistral']
+        assert result['cancelled_providers'] == ['openai']
+        assert result['failed_providers'] == []
+        assert result['total_providers'] == 3
+
+        texts = [s['text'] for s in result['sentences']]
+        assert texts[0] == "공통 문장"
+        assert result['sentences'][0]['consensus_score'] == 2
+        assert "늦은 문장" not in texts
+
+    def test_failed_provider_is_not_cancelled(self, slow_release):
+        """Test that a provider error is reported in failed_providers."""
+        failed = threading.Event()
+
+        class BrokenLLM:
+            def analyze(self, prompt):
+                failed.set()
+                raise RuntimeError("quota exceeded")
+
+        class AfterFailureLLM(FakeLLM):
+            def analyze(self, prompt):
+                # Second success only once the failure has come back
+                failed.wait(timeout=5)
+                time.sleep(0.1)
+                return super().analyze(prompt)
+
+        analyzer = make_analyzer({
+            'gemini': FakeLLM({"문장": "이유"}),
+            'claude': BrokenLLM(),
+            'mistral': AfterFailureLLM({"문장": "이유"}),
+            'openai': FakeLLM({"문장": "이유"}, release=slow_release),
+        })
+
+        result = analyzer.analyze_article("기사 본문", early_exit=True)
+
+        assert result['failed_providers'] == ['claude']
+        assert result['cancelled_providers'] == ['openai']
+
+    def test_without_early_exit_waits_for_all(self):
+        """Test that every provider is tallied when early_exit is off."""
+        analyzer = make_analyzer({
+            'gemini': FakeLLM({"문장": "이유"}),
+            'mistral': FakeLLM({"문장": "이유"}),
+            'openai': FakeLLM({"문장": "이유"}),
+        })
+
+        result = analyzer.analyze_article("기사 본문")
+
+        assert sorted(result['successful_providers']) == ['gemini', 'mistral', 'openai']
+        assert result['cancelled_providers'] == []
+        assert result['sentences'][0]['consensus_score'] == 3
@@ -0,0 +1,199 @@
+"""
+Unit tests for the shared asynchronous crawl loop.
+"""
+
+import asyncio
+import importlib
+from functools import partial
+
+import orjson
+import pytest
+
+import crawl_async
+from crawl_async import DomainRateLimiter, crawl
+
+
+class FakeResponse:
+    """aiohttp response stub that arrives after `latency` seconds."""
+
+    def __init__(self, url, latency, fail):
+        self.url = url
+        self.latency = latency
+        self.fail = fail
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.fail:
+            raise RuntimeError(f"500 for {self.url}")
+
+    async def text(self):
+        return f"<html>{self.url}</html>"
+
+    async def read(self):
+        return f"<html>{self.url}</html>".encode()
+
+
+class FakeSession:
+    """aiohttp.ClientSession stub with per-URL latency and failures."""
+
+    latency = {}
+    failing = set()
+
+    def __init__(self, headers=None, timeout=None):
+        self.headers = headers
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get(self, url):
+        return FakeResponse(url, self.latency.get(url, 0), url in self.failing)
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Replace aiohttp.ClientSession in crawl_async with FakeSession."""
+    monkeypatch.setattr(FakeSession, "latency", {})
+    monkeypatch.setattr(FakeSession, "failing", set())
+    monkeypatch.setattr(crawl_async.aiohttp, "ClientSession", FakeSession)
+    return FakeSession
+
+
+def parse(url, html):
+    """Parser stub returning the fetched URL."""
+    return {"url": url, "body_text": html}
+
+
+async def collect(urls, parse_fn=parse, **kwargs):
+    kwargs.setdefault("delay", 0)
+    return [rec async for rec in crawl(urls, parse_fn, {}, parse_workers=0, **kwargs)]
+
+
+class TestDomainRateLimiter:
+    """Test per-host request spacing."""
+
+    def test_same_host_requests_are_spaced(self):
+        """Test that requests to one host are at least `delay` apart, other hosts are not held back."""
+        delay = 0.05
+        urls = [
+            "https://a.example.com/1",
+            "https://a.example.com/2",
+            "https://a.example.com/3",
+            "https://b.example.com/1",
+        ]
+
+        async def run():
+            limiter = DomainRateLimiter(delay)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+
+            async def wait(url):
+                await limiter.wait(url)
+                return loop.time() - start
+
+            return await asyncio.gather(*(wait(url) for url in urls))
+
+        a1, a2, a3, b1 = asyncio.run(run())
+
+        tolerance = 0.01
+        assert a2 - a1 >= delay - tolerance
+        assert a3 - a2 >= delay - tolerance
+        assert b1 < delay - tolerance
+
+
+class TestCrawl:
+    """Test the concurrent fetch-and-parse loop."""
+
+    def test_records_follow_input_order(self, fake_session):
+        """Test that a slow first URL does not reorder the records."""
+        urls = [f"https://site{i}.example.com/article" for i in range(5)]
+        fake_session.latency = {urls[0]: 0.1, urls[2]: 0.05}
+
+        records = asyncio.run(collect(urls))
+
+        assert [rec["url"] for rec in records] == urls
+
+    def test_fetches_run_concurrently(self, fake_session):
+        """Test that slow fetches overlap instead of running one after another."""
+        urls = [f"https://site{i}.example.com/article" for i in range(5)]
+        fake_session.latency = {url: 0.1 for url in urls}
+
+        async def timed():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await collect(urls)
+            return loop.time() - start
+
+        assert asyncio.run(timed()) < 0.3
+
+    def test_failed_fetch_becomes_error_record(self, fake_session):
+        """Test that a failing fetch or parse is recorded and the crawl continues."""
+        urls = [
+            "https://site.example.com/ok",
+            "https://site.example.com/http-error",
+            "https://site.example.com/bad-html",
+            "https://site.example.com/ok2",
+        ]
+        fake_session.failing = {urls[1]}
+
+        def parse_or_fail(url, html):
+            if url.endswith("bad-html"):
+                raise ValueError("no article body")
+            return parse(url, html)
+
+        records = asyncio.run(collect(urls, parse_or_fail))
+
+        assert [rec["url"] for rec in records] == urls
+        assert records[0]["body_text"] == f"<html>{urls[0]}</html>"
+        assert records[1] == {"url": urls[1], "error": f"500 for {urls[1]}"}
+        assert records[2] == {"url": urls[2], "error": "no article body"}
+        assert "error" not in records[3]
+
+    def test_raw_passes_bytes(self, fake_session):
+        """Test that raw=True hands parse_fn the undecoded body."""
+        records = asyncio.run(collect(["https://site.example.com/a"], raw=True))
+
+        assert records[0]["body_text"] == b"<html>https://site.example.com/a</html>"
+
+
+class TestCrawlerOutput:
+    """Test that a crawler writes every record from its single output loop."""
+
+    def test_khan_writes_records_in_input_order(self, fake_session, tmp_path, monkeypatch):
+        """Test crawler_khan output lines for fetched, failed and skipped URLs."""
+        import config
+        monkeypatch.setattr(config, "ensure_dir", lambda path: None, raising=False)
+        crawler_khan = importlib.import_module("crawler_khan")
+        monkeypatch.setattr(crawler_khan, "parse_khan",
+                            lambda url, html: parse(url, html.decode()))
+        monkeypatch.setattr(crawler_khan, "crawl", partial(crawl, delay=0, parse_workers=0))
+
+        urls = [
+            "https://www.khan.co.kr/article/1",
+            "https://www.khan.co.kr/article/2",
+            "https://www.hani.co.kr/arti/3.html",
+            "https://www.khan.co.kr/article/4",
+        ]
+        fake_session.latency = {urls[0]: 0.05}
+        fake_session.failing = {urls[1]}
+        inp = tmp_path / "urls.txt"
+        out = tmp_path / "out.jsonl"
+        inp.write_text("\n".join(urls) + "\n")
+
+        crawler_khan.main(str(inp), str(out))
+
+        records = [orjson.loads(line) for line in out.read_bytes().splitlines()]
+        assert records == [
+            {"url": urls[2], "error": "not_khan"},
+            {"url": urls[0], "body_text": f"<html>{urls[0]}</html>"},
+            {"url": urls[1], "error": f"500 for {urls[1]}"},
+            {"url": urls[3], "body_text": f"<html>{urls[3]}</html>"},
+        ]
@@ -3,10 +3,24 @@ Unit tests for crawler plugin system.
 """
 
 import pytest
+from pathlib import Path
 from crawlers.base import BaseCrawlerPlugin, CrawlerResult
 from crawlers.registry import CrawlerRegistry
 from crawlers.plugins.generic import GenericCrawler
 
+SAMPLE_HTML_DIR = Path(__file__).parent.parent.parent / "data" / "html_for_cralwer"
+
+# Share toasts, series indexes, recommended headlines and teaser cards seen
+# around the articles in SAMPLE_HTML_DIR
+SAMPLE_BOILERPLATE = [
+    "기사 URL이 복사되었습니다",
+    "목차별로 읽어보세요",
+    "당신이 관심 있을 만한 이슈",
+    "대장동 항소 포기",
+    "[인터뷰] 케멜마이어 교수",
+    "https://www.khan.co.kr/article/",
+]
+
 
 class TestBaseCrawlerPlugin:
     """Test base crawler plugin functionality."""
@@ -96,6 +110,25 @@ class TestBaseCrawlerPlugin:
         assert crawler.can_handle("not-a-url") is False
         assert crawler.can_handle("") is False
 
+    def test_can_handle_matches_on_label_boundary(self):
+        """Test that only the domain itself or its subdomains match."""
+        class TestCrawler(BaseCrawlerPlugin):
+            name = "test"
+            domains = ["example.com"]
+
+            def parse(self, url, html):
+                pass
+
+        crawler = TestCrawler()
+
+        assert crawler.can_handle("https://notexample.com/article") is False
+        assert crawler.can_handle("https://news.example.com:8080/article") is True
+
+        # Replacing the domain list (as the registry does) takes effect
+        crawler.domains = ["other.com"]
+        assert crawler.can_handle("https://example.com/article") is False
+        assert crawler.can_handle("https://other.com/article") is True
+
 
 class TestGenericCrawler:
     """Test generic fallback crawler."""
@@ -158,6 +191,45 @@ class TestGenericCrawler:
         # Should not include ads/scripts
         assert "alert" not in result.body_text
 
+    def test_generic_crawler_cnr_picks_text_dense_block(self):
+        """Test that CNR extraction selects the article block over link lists."""
+        crawler = GenericCrawler()
+
+        paragraph = "<p>This sentence is part of the main article body text.</p>"
+        links = "".join(f'<li><a href="/n{i}">Other headline number {i}</a></li>' for i in range(30))
+        html = f"""
+        <html>
+            <head><title>CNR Article</title></head>
+            <body>
+                <div class="menu"><ul>{links}</ul></div>
+                <div class="story">{paragraph * 8}</div>
+            </body>
+        </html>
+        """
+
+        result = crawler.parse("https://test.com", html)
+
+        assert result.metadata['parser_used'] == 'cnr'
+        assert "main article body text" in result.body_text
+        assert "Other headline" not in result.body_text
+
+    @pytest.mark.parametrize("page, body_text", [
+        ("*깃발*.html", "우리가 우리 나라를 자랑스러워한다는 것을"),
+        ("*한국일보.html", "의약품 효능과 안정성을 검증하는"),
+        ("*한겨레.html", "아침 7시까지 배송을 끝내야"),
+    ])
+    def test_generic_crawler_cnr_drops_recommendations(self, page, body_text):
+        """Test that CNR output on the sample pages has no link lists or teasers."""
+        crawler = GenericCrawler()
+        html_file = next(SAMPLE_HTML_DIR.glob(page))
+
+        result = crawler.parse("https://test.com/article", html_file.read_text(encoding="utf-8"))
+
+        assert result.metadata['parser_used'] == 'cnr'
+        assert body_text in result.body_text
+        for text in SAMPLE_BOILERPLATE:
+            assert text not in result.body_text
+
     def test_generic_crawler_date_extraction(self):
         """Test date extraction from HTML."""
         crawler = GenericCrawler()
@@ -233,6 +305,23 @@ class TestCrawlerRegistry:
 
         assert plugin is not None
 
+    def test_get_plugin_for_url_uses_domain_index(self):
+        """Test that subdomains route to a domain plugin over the wildcard fallback."""
+        class SiteCrawler(BaseCrawlerPlugin):
+            name = "site"
+            domains = ["www.example.com"]
+
+            def parse(self, url, html):
+                return CrawlerResult(headline="", body_text="")
+
+        registry = CrawlerRegistry()
+        registry._plugins["site"] = SiteCrawler()
+        registry._index_plugins()
+
+        assert registry.get_plugin_for_url("https://news.example.com/a").name == "site"
+        assert registry.get_plugin_for_url("https://www.example.com/a").name == "site"
+        assert registry.get_plugin_for_url("https://notexample.com/a").name == "generic"
+
     def test_parse_with_registry(self, mock_article_html):
         """Test parsing article using registry."""
         registry = CrawlerRegistry()
@@ -248,6 +337,22 @@ class TestCrawlerRegistry:
         assert result.headline is not None
         assert result.body_text is not None
 
+    def test_parse_many_preserves_input_order(self, mock_article_html):
+        """Test that parse_many returns one result per item, in input order."""
+        registry = CrawlerRegistry()
+
+        other_html = "<html><head><title>Other</title></head><body></body></html>"
+        items = [
+            ("https://test.com/1", mock_article_html),
+            ("https://test.com/2", other_html),
+            ("https://test.com/3", mock_article_html),
+        ]
+
+        results = registry.parse_many(items, max_workers=3)
+        expected = [registry.get_plugin_for_url(url).parse(url, html) for url, html in items]
+
+        assert results == expected
+
     def test_list_plugins_structure(self):
         """Test that list_plugins returns correct structure."""
         registry = CrawlerRegistry()
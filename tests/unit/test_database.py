@@ -2,14 +2,26 @@
 Unit tests for database models and repository.
 """
 
+import sqlite3
+import time
+from unittest.mock import Mock
+
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import func, select
 from database import (
     RequestLog, AnalysisResult, ProviderMetric, FeatureFlag,
-    AnalyticsRepository, init_database, session_scope
+    AnalyticsRepository, AnalyticsLogBuffer, init_database, session_scope
 )
 
 
+def count_rows(model, **filters) -> int:
+    """Count rows of a model matching the given column values."""
+    stmt = select(func.count()).select_from(model).filter_by(**filters)
+    with session_scope() as session:
+        return session.execute(stmt).scalar_one()
+
+
 class TestDatabaseModels:
     """Test database model creation and operations."""
 
@@ -42,6 +54,7 @@ class TestDatabaseModels:
             assert retrieved is not None
             assert retrieved.url == "https://test.com/article"
             assert retrieved.mode == "consensus"
+            assert retrieved.providers == ["gemini", "mistral"]
             assert retrieved.status == "success"
             assert retrieved.duration_ms == 1500
 
@@ -358,3 +371,235 @@ class TestAnalyticsRepository:
             ).first()
 
             assert retrieved is None
+
+
+class TestAnalyticsLogBuffer:
+    """Test batched request/analysis log writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, isolated_database):
+        """Use an empty database for each test."""
+        self.buffers = []
+        yield
+        for buffer in self.buffers:
+            buffer.flush()  # also cancels a pending timer
+
+    def make_buffer(self, batch_size=100, flush_interval=60.0):
+        buffer = AnalyticsLogBuffer(batch_size=batch_size, flush_interval=flush_interval)
+        self.buffers.append(buffer)
+        return buffer
+
+    @staticmethod
+    def log_request(buffer, correlation_id):
+        buffer.log_request(
+            correlation_id=correlation_id,
+            url="https://test.com/article",
+            mode="single",
+            providers=["gemini"],
+            status="success",
+            duration_ms=100
+        )
+
+    def test_flush_at_batch_size(self):
+        """Test that queuing batch_size rows writes them without an explicit flush."""
+        buffer = self.make_buffer(batch_size=3)
+
+        self.log_request(buffer, "batch_1")
+        self.log_request(buffer, "batch_2")
+        assert count_rows(RequestLog) == 0
+
+        self.log_request(buffer, "batch_3")
+        assert count_rows(RequestLog) == 3
+
+    def test_flush_from_timer(self):
+        """Test that a queued row is written flush_interval seconds later."""
+        buffer = self.make_buffer(flush_interval=0.05)
+
+        self.log_request(buffer, "timer_1")
+
+        deadline = time.time() + 5
+        while count_rows(RequestLog) == 0 and time.time() < deadline:
+            time.sleep(0.02)
+
+        assert count_rows(RequestLog, correlation_id="timer_1") == 1
+
+    def test_explicit_flush(self):
+        """Test that flush() writes queued requests and analysis results."""
+        buffer = self.make_buffer()
+
+        self.log_request(buffer, "explicit_1")
+        buffer.log_analysis_result(
+            correlation_id="explicit_1",
+            provider="gemini",
+            sentence_count=2,
+            latency_ms=1500
+        )
+        assert count_rows(RequestLog) == 0
+
+        assert buffer.flush() == 2
+        assert count_rows(RequestLog, correlation_id="explicit_1") == 1
+        assert count_rows(AnalysisResult, correlation_id="explicit_1") == 1
+        assert buffer.flush() == 0
+
+    def test_duplicate_correlation_id_is_skipped(self):
+        """Test that a duplicate request row is skipped without losing the batch."""
+        buffer = self.make_buffer()
+        self.log_request(buffer, "dup")
+        buffer.flush()
+
+        self.log_request(buffer, "dup")
+        self.log_request(buffer, "unique")
+        buffer.log_analysis_result(correlation_id="unique", provider="gemini", sentence_count=1)
+
+        # The skipped duplicate is not counted as written
+        assert buffer.flush() == 2
+        assert count_rows(RequestLog, correlation_id="dup") == 1
+        assert count_rows(RequestLog, correlation_id="unique") == 1
+        assert count_rows(AnalysisResult, correlation_id="unique") == 1
+
+    def test_failing_row_is_dropped_alone(self):
+        """Test that the row-by-row fallback drops only the row that fails."""
+        buffer = self.make_buffer()
+        self.log_request(buffer, "fallback")
+        buffer.log_analysis_result(correlation_id="fallback", provider="gemini", sentence_count=1)
+        # provider is NOT NULL, so this row fails the batch insert
+        buffer.log_analysis_result(correlation_id="fallback", provider=None, sentence_count=1)
+        buffer.log_analysis_result(correlation_id="fallback", provider="mistral", sentence_count=1)
+
+        assert buffer.flush() == 3
+        assert count_rows(RequestLog, correlation_id="fallback") == 1
+        assert count_rows(AnalysisResult, correlation_id="fallback") == 2
+        assert count_rows(AnalysisResult, provider="mistral") == 1
+
+
+# Schema written by the models before timestamps were stored as epoch ms
+BASELINE_SCHEMA = """
+CREATE TABLE request_log (
+    id INTEGER NOT NULL PRIMARY KEY,
+    correlation_id VARCHAR(50) NOT NULL,
+    url TEXT NOT NULL,
+    mode VARCHAR(20) NOT NULL,
+    providers TEXT,
+    timestamp DATETIME NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    duration_ms INTEGER,
+    error_message TEXT,
+    error_type VARCHAR(100)
+);
+CREATE UNIQUE INDEX ix_request_log_correlation_id ON request_log (correlation_id);
+CREATE INDEX idx_request_timestamp ON request_log (timestamp);
+CREATE INDEX idx_request_status ON request_log (status);
+
+CREATE TABLE analysis_results (
+    id INTEGER NOT NULL PRIMARY KEY,
+    correlation_id VARCHAR(50) NOT NULL REFERENCES request_log (correlation_id),
+    provider VARCHAR(50) NOT NULL,
+    sentence_count INTEGER,
+    model_name VARCHAR(100),
+    success BOOLEAN NOT NULL,
+    error_type VARCHAR(100),
+    error_message TEXT,
+    latency_ms INTEGER,
+    timestamp DATETIME NOT NULL
+);
+CREATE INDEX idx_analysis_provider ON analysis_results (provider);
+CREATE INDEX idx_analysis_timestamp ON analysis_results (timestamp);
+
+CREATE TABLE provider_metrics (
+    id INTEGER NOT NULL PRIMARY KEY,
+    provider VARCHAR(50) NOT NULL,
+    hour_bucket DATETIME NOT NULL,
+    total_requests INTEGER,
+    successful_requests INTEGER,
+    failed_requests INTEGER,
+    avg_latency_ms FLOAT,
+    error_types TEXT,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE UNIQUE INDEX idx_provider_metrics_unique ON provider_metrics (provider, hour_bucket);
+CREATE INDEX idx_provider_metrics_hour ON provider_metrics (hour_bucket);
+
+INSERT INTO request_log (correlation_id, url, mode, providers, timestamp, status, duration_ms)
+VALUES ('legacy_1', 'https://test.com/article', 'single', '["gemini"]',
+        '2024-01-01 00:00:00.000000', 'success', 1200);
+INSERT INTO analysis_results (correlation_id, provider, sentence_count, success, latency_ms, timestamp)
+VALUES ('legacy_1', 'gemini', 3, 1, 1100, '2024-01-01 00:00:01.500000');
+INSERT INTO provider_metrics (provider, hour_bucket, total_requests, successful_requests,
+                              failed_requests, created_at, updated_at)
+VALUES ('gemini', '2024-01-01 00:00:00.000000', 1, 1, 0,
+        '2024-01-01 00:00:00.000000', '2024-01-01 00:00:00.000000');
+"""
+
+# 2024-01-01T00:00:00Z
+BASELINE_EPOCH_MS = 1704067200000
+
+
+class TestEpochMsMigration:
+    """Test migrating a database created before the epoch-ms columns."""
+
+    @pytest.fixture
+    def legacy_database(self, temp_database, monkeypatch):
+        """Temporary database holding the baseline schema and one row per table."""
+        from config import settings
+        from database import init_db
+
+        with sqlite3.connect(temp_database) as conn:
+            conn.executescript(BASELINE_SCHEMA)
+        conn.close()
+
+        monkeypatch.setattr(settings.database, 'path', temp_database)
+        monkeypatch.setattr(init_db, '_engine', None)
+        monkeypatch.setattr(init_db, '_SessionFactory', None)
+
+        yield temp_database
+
+        init_db.get_engine().dispose()
+
+    @staticmethod
+    def read_rows(db_path):
+        """All migrated rows, keyed by table name."""
+        with sqlite3.connect(db_path) as conn:
+            rows = {
+                'request_log': conn.execute(
+                    "SELECT correlation_id, timestamp_ms, duration_ms FROM request_log"
+                ).fetchall(),
+                'analysis_results': conn.execute(
+                    "SELECT correlation_id, provider, timestamp_ms FROM analysis_results"
+                ).fetchall(),
+                'provider_metrics': conn.execute(
+                    "SELECT provider, hour_bucket_ms, total_requests FROM provider_metrics"
+                ).fetchall(),
+            }
+        conn.close()
+        return rows
+
+    def test_init_database_backfills_epoch_ms(self, legacy_database):
+        """Test that init_database converts the DateTime columns to UTC epoch ms."""
+        init_database()
+
+        assert self.read_rows(legacy_database) == {
+            'request_log': [('legacy_1', BASELINE_EPOCH_MS, 1200)],
+            'analysis_results': [('legacy_1', 'gemini', BASELINE_EPOCH_MS + 1500)],
+            'provider_metrics': [('gemini', BASELINE_EPOCH_MS, 1)],
+        }
+
+        # Old rows are readable through the models
+        with session_scope() as session:
+            repo = AnalyticsRepository(session)
+            assert [log.correlation_id for log in repo.get_request_history()] == ['legacy_1']
+            assert len(repo.get_analyses_by_correlation_id('legacy_1')) == 1
+
+    def test_second_init_database_does_nothing(self, legacy_database, monkeypatch):
+        """Test that running init_database on a migrated database leaves it unchanged."""
+        from database import init_db
+
+        init_database()
+        migrated = self.read_rows(legacy_database)
+
+        logger = Mock()
+        monkeypatch.setattr(init_db, 'logger', logger)
+        init_database()
+
+        assert self.read_rows(legacy_database) == migrated
+        logger.warning.assert_not_called()
@@ -2,8 +2,12 @@
 Unit tests for feature flags service.
 """
 
+import json
+import sqlite3
+
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import Mock
 from services import FeatureFlagsService
 from database import init_database
 
@@ -165,3 +169,40 @@ class TestFeatureFlagsService:
         assert retrieved == complex_config
         assert retrieved['providers'] == ['gemini', 'mistral']
         assert retrieved['thresholds']['min_consensus'] == 0.7
+
+
+class TestFeatureFlagsCache:
+    """Test the flag cache and stored configs against an isolated database."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, isolated_database):
+        """Fresh database and a service whose cache does not expire during a test."""
+        self.db_path = isolated_database
+        self.service = FeatureFlagsService(cache_duration=3600)
+
+    def test_set_flag_updates_cache_without_reload(self, monkeypatch):
+        """Test that set_flag is visible through a warm cache without reloading."""
+        assert self.service.is_enabled('llm_params') is False  # loads the cache
+
+        # Any further database load would fail the test
+        monkeypatch.setattr(self.service, '_load_flags_from_db', Mock(side_effect=AssertionError))
+
+        assert self.service.set_flag('llm_params', True, config={'temperature': 0.3})
+
+        assert self.service.is_enabled('llm_params') is True
+        assert self.service.get_config('llm_params') == {'temperature': 0.3}
+        assert self.service.is_enabled('cache_enabled') is True  # other flags kept
+
+    def test_text_encoded_config_loads_as_dict(self):
+        """Test that a config row written as JSON text by the old Text column loads as a dict."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO feature_flags (flag_name, enabled, config, created_at, updated_at) "
+                "VALUES (?, 1, ?, ?, ?)",
+                ('strict_consensus', json.dumps({'min_providers': 3}),
+                 '2024-01-01 00:00:00.000000', '2024-01-01 00:00:00.000000')
+            )
+        conn.close()
+
+        assert self.service.get_config('strict_consensus') == {'min_providers': 3}
+        assert self.service.is_enabled('strict_consensus') is True
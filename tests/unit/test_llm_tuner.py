@@ -0,0 +1,197 @@
+"""
+Unit tests for the OpenAI Batch API path of the LLM tuner.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+
+import orjson
+import pytest
+
+VALID_ANALYSIS = {
+    "claims": [],
+    "fallacies": [],
+    "quality_scores": {},
+    "highlight_spans": [],
+    "study_tips": []
+}
+
+
+@pytest.fixture
+def llm_tuner(monkeypatch, tmp_path):
+    """
+    Import llm_tuner with test settings.
+
+    The script reads its OpenAI settings from config and builds a client at
+    import time; the SDK is replaced with a placeholder when it is not
+    installed, since every test swaps the client out anyway.
+    """
+    import config
+    for name, value in {
+        'OPENAI_API_KEY': 'test-key',
+        'OPENAI_BASE_URL': None,
+        'OPENAI_MODEL': 'gpt-test',
+        'REQUEST_TIMEOUT': 30,
+        'MAX_RETRIES': 0,
+        'ensure_dir': lambda path: None,
+    }.items():
+        monkeypatch.setattr(config, name, value, raising=False)
+
+    if importlib.util.find_spec('openai') is None:
+        openai = types.ModuleType('openai')
+        openai.OpenAI = lambda **kwargs: None
+        openai.RateLimitError = type('RateLimitError', (Exception,), {})
+        monkeypatch.setitem(sys.modules, 'openai', openai)
+    if importlib.util.find_spec('pandas') is None:
+        monkeypatch.setitem(sys.modules, 'pandas', types.ModuleType('pandas'))
+
+    monkeypatch.delitem(sys.modules, 'llm_tuner', raising=False)
+    module = importlib.import_module('llm_tuner')
+    monkeypatch.setattr(module, 'BATCH_INPUT', tmp_path / 'batch_input.jsonl')
+    yield module
+    sys.modules.pop('llm_tuner', None)
+
+
+class FakeBatchClient:
+    """OpenAI client stub for files.* and batches.* calls."""
+
+    def __init__(self, output_lines, statuses):
+        self.uploaded = None
+        self.output = b"".join(orjson.dumps(line) + b"\n" for line in output_lines)
+        self.statuses = list(statuses)
+        self.retrieved = 0
+        self.files = types.SimpleNamespace(create=self._upload, content=self._download)
+        self.batches = types.SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _upload(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = [orjson.loads(line) for line in file.read().splitlines()]
+        return types.SimpleNamespace(id="file-in")
+
+    def _download(self, file_id):
+        assert file_id == "file-out"
+        return types.SimpleNamespace(content=self.output)
+
+    def _batch(self, status):
+        done = status == "completed"
+        return types.SimpleNamespace(id="batch-1", status=status,
+                                     output_file_id="file-out" if done else None)
+
+    def _create(self, input_file_id, endpoint, completion_window):
+        assert input_file_id == "file-in"
+        return self._batch("validating")
+
+    def _retrieve(self, batch_id):
+        self.retrieved += 1
+        return self._batch(self.statuses.pop(0))
+
+
+def ok_line(custom_id, data=VALID_ANALYSIS):
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": orjson.dumps(data).decode()}}]
+        }},
+        "error": None
+    }
+
+
+class TestRunBatch:
+    """Test run_batch() end to end against a stubbed Batch API."""
+
+    @pytest.fixture
+    def rows(self):
+        return [
+            {"url": f"https://news.example.com/{i}", "headline": f"기사 {i}",
+             "date": "2024-01-01", "body_text": "본문 " * 10}
+            for i in range(6)
+        ]
+
+    @pytest.fixture
+    def run(self, llm_tuner, monkeypatch, tmp_path):
+        """Run run_batch with a given client; returns written records, log calls and sleeps."""
+        logged = []
+        sleeps = []
+        monkeypatch.setattr(llm_tuner, '_log_result',
+                            lambda log_path, rec, ok, tries, err_msg="": logged.append(
+                                (rec["url"], ok, err_msg)))
+        monkeypatch.setattr(llm_tuner, 'time', types.SimpleNamespace(sleep=sleeps.append))
+
+        def run_batch(client, rows):
+            monkeypatch.setattr(llm_tuner, 'client', client)
+            out = tmp_path / "out.jsonl"
+            with open(out, "wb") as out_f:
+                llm_tuner.run_batch(rows, out_f, "system prompt", tmp_path / "log.csv")
+            written = [orjson.loads(line) for line in out.read_bytes().splitlines()]
+            return written, logged, sleeps
+
+        return run_batch
+
+    def test_input_lines_are_keyed_by_row_index(self, run, rows):
+        """Test the uploaded JSONL: one chat completion request per row, custom_id = index."""
+        client = FakeBatchClient([ok_line(str(i)) for i in range(len(rows))], ["completed"])
+
+        run(client, rows)
+
+        assert [line["custom_id"] for line in client.uploaded] == [str(i) for i in range(len(rows))]
+        for line, rec in zip(client.uploaded, rows):
+            assert line["method"] == "POST"
+            assert line["url"] == "/v1/chat/completions"
+            assert line["body"]["model"] == "gpt-test"
+            assert line["body"]["messages"][0] == {"role": "system", "content": "system prompt"}
+            assert rec["url"] in line["body"]["messages"][1]["content"]
+
+    def test_polls_with_backoff_until_done(self, run, rows):
+        """Test that the batch is polled until a final status, doubling the wait."""
+        client = FakeBatchClient([ok_line(str(i)) for i in range(len(rows))],
+                                 ["in_progress", "in_progress", "finalizing", "completed"])
+
+        written, _, sleeps = run(client, rows)
+
+        assert client.retrieved == 4
+        assert sleeps == [5, 10, 20, 40]
+        assert len(written) == len(rows)
+
+    def test_merges_results_in_input_order(self, run, rows):
+        """Test that good rows are written in input order and the rest are logged as failures."""
+        output = [
+            ok_line("5"),
+            {"custom_id": "1", "response": None, "error": {"message": "server error"}},
+            ok_line("0"),
+            {"custom_id": "2", "response": {"status_code": 429, "body": {"error": "rate limited"}},
+             "error": None},
+            ok_line("4", data={"claims": []}),  # fails SCHEMA
+            # row 3 has no result line
+        ]
+        client = FakeBatchClient(output, ["completed"])
+
+        written, logged, _ = run(client, rows)
+
+        assert [rec["url"] for rec in written] == [rows[0]["url"], rows[5]["url"]]
+        assert written[0]["llm_analysis"] == VALID_ANALYSIS
+        assert written[0]["headline"] == rows[0]["headline"]
+
+        assert [(url, ok) for url, ok, _ in logged] == [
+            (rows[0]["url"], True),
+            (rows[1]["url"], False),
+            (rows[2]["url"], False),
+            (rows[3]["url"], False),
+            (rows[4]["url"], False),
+            (rows[5]["url"], True),
+        ]
+        errors = {url: err for url, ok, err in logged if not ok}
+        assert "server error" in errors[rows[1]["url"]]
+        assert "rate limited" in errors[rows[2]["url"]]
+        assert "no result in batch batch-1" in errors[rows[3]["url"]]
+
+    def test_failed_batch_logs_every_row(self, run, rows):
+        """Test that a batch without an output file logs all rows as failed."""
+        client = FakeBatchClient([], ["failed"])
+
+        written, logged, _ = run(client, rows)
+
+        assert written == []
+        assert [ok for _, ok, _ in logged] == [False] * len(rows)
+        assert all("(failed)" in err for _, _, err in logged)
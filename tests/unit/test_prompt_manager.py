@@ -2,6 +2,8 @@
 Unit tests for prompt manager and experimentation framework.
 """
 
+import os
+
 import pytest
 from pathlib import Path
 from llm.prompts.prompt_manager import PromptManager, PromptTemplate, PromptExperiment
@@ -216,3 +218,136 @@ class TestPromptManager:
             assert config.name == exp_name
             assert hasattr(config, 'active')
             assert hasattr(config, 'variants')
+
+
+class TestPromptManagerReload:
+    """Test reload() and the render cache against files in a temporary directory."""
+
+    EXPERIMENTS = (
+        "experiments:\n"
+        "  - name: greeting_test\n"
+        "    active: true\n"
+        "    control_variant: v1\n"
+        "    variants:\n"
+        "      - name: v1\n"
+        "        weight: 1\n"
+    )
+
+    @pytest.fixture
+    def prompt_files(self, tmp_path):
+        """One template and one experiment on disk."""
+        prompts_dir = tmp_path / "templates"
+        prompts_dir.mkdir()
+        (prompts_dir / "greeting_v1.txt").write_text("Hello {who}", encoding="utf-8")
+        experiments_file = tmp_path / "experiments.yaml"
+        experiments_file.write_text(self.EXPERIMENTS, encoding="utf-8")
+        return prompts_dir, experiments_file
+
+    @pytest.fixture
+    def manager(self, prompt_files):
+        prompts_dir, experiments_file = prompt_files
+        return PromptManager(prompts_dir=prompts_dir, experiments_file=experiments_file)
+
+    @pytest.fixture
+    def yaml_loads(self, monkeypatch):
+        """Count experiments file parses."""
+        from llm.prompts import prompt_manager
+
+        calls = []
+        real_load = prompt_manager.yaml.load
+
+        def counting_load(*args, **kwargs):
+            calls.append(args)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(prompt_manager.yaml, "load", counting_load)
+        return calls
+
+    @staticmethod
+    def touch_later(path, text):
+        """Rewrite a file and move its mtime forward so the change is seen."""
+        stat = path.stat()
+        path.write_text(text, encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_reload_skips_unchanged_experiments_file(self, manager, yaml_loads):
+        """Test that reload() does not re-parse an unchanged experiments file."""
+        experiment = manager._experiments["greeting_test"]
+
+        manager.reload()
+
+        assert yaml_loads == []
+        assert manager._experiments["greeting_test"] is experiment
+
+    def test_reload_picks_up_changed_experiments_file(self, manager, prompt_files, yaml_loads):
+        """Test that reload() re-parses the experiments file after it changes."""
+        _, experiments_file = prompt_files
+        self.touch_later(experiments_file, self.EXPERIMENTS.replace("active: true", "active: false"))
+
+        manager.reload()
+
+        assert len(yaml_loads) == 1
+        assert manager._experiments["greeting_test"].active is False
+
+    def test_reload_clears_render_cache(self, manager, prompt_files):
+        """Test that a template edited on disk is rendered fresh after reload()."""
+        prompts_dir, _ = prompt_files
+        assert manager.get_prompt("greeting", who="world") == "Hello world"
+        assert manager._render_cached.cache_info().currsize == 1
+
+        (prompts_dir / "greeting_v1.txt").write_text("Goodbye {who}", encoding="utf-8")
+        assert manager.get_prompt("greeting", who="world") == "Hello world"
+
+        manager.reload()
+
+        assert manager._render_cached.cache_info().currsize == 0
+        assert manager.get_prompt("greeting", who="world") == "Goodbye world"
+
+    def test_repeated_prompt_is_served_from_cache(self, manager):
+        """Test that identical arguments render once."""
+        manager.get_prompt("greeting", who="world")
+        manager.get_prompt("greeting", who="world")
+
+        info = manager._render_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_unhashable_kwargs_fall_back_to_render(self, manager):
+        """Test that unhashable variable values bypass the cache."""
+        prompt = manager.get_prompt("greeting", who=["a", "b"])
+
+        assert prompt == "Hello ['a', 'b']"
+        assert manager._render_cached.cache_info().currsize == 0
+
+
+class TestVariantWeights:
+    """Test weighted variant selection edge cases."""
+
+    def test_zero_weight_variant_is_never_selected(self):
+        """Test that a zero-weight variant is skipped."""
+        experiment = PromptExperiment(
+            name="weights",
+            variants=[{"name": "off", "weight": 0}, {"name": "on", "weight": 1}],
+            traffic_percentage=100
+        )
+
+        assert {experiment.select_variant() for _ in range(200)} == {"on"}
+
+    def test_single_weight_one_variant_is_always_selected(self):
+        """Test that a lone variant with weight 1 always wins."""
+        experiment = PromptExperiment(
+            name="weights",
+            variants=[{"name": "only", "weight": 1}],
+            traffic_percentage=100
+        )
+
+        assert {experiment.select_variant() for _ in range(50)} == {"only"}
+
+    def test_all_zero_weights_fall_back_to_first_variant(self):
+        """Test that zero total weight selects the first variant."""
+        experiment = PromptExperiment(
+            name="weights",
+            variants=[{"name": "first", "weight": 0}, {"name": "second", "weight": 0}],
+            traffic_percentage=100
+        )
+
+        assert experiment.select_variant() == "first"
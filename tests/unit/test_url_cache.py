@@ -0,0 +1,165 @@
+"""
+Unit tests for the crawler URL cache and the Hankyoreh incremental crawl.
+"""
+
+import importlib
+
+import pytest
+from unittest.mock import Mock
+
+from url_cache import URLCache, body_digest
+
+URL = "https://www.hani.co.kr/arti/society/1.html"
+HTML = "<html><body>기사 본문</body></html>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty URL cache in a temporary file."""
+    cache = URLCache(str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def crawler_hani(monkeypatch):
+    """Import crawler_hani (the crawler scripts expect config.ensure_dir)."""
+    import config
+    monkeypatch.setattr(config, "ensure_dir", lambda path: None, raising=False)
+    module = importlib.import_module("crawler_hani")
+    monkeypatch.setattr(module.time, "sleep", lambda seconds: None)
+    return module
+
+
+def make_response(status_code=200, text=HTML, etag='"v2"', last_modified=None):
+    """Fake requests.Response."""
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.content = text.encode("utf-8")
+    response.headers = {"ETag": etag, "Last-Modified": last_modified}
+    return response
+
+
+class TestURLCache:
+    """Test the on-disk URL cache."""
+
+    def test_conditional_headers_for_new_url(self, cache):
+        """Test that an unknown URL gets no validators."""
+        headers = cache.conditional_headers(URL, {"User-Agent": "test"})
+        assert headers == {"User-Agent": "test"}
+
+    def test_conditional_headers_after_update(self, cache):
+        """Test that stored validators become If-None-Match / If-Modified-Since."""
+        base = {"User-Agent": "test"}
+        cache.update(URL, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", body_digest(b"old"))
+
+        headers = cache.conditional_headers(URL, base)
+
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert "If-None-Match" not in base
+
+    def test_is_changed(self, cache):
+        """Test digest comparison against the previous crawl."""
+        digest = body_digest(b"body")
+        assert cache.is_changed(URL, digest) is True
+
+        cache.update(URL, None, None, digest)
+
+        assert cache.is_changed(URL, digest) is False
+        assert cache.is_changed(URL, body_digest(b"edited body")) is True
+
+
+class TestFetchIfChanged:
+    """Test the conditional fetch used by crawler_hani."""
+
+    def test_sends_conditional_headers(self, crawler_hani, cache, monkeypatch):
+        """Test that cached validators are sent with the request."""
+        cache.update(URL, '"v1"', None, body_digest(b"old"))
+        get = Mock(return_value=make_response())
+        monkeypatch.setattr(crawler_hani.requests, "get", get)
+
+        crawler_hani.fetch_if_changed(URL, cache)
+
+        headers = get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["User-Agent"] == crawler_hani.HEADERS["User-Agent"]
+
+    def test_not_modified_is_skipped(self, crawler_hani, cache, monkeypatch):
+        """Test that a 304 response returns None and leaves the cache alone."""
+        cache.update(URL, '"v1"', None, body_digest(b"old"))
+        monkeypatch.setattr(crawler_hani.requests, "get",
+                            Mock(return_value=make_response(status_code=304, text="")))
+
+        assert crawler_hani.fetch_if_changed(URL, cache) is None
+        assert cache.get(URL)["etag"] == '"v1"'
+
+    def test_unchanged_body_is_skipped(self, crawler_hani, cache, monkeypatch):
+        """Test that a byte-identical body returns None and refreshes the validators."""
+        cache.update(URL, '"v1"', None, body_digest(HTML.encode("utf-8")))
+        monkeypatch.setattr(crawler_hani.requests, "get",
+                            Mock(return_value=make_response(etag='"v2"')))
+
+        assert crawler_hani.fetch_if_changed(URL, cache) is None
+        assert cache.get(URL)["etag"] == '"v2"'
+
+    def test_changed_body_is_returned_without_update(self, crawler_hani, cache, monkeypatch):
+        """Test that a changed body is returned and the cache is not updated yet."""
+        cache.update(URL, '"v1"', None, body_digest(b"old"))
+        monkeypatch.setattr(crawler_hani.requests, "get",
+                            Mock(return_value=make_response(etag='"v2"')))
+
+        html, validators = crawler_hani.fetch_if_changed(URL, cache)
+
+        assert html == HTML
+        assert validators == ('"v2"', None, body_digest(HTML.encode("utf-8")))
+        assert cache.get(URL)["etag"] == '"v1"'
+
+
+class TestHaniMainCache:
+    """Test that crawler_hani.main records a URL only once its record is written."""
+
+    @pytest.fixture
+    def run_main(self, crawler_hani, tmp_path, monkeypatch):
+        """Run main() over one URL, recording writes and cache updates in order."""
+        events = []
+
+        class RecordingFile:
+            def write(self, data):
+                events.append("write")
+
+            def close(self):
+                pass
+
+        class RecordingCache(URLCache):
+            def update(self, url, etag, last_modified, body_sha):
+                events.append("update")
+                super().update(url, etag, last_modified, body_sha)
+
+        inp = tmp_path / "urls.txt"
+        inp.write_text(URL + "\n")
+        monkeypatch.setattr(crawler_hani, "open", lambda *args, **kwargs: RecordingFile(),
+                            raising=False)
+        monkeypatch.setattr(crawler_hani, "URLCache", RecordingCache)
+        monkeypatch.setattr(crawler_hani.requests, "get", Mock(return_value=make_response()))
+
+        def run():
+            crawler_hani.main(str(inp), str(tmp_path / "out.jsonl"),
+                              str(tmp_path / "cache.sqlite3"))
+            return events
+
+        return run
+
+    def test_update_follows_write(self, crawler_hani, run_main, monkeypatch):
+        """Test that the cache is updated after the record is written."""
+        monkeypatch.setattr(crawler_hani, "parse_hani", lambda url, html: {"url": url})
+
+        assert run_main() == ["write", "update"]
+
+    def test_failed_parse_is_not_cached(self, crawler_hani, run_main, monkeypatch):
+        """Test that a URL whose parse fails is fetched again on the next run."""
+        monkeypatch.setattr(crawler_hani, "parse_hani", Mock(side_effect=ValueError("bad html")))
+
+        # Only the error record is written
+        assert run_main() == ["write"]